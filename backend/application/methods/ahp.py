@@ -156,6 +156,15 @@ class AHPMethod(MCDMMethodInterface):
     def execute(self, decision_matrix: DecisionMatrix,
                 parameters: Optional[Dict[str, Any]] = None) -> Result:
         try:
+            if decision_matrix is None:
+                raise MethodError("No decision matrix provided", self.name, code="no_decision_matrix")
+            if not isinstance(decision_matrix, DecisionMatrix):
+                raise MethodError(
+                    f"Expected a DecisionMatrix, got {type(decision_matrix).__name__}",
+                    self.name,
+                    code="invalid_decision_matrix"
+                )
+            
             params = self._prepare_execution(decision_matrix, parameters)
 
             alternatives = decision_matrix.alternative
@@ -213,12 +222,13 @@ class AHPMethod(MCDMMethodInterface):
             
             return result
         
-        except ValidationError as e:
-            raise e
+        except (ValidationError, MethodError):
+            raise
         except Exception as e:
             raise MethodError(
                 message=f"Error executing the AHP method: {str(e)}",
-                method_name=self.name
+                method_name=self.name,
+                code="execution_failed"
             ) from e
         
     def _calculate_criteria_weights(self, criteria, comparison_matrix,
@@ -245,13 +255,8 @@ class AHPMethod(MCDMMethodInterface):
             else:
                 weights = np.ones(n_criteria) / n_criteria
             
-            # Generate consistent comparsion matrix from weights
-            comparison_matrix = np.ones((n_criteria, n_criteria))
-            for i in range(n_criteria):
-                for j in range(n_criteria):
-                    if i != j and weights[j] > 0:
-                        comparison_matrix[i, j] = weights[i] / weights[j]
-            
+            # Weights taken as given form a perfectly consistent comparison matrix
+            # (a_ij = w_i / w_j), so there is no need to build it
 
             consistency_info = {
                 'consistency_index': 0.0,
@@ -316,20 +321,19 @@ class AHPMethod(MCDMMethodInterface):
                 alt_comparison = np.ones((n_alternatives, n_alternatives))
 
                 # Get normalized values for this criterion
-                criterion_values=values[:, j]
-
-                # Fill the matrix
-                for i in range(n_alternatives):
-                    for k in range(n_alternatives):
-                        if i != k:
-                            if criteria[j].is_benefit_criteria():
-                                if criterion_values[k] > 0:
-                                    alt_comparison[i, k] = criterion_values[i] / criterion_values[k]
-                            else:
-                                if criterion_values[i] > 0:
-                                    alt_comparison[i, k] = criterion_values[k] / criterion_values[i]
-
-                comparison_matrices.append(alt_comparison)           
+                criterion_values = values[:, j]
+                row_values = criterion_values[:, np.newaxis]
+                col_values = criterion_values[np.newaxis, :]
+
+                # Fill the matrix with value ratios in one pass; pairs whose
+                # denominator is not positive keep 1
+                if criteria[j].is_benefit_criteria():
+                    np.divide(row_values, col_values, out=alt_comparison, where=col_values > 0)
+                else:
+                    np.divide(col_values, row_values, out=alt_comparison, where=row_values > 0)
+                np.fill_diagonal(alt_comparison, 1.0)
+
+                comparison_matrices.append(alt_comparison)
                         
         # Process each criterion
         for j in range(n_criteria):
@@ -417,9 +421,7 @@ class AHPMethod(MCDMMethodInterface):
     
     def _approximate_weights(self, matrix: np.ndarray, size: int) -> np.ndarray:
         # Calculate geometric mean of each row
-        row_products = np.ones(size)
-        for i in range(size):
-            row_products[i] = np.prod(matrix[i, :]) ** (1.0 / size)
+        row_products = np.prod(matrix, axis=1) ** (1.0 / size)
         
         # Normalize to sum to 1
         weights = row_products / np.sum(row_products)
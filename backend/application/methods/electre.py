@@ -162,9 +162,10 @@ class ELECTREMethod(MCDMMethodInterface):
                     values, weights, n_alternatives, n_criteria, params
                 )
 
+                # Arrays stay native; Result.to_dict converts them when needed
                 metadata = {
-                    'outranking_matrix': outranking_matrix.tolist(),
-                    'dominance_matrix': dominance_matrix.tolist(),
+                    'outranking_matrix': outranking_matrix,
+                    'dominance_matrix': dominance_matrix,
                     'non_dominated_alternatives': list(non_dominated)
                 }
             
@@ -173,10 +174,10 @@ class ELECTREMethod(MCDMMethodInterface):
                     values, weights, alternatives, criteria, n_alternatives, n_criteria, params)
                 
                 metadata = {
-                    'credibility_matrix': credibility_matrix.tolist(),
-                    'ascending_distillation': distillation_ranks['ascending'].tolist(),
-                    'descending_distillation': distillation_ranks['descending'].tolist(),
-                    'net_flows': net_flows.tolist()
+                    'credibility_matrix': credibility_matrix,
+                    'ascending_distillation': distillation_ranks['ascending'],
+                    'descending_distillation': distillation_ranks['descending'],
+                    'net_flows': net_flows
                 }
                 
             else:
@@ -213,64 +214,72 @@ class ELECTREMethod(MCDMMethodInterface):
         concordance_threshold = params.get('concordance_threshold', 0.7)
         discordance_threshold = params.get('discordance_threshold', 0.3)
 
-        # Initialize matrices
-        concordance_matrix = np.zeros((n_alternatives, n_alternatives))
-        discordance_matrix = np.zeros((n_alternatives, n_alternatives))
-        outranking_matrix = np.zeros((n_alternatives, n_alternatives))
+        # Both kernels read the same half of the pairwise difference tensor
+        pair_differences = self._pair_differences(values)
+        concordance_matrix = self._calculate_concordance_matrix(values, weights, pair_differences)
+        discordance_matrix = self._calculate_discordance_matrix(values, pair_differences)
 
-        # Calculate concordance and discordance matrices
-        for i in range(n_alternatives):
-            for j in range(n_alternatives):
-                if i != j:
-                    # Calculate concordance set (indices where i is at least as good as j)
-                    concordance_indices = []
-                    for k in range(n_criteria):
-                        if values[i, k] >= values[j, k]:
-                            concordance_indices.append(k)
-
-                    if concordance_indices:
-                        concordance_matrix[i, j] = np.sum(weights[concordance_indices])
-
-                    discordance_indices = []
-                    for k in range(n_criteria):
-                        if values[i, k] < values[j, k]:
-                            discordance_indices.append(k)
-
-                    if discordance_indices:
-                        max_diff = np.max([values[j, k] - values[i, k] for k in discordance_indices])
-                        max_range = np.max(values[:, discordance_indices]) - np.min(values[:, discordance_indices])
-                        discordance_matrix[i, j] = max_diff / max_range if max_range > 0 else 0
-
-        # Determine outranking realtions
-        for i in range (n_alternatives):
-            for j in range(n_alternatives):
-                if i != j:
-                    # i outranks j if concordance >= threshold and discordance <= threshold
-                    if (concordance_matrix[i, j] >= concordance_threshold and 
-                        discordance_matrix[i, j] <= discordance_threshold):
-                        outranking_matrix[i, j] = 1
+        # i outranks j if concordance >= threshold and discordance <= threshold
+        outranking_matrix = ((concordance_matrix >= concordance_threshold) &
+                             (discordance_matrix <= discordance_threshold)).astype(float)
+        np.fill_diagonal(outranking_matrix, 0.0)
         
-        # Identify dominant and dominated alternatives
-        dominance_matrix = np.zeros((n_alternatives, n_alternatives))
-        for i in range(n_alternatives):
-            for j in range(n_alternatives):
-                if i != j:
-                    # i dominates j if i outranks j and j does not outrank i
-                    if outranking_matrix[i, j] == 1 and outranking_matrix[j, i] == 0:
-                        dominance_matrix[i, j] = 1
+        # i dominates j if i outranks j and j does not outrank i
+        dominance_matrix = ((outranking_matrix == 1) & (outranking_matrix.T == 0)).astype(float)
         
-        # Identify non-dominated alternatives (kernel)
-        dominated = set()
-        for j in range(n_alternatives):
-            for i in range(n_alternatives):
-                if dominance_matrix[i, j] == 1:
-                    dominated.add(j)
-                    break
-        
-        non_dominated = set(range(n_alternatives)) - dominated
+        # Identify non-dominated alternatives (kernel): columns nobody dominates
+        non_dominated = set(np.flatnonzero(~dominance_matrix.any(axis=0)).tolist())
 
         return outranking_matrix, dominance_matrix, non_dominated
     
+    def _pair_differences(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Indices (rows, cols) of every pair i < j and values[i] - values[j] for each
+        of them. The j, i direction is the same difference negated, so only half of
+        the pairwise difference tensor is ever materialized.
+        """
+        rows, cols = np.triu_indices(values.shape[0], k=1)
+        return rows, cols, values[rows] - values[cols]
+    
+    def _calculate_concordance_matrix(self, values: np.ndarray, weights: np.ndarray,
+                                      pair_differences: Optional[Tuple] = None) -> np.ndarray:
+        """
+        ELECTRE I concordance: C[i, j] is the total weight of the criteria on which
+        alternative i is at least as good as alternative j. The diagonal is zero.
+        """
+        rows, cols, diff = pair_differences or self._pair_differences(values)
+        
+        concordance_matrix = np.zeros((values.shape[0], values.shape[0]))
+        concordance_matrix[rows, cols] = np.where(diff >= 0, weights, 0.0).sum(axis=1)
+        concordance_matrix[cols, rows] = np.where(diff <= 0, weights, 0.0).sum(axis=1)
+        return concordance_matrix
+    
+    def _calculate_discordance_matrix(self, values: np.ndarray,
+                                      pair_differences: Optional[Tuple] = None) -> np.ndarray:
+        """
+        ELECTRE I discordance: D[i, j] is the largest amount by which j beats i,
+        divided by the value range spanned by the criteria on which j beats i.
+        It is zero when i is never worse than j, including on the diagonal.
+        """
+        rows, cols, diff = pair_differences or self._pair_differences(values)
+        col_max = values.max(axis=0)
+        col_min = values.min(axis=0)
+        
+        discordance_matrix = np.zeros((values.shape[0], values.shape[0]))
+        # For (i, j) the opponent beats i by values[j] - values[i] = -diff,
+        # for (j, i) by diff
+        for worse_idx, better_idx, margin in ((rows, cols, -diff), (cols, rows, diff)):
+            worse = margin > 0
+            max_diff = np.where(worse, margin, -np.inf).max(axis=1, initial=-np.inf)
+            
+            # Range over every alternative of the discordant criteria only
+            max_range = (np.where(worse, col_max, -np.inf).max(axis=1, initial=-np.inf)
+                         - np.where(worse, col_min, np.inf).min(axis=1, initial=np.inf))
+            
+            valid = worse.any(axis=1) & (max_range > 0)
+            discordance_matrix[worse_idx[valid], better_idx[valid]] = max_diff[valid] / max_range[valid]
+        return discordance_matrix
+    
     def _execute_electre_iii(self, values: np.ndarray, weights: np.ndarray,
                              alternatives: List[Any], criteria: List[Any],
                              n_alternatives: int, n_criteria: int,
@@ -280,86 +289,49 @@ class ELECTREMethod(MCDMMethodInterface):
         indifference_thresholds = self._get_thresholds(params.get('indifference_thresholds'), criteria, 0.1)
         veto_thresholds = self._get_thresholds(params.get('veto_thresholds'), criteria, 0.5)
         
-        # Initialize matrices
-        concordance_matrix = np.zeros((n_alternatives, n_alternatives))
-        credibility_matrix = np.zeros((n_alternatives, n_alternatives))
-        
-        # Calculate partial concordance indices by criterion
-        concordance_by_criteria = np.zeros((n_alternatives, n_alternatives, n_criteria))
-        
-        for i in range(n_alternatives):
-            for j in range(n_alternatives):
-                if i != j:  # Don't compare an alternative with itself
-                    for k in range(n_criteria):
-                        # Difference between alternatives for this criterion
-                        diff = values[i, k] - values[j, k]
-                        p_threshold = preference_thresholds[criteria[k].id]
-                        i_threshold = indifference_thresholds[criteria[k].id]
-                        
-                        # Calculate partial concordance index
-                        if diff >= p_threshold:
-                            # Strict preference: i is clearly better than j
-                            concordance_by_criteria[i, j, k] = 1.0
-                        elif diff <= -i_threshold:
-                            # No preference: j is clearly better than i
-                            concordance_by_criteria[i, j, k] = 0.0
-                        else:
-                            # Weak preference: intermediate zone with linear interpolation
-                            concordance_by_criteria[i, j, k] = (diff + i_threshold) / (p_threshold + i_threshold)
-        
-        # Calculate global concordance index
-        for i in range(n_alternatives):
-            for j in range(n_alternatives):
-                if i != j:
-                    # Weighted sum of partial concordance indices
-                    concordance_matrix[i, j] = np.sum(weights * concordance_by_criteria[i, j])
-        
-        # Calculate discordance indices by criterion
-        discordance_by_criteria = np.zeros((n_alternatives, n_alternatives, n_criteria))
-        
-        for i in range(n_alternatives):
-            for j in range(n_alternatives):
-                if i != j:
-                    for k in range(n_criteria):
-                        # Difference between alternatives for this criterion (from j to i)
-                        diff = values[j, k] - values[i, k]
-                        p_threshold = preference_thresholds[criteria[k].id]
-                        v_threshold = veto_thresholds[criteria[k].id]
-                        
-                        # Calculate discordance index
-                        if diff <= p_threshold:
-                            # No discordance: i is not significantly worse than j
-                            discordance_by_criteria[i, j, k] = 0.0
-                        elif diff >= v_threshold:
-                            # Complete veto: i is much worse than j in this criterion
-                            discordance_by_criteria[i, j, k] = 1.0
-                        else:
-                            # Partial discordance: linear interpolation
-                            discordance_by_criteria[i, j, k] = (diff - p_threshold) / (v_threshold - p_threshold)
-        
-        # Calculate credibility index
-        for i in range(n_alternatives):
-            for j in range(n_alternatives):
-                if i != j:
-                    # Initially equal to the concordance index
-                    credibility_matrix[i, j] = concordance_matrix[i, j]
-                    
-                    # Identify criteria with discordance
-                    discord_criteria = []
-                    for k in range(n_criteria):
-                        if discordance_by_criteria[i, j, k] > concordance_matrix[i, j]:
-                            discord_criteria.append(k)
-                    
-                    # Apply veto effect (reduce credibility due to strong discordance)
-                    if discord_criteria:
-                        for k in discord_criteria:
-                            disc_factor = (1 - discordance_by_criteria[i, j, k]) / (1 - concordance_matrix[i, j])
-                            credibility_matrix[i, j] *= disc_factor
+        p_thresholds = np.array([preference_thresholds[crit.id] for crit in criteria], dtype=float)
+        i_thresholds = np.array([indifference_thresholds[crit.id] for crit in criteria], dtype=float)
+        v_thresholds = np.array([veto_thresholds[crit.id] for crit in criteria], dtype=float)
+        
+        # diff[i, j, k] = values[i, k] - values[j, k]
+        diff = values[:, np.newaxis, :] - values[np.newaxis, :, :]
+        off_diagonal = ~np.eye(n_alternatives, dtype=bool)[:, :, np.newaxis]
+        
+        # The interpolation is evaluated everywhere but only kept in the
+        # intermediate zone, where its denominator is positive
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Partial concordance: 1 on strict preference of i, 0 when j is
+            # clearly better, linear interpolation in between
+            concordance_by_criteria = np.where(off_diagonal, np.select(
+                [diff >= p_thresholds, diff <= -i_thresholds],
+                [1.0, 0.0],
+                (diff + i_thresholds) / (p_thresholds + i_thresholds)
+            ), 0.0)
+            
+            # Partial discordance on the difference from j to i: 0 while i is not
+            # significantly worse, 1 from the veto threshold on, linear in between
+            discordance_by_criteria = np.where(off_diagonal, np.select(
+                [-diff <= p_thresholds, -diff >= v_thresholds],
+                [0.0, 1.0],
+                (-diff - p_thresholds) / (v_thresholds - p_thresholds)
+            ), 0.0)
+        
+        # Global concordance: weighted sum of the partial indices
+        concordance_matrix = np.einsum('ijk,k->ij', concordance_by_criteria, weights)
+        
+        # Credibility starts from the concordance; every criterion whose discordance
+        # exceeds it applies a veto factor (1 - d) / (1 - C). The factor is only
+        # used where d > C, so 1 - C is positive there
+        concordance = concordance_matrix[:, :, np.newaxis]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            veto_factors = np.where(discordance_by_criteria > concordance,
+                                    (1 - discordance_by_criteria) / (1 - concordance), 1.0)
+        credibility_matrix = concordance_matrix * veto_factors.prod(axis=2)
         
         # Perform descending and ascending distillation
         distillation_ranks = {
-            'descending': self._descending_distillation(credibility_matrix, n_alternatives),
-            'ascending': self._ascending_distillation(credibility_matrix, n_alternatives)
+            'descending': self._distill(credibility_matrix, descending=True),
+            'ascending': self._distill(credibility_matrix, descending=False)
         }
         
         # Calculate net flows (similar to PROMETHEE)
@@ -384,116 +356,46 @@ class ELECTREMethod(MCDMMethodInterface):
         
         return result
     
-    def _descending_distillation(self, credibility_matrix: np.ndarray, 
-                              n_alternatives: int) -> np.ndarray:
-        remaining = set(range(n_alternatives))
-        ranks = np.zeros(n_alternatives, dtype=int)
-        current_rank = 1
-        
-        while remaining:
-            if len(remaining) == 1:
-                # If only one alternative remains, assign it the next rank
-                last_alt = list(remaining)[0]
-                ranks[last_alt] = current_rank
-                break
-            
-            # Convert set to list for indexing
-            remaining_list = list(remaining)
-            
-            # Create submatrix with remaining alternatives
-            submatrix = np.zeros((len(remaining), len(remaining)))
-            for i, orig_i in enumerate(remaining_list):
-                for j, orig_j in enumerate(remaining_list):
-                    if orig_i != orig_j:
-                        submatrix[i, j] = credibility_matrix[orig_i, orig_j]
-            
-            # Calculate discrimination threshold
-            max_cred = np.max(submatrix)
-            min_cred = np.min(submatrix[submatrix > 0]) if np.any(submatrix > 0) else 0
-            threshold = max_cred - 0.15 * (max_cred - min_cred)
-            
-            # Calculate qualification for each alternative
-            qualification = np.zeros(len(remaining))
-            for i in range(len(remaining)):
-                # Count how many alternatives are outranked by i
-                strength = np.sum(submatrix[i, :] >= threshold)
-                # Count how many alternatives outrank i
-                weakness = np.sum(submatrix[:, i] >= threshold)
-                # Net qualification
-                qualification[i] = strength - weakness
-            
-            # Find the alternatives with highest qualification
-            max_qual = np.max(qualification)
-            best_alternatives = set()
-            for i, qual in enumerate(qualification):
-                if qual == max_qual:
-                    best_alternatives.add(remaining_list[i])
-            
-            # Assign rank to the best alternatives and remove them from the remaining set
-            for alt in best_alternatives:
-                ranks[alt] = current_rank
-                remaining.remove(alt)
-            
-            # Increment rank for the next iteration
-            current_rank += len(best_alternatives)
-        
-        return ranks
-    
-    
-    def _ascending_distillation(self, credibility_matrix: np.ndarray, 
-                             n_alternatives: int) -> np.ndarray:
-        
-        # Similar to descending distillation, but with inverse logic
-        remaining = set(range(n_alternatives))
+    def _distill(self, credibility_matrix: np.ndarray, descending: bool) -> np.ndarray:
+        """
+        Descending (best first) or ascending (worst first) distillation. Each step
+        keeps the remaining alternatives, qualifies them against a discrimination
+        threshold and peels off every alternative tied for the best (or worst)
+        qualification, which share the current rank.
+        """
+        n_alternatives = credibility_matrix.shape[0]
+        remaining = np.ones(n_alternatives, dtype=bool)
         ranks = np.zeros(n_alternatives, dtype=int)
-        current_rank = n_alternatives
+        current_rank = 1 if descending else n_alternatives
         
-        while remaining:
-            if len(remaining) == 1:
+        while remaining.any():
+            remaining_idx = np.flatnonzero(remaining)
+            if remaining_idx.size == 1:
                 # If only one alternative remains, assign it the next rank
-                last_alt = list(remaining)[0]
-                ranks[last_alt] = current_rank
+                ranks[remaining_idx[0]] = current_rank
                 break
             
-            # Convert set to list for indexing
-            remaining_list = list(remaining)
-            
-            # Create submatrix with remaining alternatives
-            submatrix = np.zeros((len(remaining), len(remaining)))
-            for i, orig_i in enumerate(remaining_list):
-                for j, orig_j in enumerate(remaining_list):
-                    if orig_i != orig_j:
-                        submatrix[i, j] = credibility_matrix[orig_i, orig_j]
+            # Submatrix of the remaining alternatives, without self-comparisons
+            submatrix = credibility_matrix[np.ix_(remaining_idx, remaining_idx)]
+            np.fill_diagonal(submatrix, 0.0)
             
             # Calculate discrimination threshold
-            max_cred = np.max(submatrix)
-            min_cred = np.min(submatrix[submatrix > 0]) if np.any(submatrix > 0) else 0
+            max_cred = submatrix.max()
+            positive = submatrix[submatrix > 0]
+            min_cred = positive.min() if positive.size else 0
             threshold = max_cred - 0.15 * (max_cred - min_cred)
             
-            # Calculate qualification for each alternative
-            qualification = np.zeros(len(remaining))
-            for i in range(len(remaining)):
-                # Count how many alternatives are outranked by i
-                strength = np.sum(submatrix[i, :] >= threshold)
-                # Count how many alternatives outrank i
-                weakness = np.sum(submatrix[:, i] >= threshold)
-                # Net qualification
-                qualification[i] = strength - weakness
-            
-            # Find the alternatives with lowest qualification
-            min_qual = np.min(qualification)
-            worst_alternatives = set()
-            for i, qual in enumerate(qualification):
-                if qual == min_qual:
-                    worst_alternatives.add(remaining_list[i])
+            # Net qualification: alternatives outranked by i minus those outranking i
+            outranks = submatrix >= threshold
+            qualification = outranks.sum(axis=1) - outranks.sum(axis=0)
             
-            # Assign rank to the worst alternatives and remove them from the remaining set
-            for alt in worst_alternatives:
-                ranks[alt] = current_rank
-                remaining.remove(alt)
+            target = qualification.max() if descending else qualification.min()
+            selected = remaining_idx[qualification == target]
             
-            # Decrement rank for the next iteration
-            current_rank -= len(worst_alternatives)
+            # Assign rank to the selected alternatives and remove them
+            ranks[selected] = current_rank
+            remaining[selected] = False
+            current_rank += selected.size if descending else -selected.size
         
         return ranks
     
@@ -4,7 +4,7 @@ Module that defines the MCDM method factory.
 This factory implements the Factory pattern to create instances of different MCDM methods
 according to the requested name or configuration.
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from application.methods.method_interface import MCDMMethodInterface
 from application.methods.topsis import TOPSISMethod
@@ -31,29 +31,52 @@ class MCDMMethodFactory:
         "PREFERENCE RANKING ORGANIZATION METHOD FOR ENRICHMENT OF EVALUATIONS": "PROMETHEE"
     }
     
+    # Bumped on every registration so cached method listings can tell they are stale
+    _registry_version = 0
+    
+    # (methods dict, aliases dict, registry version, names, lookup) derived from
+    # the registry; rebuilt when either dict is replaced or a method is registered
+    _registry_cache: Optional[tuple] = None
+    
+    @classmethod
+    def _registry(cls) -> Tuple[Tuple[str, ...], Dict[str, type]]:
+        cache = cls._registry_cache
+        if (cache is None or cache[0] is not cls._methods or cache[1] is not cls._aliases
+                or cache[2] != cls._registry_version):
+            # One lookup for upper-cased names, aliases resolved to their class
+            lookup = dict(cls._methods)
+            for alias, target in cls._aliases.items():
+                if target in cls._methods:
+                    lookup[alias] = cls._methods[target]
+                else:
+                    lookup.pop(alias, None)
+            cache = (cls._methods, cls._aliases, cls._registry_version, tuple(cls._methods), lookup)
+            cls._registry_cache = cache
+        return cache[3], cache[4]
+    
     @classmethod
     def create_method(cls, name: str) -> MCDMMethodInterface:
-        # Convert to uppercase for case-insensitive comparison
-        method_name = name.upper()
+        names, lookup = cls._registry()
         
-        # Look in aliases if necessary
-        if method_name in cls._aliases:
-            method_name = cls._aliases[method_name]
-        
-        # Check if the method exists
-        if method_name not in cls._methods:
-            available_methods = list(cls._methods.keys())
+        # Case-insensitive: names and aliases are matched in upper case
+        method_class = lookup.get(name.upper())
+        if method_class is None:
             raise ValidationError(
                 message=f"MCDM method not available: {name}",
-                errors=[f"Available methods: {', '.join(available_methods)}"]
+                errors=[f"Available methods: {', '.join(names)}"]
             )
         
         # Create and return an instance of the method
-        return cls._methods[method_name]()
+        return method_class()
     
     @classmethod
     def get_available_methods(cls) -> List[str]:
-        return list(cls._methods.keys())
+        # Callers get their own list so the cached names cannot be mutated
+        return list(cls._registry()[0])
+    
+    @classmethod
+    def get_registry_version(cls) -> int:
+        return cls._registry_version
     
     @classmethod
     def get_method_info(cls, name: str) -> Dict[str, Any]:
@@ -81,6 +104,8 @@ class MCDMMethodFactory:
         
         # Register the method
         cls._methods[name] = method_class
+        cls._registry_version += 1
+        cls._registry_cache = None
     
     @classmethod
     def create_method_with_params(cls, name: str, parameters: Optional[Dict[str, Any]] = None) -> MCDMMethodInterface:
@@ -5,10 +5,15 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 import time
+import numpy as np
 from domain.entities.decision_matrix import DecisionMatrix
 from domain.entities.result import Result
 
 class MCDMMethodInterface(ABC):
+    # Values accepted by the methods' 'dtype' parameter; float32 halves the memory
+    # traffic of the element-wise passes on large matrices, at reduced precision
+    SUPPORTED_DTYPES = ('float64', 'float32')
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -48,6 +53,12 @@ class MCDMMethodInterface(ABC):
         
         return effective_params
     
+    def _matrix_values(self, decision_matrix: DecisionMatrix,
+                       params: Dict[str, Any]) -> np.ndarray:
+        """Read-only C-contiguous values of the matrix, cast once to params['dtype']"""
+        return np.ascontiguousarray(decision_matrix.values_view(),
+                                    dtype=params.get('dtype', 'float64'))
+    
     def run_with_timing(self, decision_matrix: DecisionMatrix, 
                       parameters: Optional[Dict[str, Any]] = None) -> Result:
         start_time = time.time()
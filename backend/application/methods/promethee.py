@@ -4,9 +4,10 @@ Module that implements the PROMETHEE (Preference Ranking Organization Method for
 PROMETHEE is a multi-criteria decision method based on pairwise comparisons
 and preference flows, developed by Jean-Pierre Brans and Bertrand Mareschal.
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple, Callable
+import os
 import numpy as np
-import math
 
 from domain.entities.decision_matrix import DecisionMatrix
 from domain.entities.result import Result
@@ -15,6 +16,11 @@ from application.methods.method_interface import MCDMMethodInterface
 from utils.exceptions import MethodError, ValidationError
 from utils.normalization import normalize_matrix
 
+# Above this many pairwise differences (n * n * q) the dense preference matrix
+# is computed in blocks of _PREFERENCE_BLOCK_ROWS rows on a thread pool
+_BLOCKED_PREFERENCE_SIZE = 1_000_000
+_PREFERENCE_BLOCK_ROWS = 256
+
 class PROMETHEEMethod(MCDMMethodInterface):
     """
     Implementation of the PROMETHEE (Preference Ranking Organization Method for Enrichment of Evaluations) method.
@@ -75,7 +81,14 @@ class PROMETHEEMethod(MCDMMethodInterface):
             # s parameters (gaussian) by criterion
             's_thresholds': None,
             'normalization_method': 'minmax',
-            'normalize_matrix': True
+            'normalize_matrix': True,
+            
+            # Build the n x n preference matrix and return it in the metadata. Without
+            # it, flows for non-gaussian criteria are computed in O(n log n)
+            'include_preference_matrix': True,
+            
+            # Floating-point type of the computation ('float64' or 'float32')
+            'dtype': 'float64'
         }
     
     def validate_parameters(self, parameters: Dict[str, Any]) -> bool:
@@ -127,6 +140,13 @@ class PROMETHEEMethod(MCDMMethodInterface):
             if not isinstance(parameters['normalize_matrix'], bool):
                 return False
         
+        if 'include_preference_matrix' in parameters:
+            if not isinstance(parameters['include_preference_matrix'], bool):
+                return False
+        
+        if parameters.get('dtype', 'float64') not in self.SUPPORTED_DTYPES:
+            return False
+        
         return True
 
     def execute(self, decision_matrix: DecisionMatrix,
@@ -149,7 +169,7 @@ class PROMETHEEMethod(MCDMMethodInterface):
 
             alternatives = decision_matrix.alternative
             criteria = decision_matrix.criteria
-            values = decision_matrix.values
+            values = self._matrix_values(decision_matrix, params)
 
             n_alternatives = len(alternatives)
             n_criteria = len(criteria)
@@ -164,21 +184,38 @@ class PROMETHEEMethod(MCDMMethodInterface):
                     criteria_types=criteria_types
                 )
 
-            weights = np.array([crit.weight for crit in criteria])
+            weights = decision_matrix.weights_array
             weights = weights / np.sum(weights) if np.sum(weights) > 0 else np.ones(n_criteria) / n_criteria
+            weights = weights.astype(values.dtype)
 
             pref_functions, p_values, q_values, s_values = self._prepare_preference_functions(
                 params, criteria
             )
 
-            preference_matrix = self._calculate_preference_matrix(
-                values, weights, criteria, n_alternatives, n_criteria,
-                pref_functions, p_values, q_values, s_values
-            )
+            include_matrix = params.get('include_preference_matrix', True)
+            gaussian = self.PREFERENCE_FUNCTIONS['gaussian']
+
+            if include_matrix:
+                preference_matrix = self._calculate_preference_matrix(
+                    values, weights, criteria, n_alternatives, n_criteria,
+                    pref_functions, p_values, q_values, s_values
+                )
 
-            positive_flow, negative_flow, net_flow = self._calculate_preference_flows(
-                preference_matrix, n_alternatives
-            )    
+                positive_flow, negative_flow, net_flow = self._calculate_preference_flows(
+                    preference_matrix, n_alternatives
+                )
+            elif gaussian in pref_functions.values():
+                preference_matrix = None
+                positive_flow, negative_flow, net_flow = self._calculate_pairwise_flows(
+                    values, weights, criteria, n_alternatives, n_criteria,
+                    pref_functions, p_values, q_values, s_values
+                )
+            else:
+                preference_matrix = None
+                positive_flow, negative_flow, net_flow = self._calculate_sorted_flows(
+                    values, weights, criteria, n_alternatives,
+                    pref_functions, p_values, q_values
+                )
 
             variant = params.get('variant', 'II')
 
@@ -187,12 +224,12 @@ class PROMETHEEMethod(MCDMMethodInterface):
                 outranking_matrix, incomparabilities = self._promethee_i_ranking(
                     positive_flow, negative_flow, n_alternatives)
                 
+                # Arrays stay native, Result.to_dict converts them
                 metadata = {
-                    'positive_flow': positive_flow.tolist(),
-                    'negative_flow': negative_flow.tolist(),
-                    'net_flow': net_flow.tolist(),
-                    'preference_matrix': preference_matrix.tolist(),
-                    'outranking_matrix': outranking_matrix.tolist(),
+                    'positive_flow': positive_flow,
+                    'negative_flow': negative_flow,
+                    'net_flow': net_flow,
+                    'outranking_matrix': outranking_matrix,
                     'incomparabilities': [(int(i), int(j)) for i, j in incomparabilities]
                 }
 
@@ -201,14 +238,16 @@ class PROMETHEEMethod(MCDMMethodInterface):
             else:
                 # PROMETHEE II: Complete ranking based on net flow
                 metadata = {
-                    'positive_flow': positive_flow.tolist(),
-                    'negative_flow': negative_flow.tolist(),
-                    'net_flow': net_flow.tolist(),
-                    'preference_matrix': preference_matrix.tolist()
+                    'positive_flow': positive_flow,
+                    'negative_flow': negative_flow,
+                    'net_flow': net_flow
                 }
                 
                 scores = net_flow
             
+            if include_matrix:
+                metadata['preference_matrix'] = preference_matrix
+            
             result = Result(
                 method_name=f"{self.name}-{variant}",
                 alternative_ids=[alt.id for alt in alternatives],
@@ -308,96 +347,287 @@ class PROMETHEEMethod(MCDMMethodInterface):
         Returns:
             np.ndarray: Aggregated preference matrix
         """
-        # Initialize preference matrix
-        preference_matrix = np.zeros((n_alternatives, n_alternatives))
-        
-        # For each pair of alternatives
-        for i in range(n_alternatives):
-            for j in range(n_alternatives):
-                if i == j:  # Skip self-comparison
-                    continue
-                    
-                # Calculate weighted preference sum for this pair
-                preference_sum = 0.0
-                
-                # For each criterion
-                for k in range(n_criteria):
-                    crit = criteria[k]
-                    crit_id = crit.id
-                    
-                    # Calculate difference between alternatives for this criterion
-                    diff = values[i, k] - values[j, k]
-                    
-                    # Invert the difference if criterion is cost (minimize)
-                    if crit.is_cost_criteria():
-                        diff = -diff
-                    
-                    # Apply preference function
-                    p_threshold = p_values[crit_id]
-                    q_threshold = q_values[crit_id]
-                    s_threshold = s_values[crit_id]
-                    func_type = pref_functions[crit_id]
-                    
-                    preference = self._apply_preference_function(
-                        diff, func_type, p_threshold, q_threshold, s_threshold
-                    )
-                    
-                    # Add weighted preference to the sum
-                    preference_sum += weights[k] * preference
-                
-                # Store the aggregated preference
-                preference_matrix[i, j] = preference_sum
+        preference_matrix = np.zeros((n_alternatives, n_alternatives), dtype=values.dtype)
+        
+        def write_block(start: int, forward: np.ndarray, backward: np.ndarray) -> None:
+            # Blocks touch disjoint regions: their own rows right of the diagonal
+            # and their own columns below it
+            stop = start + forward.shape[0]
+            preference_matrix[start:stop, start:] += forward
+            preference_matrix[start:, start:stop] += backward.T
+        
+        self._map_preference_blocks(values, weights, criteria, n_alternatives, n_criteria,
+                                    pref_functions, p_values, q_values, s_values, write_block)
         
         return preference_matrix
     
+    def _calculate_pairwise_flows(self, values: np.ndarray, weights: np.ndarray,
+                                  criteria: List[Criteria], n_alternatives: int, n_criteria: int,
+                                  pref_functions: Dict[str, int], p_values: Dict[str, float],
+                                  q_values: Dict[str, float], s_values: Dict[str, float]
+                                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculates the preference flows from the pairwise preferences without
+        storing the n x n preference matrix.
+        
+        Args:
+            Same as _calculate_preference_matrix
+            
+        Returns:
+            Tuple with positive, negative, and net flows
+        """
+        def block_flows(start: int, forward: np.ndarray,
+                        backward: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            stop = start + forward.shape[0]
+            outgoing = np.zeros(n_alternatives, dtype=forward.dtype)
+            incoming = np.zeros(n_alternatives, dtype=forward.dtype)
+            outgoing[start:stop] += forward.sum(axis=1)
+            outgoing[start:] += backward.sum(axis=0)
+            incoming[start:] += forward.sum(axis=0)
+            incoming[start:stop] += backward.sum(axis=1)
+            return outgoing, incoming
+        
+        partial_flows = self._map_preference_blocks(
+            values, weights, criteria, n_alternatives, n_criteria,
+            pref_functions, p_values, q_values, s_values, block_flows
+        )
+        
+        positive_flow = sum(outgoing for outgoing, _ in partial_flows) / (n_alternatives - 1)
+        negative_flow = sum(incoming for _, incoming in partial_flows) / (n_alternatives - 1)
+        
+        return positive_flow, negative_flow, positive_flow - negative_flow
+    
+    def _map_preference_blocks(self, values: np.ndarray, weights: np.ndarray,
+                               criteria: List[Criteria], n_alternatives: int, n_criteria: int,
+                               pref_functions: Dict[str, int], p_values: Dict[str, float],
+                               q_values: Dict[str, float], s_values: Dict[str, float],
+                               consume: Callable[[int, np.ndarray, np.ndarray], Any]) -> List[Any]:
+        """
+        Computes the aggregated preferences of every pair (a, b) with a < b, in
+        blocks of rows, and passes each block to consume.
+        
+        For rows start..stop, consume receives forward[a, b] = P(a, b) and
+        backward[a, b] = P(b, a), both of shape (rows, n - start) with columns
+        counted from start and zero where b <= a.
+        
+        P(a, b) and P(b, a) come from differences of opposite sign, so at most
+        one of them is non-zero. Each pair's preference function is therefore
+        evaluated once, on the absolute difference, and assigned to whichever
+        direction the difference favours.
+        
+        Returns:
+            List with consume's return value for each block, in row order
+        """
+        # Cost (minimize) criteria are negated on the (q, n) columns beforehand,
+        # since -(x_a - x_b) = (-x_a) - (-x_b), so the slices never need a
+        # second pass to flip their sign
+        columns = np.array(values[:, :n_criteria].T, order='C')
+        cost = np.array([crit.is_cost_criteria() for crit in criteria[:n_criteria]], dtype=bool)
+        columns[cost] *= -1
+        thresholds = [(pref_functions[crit.id], p_values[crit.id], q_values[crit.id], s_values[crit.id])
+                      for crit in criteria[:n_criteria]]
+        criteria_weights = weights[:n_criteria]
+        
+        def process_block(start: int) -> Any:
+            stop = min(start + _PREFERENCE_BLOCK_ROWS, n_alternatives)
+            
+            # (q, rows, n - start) stack of differences, one matrix per criterion,
+            # built in a single broadcast subtraction
+            diff_stack = columns[:, start:stop, np.newaxis] - columns[:, np.newaxis, start:]
+            
+            preference_stack = np.empty_like(diff_stack)
+            for k, (func_type, p, q, s) in enumerate(thresholds):
+                preference_stack[k] = self._preference_values(
+                    np.abs(diff_stack[k]), func_type, p, q, s)
+            
+            # Weighted sum over the criteria axis in a single pass, split by the
+            # sign of each difference (zero differences give zero preference)
+            forward = np.einsum('kab,k->ab', np.where(diff_stack > 0, preference_stack, 0.0),
+                                criteria_weights, optimize=True)
+            backward = np.einsum('kab,k->ab', preference_stack, criteria_weights,
+                                 optimize=True) - forward
+            
+            # Pairs with b <= a in the leading square belong to earlier rows
+            later = np.arange(n_alternatives - start) > np.arange(stop - start)[:, np.newaxis]
+            forward *= later
+            backward *= later
+            
+            return consume(start, forward, backward)
+        
+        starts = range(0, n_alternatives, _PREFERENCE_BLOCK_ROWS)
+        
+        if n_alternatives * n_alternatives * n_criteria <= _BLOCKED_PREFERENCE_SIZE:
+            return [process_block(start) for start in starts]
+        
+        # Blocks are independent and NumPy releases the GIL in its element-wise
+        # loops, so large problems fill them concurrently
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            return list(executor.map(process_block, starts))
+    
+    def _calculate_sorted_flows(self, values: np.ndarray, weights: np.ndarray,
+                                criteria: List[Criteria], n_alternatives: int,
+                                pref_functions: Dict[str, int], p_values: Dict[str, float],
+                                q_values: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculates the preference flows without building the preference matrix.
+        
+        Every preference function except the gaussian is piecewise linear in the
+        difference, so the sum of P(a, b) over b only needs how many alternatives
+        fall in each threshold band and the sum of their values there. Sorting
+        each criterion once gives both in O(n log n) (Calders & Van Assche).
+        
+        Args:
+            values: Matrix of normalized values
+            weights: Vector of normalized weights
+            criteria: List of criteria
+            n_alternatives: Number of alternatives
+            pref_functions: Dictionary of preference functions by criterion
+            p_values: Dictionary of preference thresholds by criterion
+            q_values: Dictionary of indifference thresholds by criterion
+            
+        Returns:
+            Tuple with positive, negative, and net flows
+        """
+        positive_sum = np.zeros(n_alternatives)
+        negative_sum = np.zeros(n_alternatives)
+        
+        for k, crit in enumerate(criteria):
+            column = values[:, k]
+            # Same convention as the dense path: cost criteria compare reversed
+            if crit.is_cost_criteria():
+                column = -column
+            
+            func_type = pref_functions[crit.id]
+            p_threshold = p_values[crit.id]
+            q_threshold = q_values[crit.id]
+            
+            # P(a, b) summed over b, and P(b, a) summed over b (the reversed column)
+            positive_sum += weights[k] * self._unicriterion_preference_sums(
+                column, func_type, p_threshold, q_threshold)
+            negative_sum += weights[k] * self._unicriterion_preference_sums(
+                -column, func_type, p_threshold, q_threshold)
+        
+        positive_flow = positive_sum / (n_alternatives - 1)
+        negative_flow = negative_sum / (n_alternatives - 1)
+        
+        return positive_flow, negative_flow, positive_flow - negative_flow
+    
+    def _unicriterion_preference_sums(self, column: np.ndarray, func_type: int,
+                                      p: float, q: float) -> np.ndarray:
+        """
+        For each alternative a, the sum over b of P(column[a] - column[b]) for a
+        piecewise linear preference function.
+        """
+        n = column.shape[0]
+        ordered = np.sort(column)
+        prefix = np.concatenate(([0.0], np.cumsum(ordered)))
+        
+        def count_above(threshold: float) -> np.ndarray:
+            # Number of b with column[a] - column[b] > threshold. The computed
+            # difference never increases along the sorted column, so bisecting on
+            # it gives the same answer as the dense comparisons, rounding included
+            lo = np.zeros(n, dtype=np.intp)
+            hi = np.full(n, n, dtype=np.intp)
+            active = lo < hi
+            while active.any():
+                mid = (lo + hi) // 2
+                above = (column - ordered[np.minimum(mid, n - 1)]) > threshold
+                lo = np.where(active & above, mid + 1, lo)
+                hi = np.where(active & ~above, mid, hi)
+                active = lo < hi
+            return lo
+        
+        def linear_band(low: float, high: float, offset: float, scale: float) -> np.ndarray:
+            # Sum of (d - offset) / scale over the b with low < d <= high
+            start, end = count_above(high), count_above(low)
+            return ((end - start) * (column - offset) - (prefix[end] - prefix[start])) / scale
+        
+        if func_type == 1:  # Usual
+            return count_above(0.0).astype(float)
+        
+        elif func_type == 2:  # U-shape (quasi)
+            return count_above(max(q, 0.0)).astype(float)
+        
+        elif func_type == 3:  # V-shape (linear)
+            if p <= 0:
+                return count_above(0.0).astype(float)
+            return count_above(p) + linear_band(0.0, p, 0.0, p)
+        
+        elif func_type == 4:  # Level
+            q = max(q, 0.0)
+            return 0.5 * count_above(q) + 0.5 * count_above(max(p, q))
+        
+        elif func_type == 5:  # V-shape with indifference
+            low = max(q, 0.0)
+            high = max(p, low)
+            if high > low:
+                return count_above(high) + linear_band(low, high, q, p - q)
+            return count_above(high).astype(float)
+        
+        raise ValueError(f"Preference function {func_type} has no sorted-flow form")
+    
     def _apply_preference_function(self, diff: float, func_type: int,
                              p: float, q: float, s: float) -> float:
         """
         Implementación revisada basada en la definición original de Brans & Vincke
+        
+        Scalar form of _preference_values, for a single difference.
+        """
+        return float(self._preference_values(np.asarray(diff, dtype=float), func_type, p, q, s))
+    
+    def _preference_values(self, diff: np.ndarray, func_type: int,
+                           p: float, q: float, s: float) -> np.ndarray:
+        """
+        Applies a preference function elementwise to an array of differences.
+        
+        Args:
+            diff: Differences between alternatives (any shape)
+            func_type: Preference function ID (see PREFERENCE_FUNCTIONS)
+            p: Preference threshold
+            q: Indifference threshold
+            s: Gaussian threshold
+            
+        Returns:
+            np.ndarray: Preference degrees in [0, 1], same shape as diff
         """
         # Para diferencias negativas
-        if diff <= 0:
-            return 0.0
+        positive = diff > 0
         
-        # Para cada tipo de función
         if func_type == 1:  # Usual
-            return 1.0
+            preference = np.ones_like(diff)
             
         elif func_type == 2:  # U-shape (quasi)
-            return 0.0 if diff <= q else 1.0
+            preference = (diff > q).astype(float)
             
         elif func_type == 3:  # V-shape (linear)
-            # Manejo más preciso de casos límite
-            if p <= 0 or diff >= p:
-                return 1.0
+            if p <= 0:
+                preference = np.ones_like(diff)
             else:
-                return diff / p
+                preference = np.minimum(diff / p, 1.0)
                 
         elif func_type == 4:  # Level
-            if diff <= q:
-                return 0.0
-            elif diff <= p:
-                return 0.5
-            else:
-                return 1.0
+            preference = np.select([diff <= q, diff <= p], [0.0, 0.5], 1.0)
                 
         elif func_type == 5:  # V-shape with indifference
-            if diff <= q:
-                return 0.0
-            elif diff <= p:
-                # Cálculo más preciso para valores cercanos a los umbrales
-                return (diff - q) / (p - q)
-            else:
-                return 1.0
+            # p == q leaves no linear band, so the ratio is never selected
+            with np.errstate(divide='ignore', invalid='ignore'):
+                linear = (diff - q) / (p - q)
+            preference = np.select([diff <= q, diff <= p], [0.0, linear], 1.0)
                 
         elif func_type == 6:  # Gaussian
-            if diff <= 0:
-                return 0.0
-            else:
-                # Cálculo ajustado para mejor discriminación
-                return 1.0 - math.exp(-(diff * diff) / (2 * s * s))
+            # 1 - exp(-x) as -expm1(-x), computed in place on one contiguous
+            # buffer: a single vectorized transcendental pass, and no
+            # cancellation for differences much smaller than s
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                preference = np.square(diff)
+                preference /= -2 * s * s
+                np.expm1(preference, out=preference)
+                np.negative(preference, out=preference)
+        
+        else:
+            preference = np.zeros_like(diff)
         
-        return 0.0
+        return np.where(positive, preference, 0.0)
     
     def _calculate_preference_flows(self, preference_matrix: np.ndarray, 
                                  n_alternatives: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -427,38 +657,32 @@ class PROMETHEEMethod(MCDMMethodInterface):
         """
         Corregida según la teoría original de Brans & Vincke
         """
-        outranking_matrix = np.zeros((n_alternatives, n_alternatives))
-        incomparabilities = []
-        
         # Tolerancia para comparaciones numéricas
         epsilon = 1e-6
         
-        for i in range(n_alternatives):
-            for j in range(n_alternatives):
-                if i == j:
-                    continue
-                    
-                phi_plus_better = positive_flow[i] > positive_flow[j] + epsilon
-                phi_plus_equal = abs(positive_flow[i] - positive_flow[j]) <= epsilon
-                phi_minus_better = negative_flow[i] < negative_flow[j] - epsilon
-                phi_minus_equal = abs(negative_flow[i] - negative_flow[j]) <= epsilon
-                
-                # Caso 1: i supera estrictamente a j
-                if (phi_plus_better and phi_minus_better) or \
-                (phi_plus_better and phi_minus_equal) or \
-                (phi_plus_equal and phi_minus_better):
-                    outranking_matrix[i, j] = 1
-                
-                # Caso 2: i es indiferente a j
-                elif phi_plus_equal and phi_minus_equal:
-                    outranking_matrix[i, j] = 0.5
-                    outranking_matrix[j, i] = 0.5
-                
-                # Caso 3: i es incomparable con j (conflicto entre flujos)
-                elif (phi_plus_better and phi_minus_better) or \
-                    (phi_plus_better and phi_minus_better):
-                    outranking_matrix[i, j] = -1
-                    if (j, i) not in incomparabilities:
-                        incomparabilities.append((i, j))
+        # Pairwise comparisons of the flows, [i, j] compares i against j
+        plus = positive_flow[:, np.newaxis]
+        minus = negative_flow[:, np.newaxis]
+        phi_plus_better = plus > positive_flow + epsilon
+        phi_plus_equal = np.abs(plus - positive_flow) <= epsilon
+        phi_minus_better = minus < negative_flow - epsilon
+        phi_minus_equal = np.abs(minus - negative_flow) <= epsilon
+        
+        # Caso 1: i supera estrictamente a j
+        outranks = ((phi_plus_better & (phi_minus_better | phi_minus_equal)) |
+                    (phi_plus_equal & phi_minus_better))
+        # Caso 2: i es indiferente a j
+        indifferent = phi_plus_equal & phi_minus_equal
+        # Caso 3: i es incomparable con j (conflicto entre flujos): better on
+        # one flow and worse on the other
+        incomparable = ((phi_plus_better & phi_minus_better.T) |
+                        (phi_plus_better.T & phi_minus_better))
+        
+        outranking_matrix = np.select([outranks, indifferent, incomparable], [1.0, 0.5, -1.0], 0.0)
+        np.fill_diagonal(outranking_matrix, 0.0)
+        
+        # Each incomparable pair once, as (i, j) with i < j
+        rows, cols = np.nonzero(np.triu(incomparable, k=1))
+        incomparabilities = list(zip(rows.tolist(), cols.tolist()))
         
         return outranking_matrix, incomparabilities
\ No newline at end of file
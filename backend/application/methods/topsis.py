@@ -1,8 +1,7 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
 from domain.entities.decision_matrix import DecisionMatrix
 from domain.entities.result import Result
-from domain.entities.criteria import OptimizationType
 from application.methods.method_interface import MCDMMethodInterface
 from utils.exceptions import MethodError
 from utils.normalization import normalize_matrix
@@ -11,6 +10,11 @@ from utils.normalization import normalize_matrix
 class TOPSISMethod(MCDMMethodInterface):
     """Implementación del método TOPSIS"""
     
+    def __init__(self):
+        # Work arrays for intermediates that never leave execute, keyed by
+        # (shape, dtype) and reused while the matrix shape stays the same
+        self._scratch: Dict[Tuple[Tuple[int, ...], np.dtype], np.ndarray] = {}
+    
     @property
     def name(self) -> str:
         return "TOPSIS"
@@ -30,13 +34,16 @@ class TOPSISMethod(MCDMMethodInterface):
         return {
             'normalization_method': 'vector',
             'ideal_solution': 'auto',
-            'nadir_solution': 'auto'
+            'nadir_solution': 'auto',
+            'dtype': 'float64'
         }
     
     def validate_parameters(self, parameters: Dict[str, Any]) -> bool:
         valid_normalization = ['vector', 'linear', 'minmax']
         if parameters.get('normalization_method') not in valid_normalization:
             return False
+        if parameters.get('dtype', 'float64') not in self.SUPPORTED_DTYPES:
+            return False
         return True
     
     def execute(self, decision_matrix: DecisionMatrix, 
@@ -47,7 +54,7 @@ class TOPSISMethod(MCDMMethodInterface):
             params = self._prepare_execution(decision_matrix, parameters)
             
             # Obtener datos de la matriz
-            matrix = decision_matrix.values
+            matrix = self._matrix_values(decision_matrix, params)
             criteria = decision_matrix.criteria
             alternatives = decision_matrix.alternative
             
@@ -81,7 +88,7 @@ class TOPSISMethod(MCDMMethodInterface):
                 raise MethodError("Matrix contains infinite values", self.name)
             
             # Calcular y validar pesos
-            weights = np.array([c.weight for c in criteria])
+            weights = decision_matrix.weights_array
             
             if len(weights) != len(criteria):
                 raise MethodError(
@@ -93,7 +100,23 @@ class TOPSISMethod(MCDMMethodInterface):
                 raise MethodError("Sum of weights is zero", self.name)
             
             # Normalizar pesos para que sumen 1
-            weights = weights / np.sum(weights)
+            weights = (weights / np.sum(weights)).astype(matrix.dtype)
+            
+            # Every alternative has the same values (always the case with a single
+            # one): both ideals coincide with each row, so all the distances are
+            # zero and every alternative is halfway between them
+            if np.all(matrix == matrix[0]):
+                n_alternatives = len(alternatives)
+                result = Result(
+                    method_name=self.name,
+                    alternative_ids=[alt.id for alt in alternatives],
+                    alternative_names=[alt.name for alt in alternatives],
+                    scores=np.full(n_alternatives, 0.5),
+                    parameters=params
+                )
+                result.set_metadata('distances_positive', np.zeros(n_alternatives, dtype=matrix.dtype))
+                result.set_metadata('distances_negative', np.zeros(n_alternatives, dtype=matrix.dtype))
+                return result
             
             # Log para debugging
             print(f"TOPSIS - Matrix shape: {matrix.shape}")
@@ -106,34 +129,26 @@ class TOPSISMethod(MCDMMethodInterface):
             # Aplicar pesos
             weighted_matrix = normalized_matrix * weights
             
-            # Determinar soluciones ideales
-            ideal_positive = np.zeros(len(criteria))
-            ideal_negative = np.zeros(len(criteria))
-            
-            for j, criterion in enumerate(criteria):
-                if criterion.optimization_type == OptimizationType.MAXIMIZE:
-                    ideal_positive[j] = np.max(weighted_matrix[:, j])
-                    ideal_negative[j] = np.min(weighted_matrix[:, j])
-                else:
-                    ideal_positive[j] = np.min(weighted_matrix[:, j])
-                    ideal_negative[j] = np.max(weighted_matrix[:, j])
+            # Determinar soluciones ideales: one max and one min per column,
+            # picked by the criterion type
+            maximize = decision_matrix.maximize_mask
+            column_max = weighted_matrix.max(axis=0)
+            column_min = weighted_matrix.min(axis=0)
+            ideal_positive = np.where(maximize, column_max, column_min)
+            ideal_negative = np.where(maximize, column_min, column_max)
             
             # Calcular distancias
-            distances_positive = np.sqrt(np.sum((weighted_matrix - ideal_positive) ** 2, axis=1))
-            distances_negative = np.sqrt(np.sum((weighted_matrix - ideal_negative) ** 2, axis=1))
+            # Both calls share one buffer for the differences to the ideal point
+            diff_buffer = self._scratch_buffer(weighted_matrix.shape, weighted_matrix.dtype)
+            distances_positive = self._calculate_distances(
+                weighted_matrix, ideal_positive, 2, 'euclidean', out=diff_buffer)
+            distances_negative = self._calculate_distances(
+                weighted_matrix, ideal_negative, 2, 'euclidean', out=diff_buffer)
             
             # Calcular proximidad relativa
-            # Evitar división por cero
-            denominator = distances_positive + distances_negative
-            scores = np.where(
-                denominator > 0,
-                distances_negative / denominator,
-                0.0
-            )
-            
-            # Calcular rankings
-            rankings = len(scores) - np.argsort(np.argsort(scores))
+            scores = self._closeness(distances_positive, distances_negative)
             
+            # Rankings are computed by Result from the scores
             # Crear resultado
             result = Result(
                 method_name=self.name,
@@ -143,13 +158,13 @@ class TOPSISMethod(MCDMMethodInterface):
                 parameters=params
             )
             
-            # Agregar metadatos
-            result.set_metadata('normalized_matrix', normalized_matrix.tolist())
-            result.set_metadata('weighted_matrix', weighted_matrix.tolist())
-            result.set_metadata('ideal_positive', ideal_positive.tolist())
-            result.set_metadata('ideal_negative', ideal_negative.tolist())
-            result.set_metadata('distances_positive', distances_positive.tolist())
-            result.set_metadata('distances_negative', distances_negative.tolist())
+            # Agregar metadatos; arrays stay native, Result.to_dict converts them
+            result.set_metadata('normalized_matrix', normalized_matrix)
+            result.set_metadata('weighted_matrix', weighted_matrix)
+            result.set_metadata('ideal_positive', ideal_positive)
+            result.set_metadata('ideal_negative', ideal_negative)
+            result.set_metadata('distances_positive', distances_positive)
+            result.set_metadata('distances_negative', distances_negative)
             
             return result
             
@@ -159,4 +174,83 @@ class TOPSISMethod(MCDMMethodInterface):
             raise MethodError(
                 f"Unexpected error in TOPSIS execution: {str(e)}",
                 self.name
-            ) from e
\ No newline at end of file
+            ) from e
+    
+    def execute_weight_sweep(self, decision_matrix: DecisionMatrix, weight_sets: np.ndarray,
+                             parameters: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """Closeness scores for every row of weight_sets (steps x criteria) in one batched pass"""
+        params = self._prepare_execution(decision_matrix, parameters)
+        
+        matrix = self._matrix_values(decision_matrix, params)  # normalize_matrix works on its own copy
+        criteria = decision_matrix.criteria
+        
+        if matrix.size == 0:
+            raise MethodError("Empty decision matrix", self.name)
+        
+        weight_sets = np.asarray(weight_sets, dtype=matrix.dtype)
+        if weight_sets.ndim != 2 or weight_sets.shape[1] != len(criteria):
+            raise MethodError(
+                f"Weight sets of shape {weight_sets.shape} don't match criteria ({len(criteria)})",
+                self.name
+            )
+        
+        totals = weight_sets.sum(axis=1, keepdims=True)
+        if np.any(totals == 0):
+            raise MethodError("Sum of weights is zero", self.name)
+        weight_sets = weight_sets / totals
+        
+        # The normalization does not depend on the weights, so it is done once
+        normalized_matrix = normalize_matrix(matrix, method=params['normalization_method'])
+        
+        # (steps, alternatives, criteria)
+        weighted = np.einsum('sj,ij->sij', weight_sets, normalized_matrix)
+        
+        maximize = decision_matrix.maximize_mask
+        column_max = weighted.max(axis=1)
+        column_min = weighted.min(axis=1)
+        ideal_positive = np.where(maximize, column_max, column_min)
+        ideal_negative = np.where(maximize, column_min, column_max)
+        
+        diff_buffer = self._scratch_buffer(weighted.shape, weighted.dtype)
+        distances_positive = self._calculate_distances(
+            weighted, ideal_positive[:, np.newaxis, :], 2, 'euclidean', out=diff_buffer)
+        distances_negative = self._calculate_distances(
+            weighted, ideal_negative[:, np.newaxis, :], 2, 'euclidean', out=diff_buffer)
+        
+        return self._closeness(distances_positive, distances_negative)
+    
+    @staticmethod
+    def _closeness(distances_positive: np.ndarray, distances_negative: np.ndarray) -> np.ndarray:
+        """Relative closeness to the ideal; an alternative at zero distance from
+        both ideals is halfway between them (0.5), as in execute's tied case"""
+        denominator = distances_positive + distances_negative
+        return np.where(denominator > 0,
+                        distances_negative / np.where(denominator > 0, denominator, 1.0), 0.5)
+    
+    def _scratch_buffer(self, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """Uninitialized work array of the given shape and dtype, reused across calls"""
+        key = (tuple(shape), np.dtype(dtype))
+        buffer = self._scratch.get(key)
+        if buffer is None:
+            # A new matrix shape or dtype: the previous buffers will not be needed
+            self._scratch.clear()
+            buffer = self._scratch[key] = np.empty(key[0], dtype=key[1])
+        return buffer
+    
+    def _calculate_distances(self, values: np.ndarray, ideal_point: np.ndarray,
+                             p: float, metric: str, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Distance of every row of values to ideal_point, computed along the last axis.
+        p is the order used by the 'minkowski' metric; out, if given, receives the
+        element-wise differences and is overwritten"""
+        diff = np.subtract(values, ideal_point, out=out)
+        
+        if metric == 'euclidean':
+            return np.sqrt(np.square(diff, out=diff).sum(axis=-1))
+        elif metric == 'manhattan':
+            return np.abs(diff, out=diff).sum(axis=-1)
+        elif metric == 'chebyshev':
+            return np.abs(diff, out=diff).max(axis=-1)
+        elif metric == 'minkowski':
+            return np.linalg.norm(diff, ord=p, axis=-1)
+        
+        raise MethodError(f"Unknown distance metric: {metric}", self.name)
@@ -5,6 +5,10 @@ This service is responsible for coordinating the application of MCDM methods to
 managing results, and providing comparative analysis.
 """
 from typing import Dict, List, Any, Optional, Tuple, Set, Union
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import logging
+import os
 import time
 import numpy as np
 
@@ -16,17 +20,103 @@ from domain.entities.alternative import Alternative
 from domain.entities.criteria import Criteria
 from application.methods.method_factory import MCDMMethodFactory
 from application.methods.method_interface import MCDMMethodInterface
-from utils.exceptions import ServiceError, ValidationError, MethodError
+from application.methods.topsis import TOPSISMethod
+from utils.exceptions import ServiceError, ValidationError, MethodError, MCDMBaseException
+
+logger = logging.getLogger(__name__)
+
+# Matrix cells (alternatives x criteria) from which the methods are run in
+# worker processes; below it the process round trip outweighs the work
+_PARALLEL_MIN_CELLS = 1_000
+
+
+def _run_method(method_name: str, decision_matrix: DecisionMatrix,
+                parameters: Optional[Dict[str, Any]]) -> Tuple[Optional[Result], Optional[str]]:
+    """
+    Runs one MCDM method in a worker process.
+    
+    Errors are returned as text instead of raised, since the custom exceptions
+    do not round-trip through pickle with their original arguments.
+    """
+    try:
+        method = MCDMMethodFactory.create_method_with_params(method_name, parameters)
+        
+        start_time = time.time()
+        result = method.execute(decision_matrix, parameters)
+        execution_time = time.time() - start_time
+        
+        if result is None:
+            return None, f"Method {method_name} returned None"
+        
+        result.set_metadata('execution_time', execution_time)
+        return result, None
+        
+    except MCDMBaseException as e:
+        return None, f"Error executing method {method_name}: {e.message}"
+    except Exception as e:
+        return None, f"Unexpected error executing method {method_name}: {str(e)}"
 
 
 class DecisionService:
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 1):
         self._method_factory = MCDMMethodFactory
+        # Worker processes for large matrices (1 = always serial, None = one per CPU)
+        self._max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        # Started on first use and kept for the life of the service
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    def shutdown(self) -> None:
+        """Stop the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+    
+    def _use_workers(self, decision_matrix: Optional[DecisionMatrix], n_tasks: int) -> bool:
+        # Below the threshold the process round trip costs more than the methods themselves
+        return (self._max_workers >= 2 and n_tasks >= 2 and decision_matrix is not None
+                and decision_matrix.size >= _PARALLEL_MIN_CELLS)
+    
+    @staticmethod
+    def _validate_decision_matrix(project: Project) -> None:
+        if project.decision_matrix is None:
+            raise ServiceError(
+                message="The project has no decision matrix",
+                service_name="DecisionService"
+            )
+        
+        # Validar que la matriz tenga datos
+        if project.decision_matrix.values.size == 0:
+            raise ServiceError(
+                message="The decision matrix is empty - no values to process",
+                service_name="DecisionService"
+            )
+        
+        # Validar alternativas y criterios
+        if len(project.decision_matrix.alternative) == 0:
+            raise ServiceError(
+                message="No alternatives defined in the project",
+                service_name="DecisionService"
+            )
+        
+        if len(project.decision_matrix.criteria) == 0:
+            raise ServiceError(
+                message="No criteria defined in the project",
+                service_name="DecisionService"
+            )
     
     def get_available_methods(self) -> List[str]:
         return self._method_factory.get_available_methods()
     
+    @property
+    def methods_version(self) -> int:
+        return self._method_factory.get_registry_version()
+    
     def get_method_info(self, method_name: str) -> Dict[str, Any]:
         try:
             return self._method_factory.get_method_info(method_name)
@@ -40,36 +130,11 @@ class DecisionService:
                  parameters: Optional[Dict[str, Any]] = None) -> Result:
         try:
             # Validación exhaustiva del proyecto
-            if project.decision_matrix is None:
-                raise ServiceError(
-                    message="The project has no decision matrix",
-                    service_name="DecisionService"
-                )
-            
-            # Validar que la matriz tenga datos
-            matrix = project.decision_matrix.values
-            if matrix.size == 0:
-                raise ServiceError(
-                    message="The decision matrix is empty - no values to process",
-                    service_name="DecisionService"
-                )
-            
-            # Validar alternativas y criterios
-            if len(project.decision_matrix.alternative) == 0:
-                raise ServiceError(
-                    message="No alternatives defined in the project",
-                    service_name="DecisionService"
-                )
-            
-            if len(project.decision_matrix.criteria) == 0:
-                raise ServiceError(
-                    message="No criteria defined in the project",
-                    service_name="DecisionService"
-                )
+            self._validate_decision_matrix(project)
             
             # Log para debugging
             print(f"DecisionService - Executing {method_name}")
-            print(f"DecisionService - Matrix shape: {matrix.shape}")
+            print(f"DecisionService - Matrix shape: {project.decision_matrix.shape}")
             print(f"DecisionService - Parameters: {parameters}")
             
             # Crear método usando create_method_with_params
@@ -101,9 +166,7 @@ class DecisionService:
                 service_name="DecisionService"
             ) from e
         except Exception as e:
-            print(f"DecisionService - Unexpected error: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("DecisionService - Unexpected error executing %s", method_name)
             raise ServiceError(
                 message=f"Unexpected error executing method {method_name}: {str(e)}",
                 service_name="DecisionService"
@@ -117,16 +180,39 @@ class DecisionService:
         
         available_methods = self.get_available_methods()
         
-        for method_name in available_methods:
-            try:
-                method_params = parameters.get(method_name)
-        
-                result = self.execute_method(project, method_name, method_params)
+        if self._use_workers(project.decision_matrix, len(available_methods)):
+            # Same checks as execute_method, once for every method
+            self._validate_decision_matrix(project)
+            
+            # Each method is independent CPU-bound work on the same large matrix,
+            # so they are fanned out to the worker processes
+            executor = self._get_executor()
+            futures = {
+                method_name: executor.submit(
+                    _run_method, method_name, project.decision_matrix, parameters.get(method_name)
+                )
+                for method_name in available_methods
+            }
             
-                results[method_name] = result
+            for method_name, future in futures.items():
+                result, error = future.result()
+                if error is not None:
+                    logger.error("DecisionService - %s", error)
+                    errors.append(f"{method_name}: {error}")
+                else:
+                    project.add_result(method_name, result)
+                    results[method_name] = result
+        else:
+            for method_name in available_methods:
+                try:
+                    method_params = parameters.get(method_name)
+            
+                    result = self.execute_method(project, method_name, method_params)
                 
-            except ServiceError as e:
-                errors.append(f"{method_name}: {e.message}")
+                    results[method_name] = result
+                    
+                except ServiceError as e:
+                    errors.append(f"{method_name}: {e.message}")
         
         if errors:
             for result in results.values():
@@ -186,41 +272,26 @@ class DecisionService:
     
     def _calculate_ranking_correlation(self, project: Project, 
                                     methods: List[str]) -> Dict[str, Dict[str, float]]:
-        correlation = {}
+        results = project.results
+        rankings = np.vstack([results[method].rankings for method in methods]).astype(float)
+        n = rankings.shape[1]
         
-        # For each pair of methods
-        for i, method1 in enumerate(methods):
-            correlation[method1] = {}
-            
-            for method2 in methods:
-                if method1 == method2:
-                    # Correlation of a method with itself is 1.0
-                    correlation[method1][method2] = 1.0
-                    continue
-                
-                # Get rankings from both methods
-                result1 = project.results[method1]
-                result2 = project.results[method2]
-                
-                # Calculate Spearman correlation
-                corr = self._calculate_spearman_correlation(
-                    result1.rankings, result2.rankings)
-                
-                correlation[method1][method2] = corr
-        
-        return correlation
-    
-    def _calculate_spearman_correlation(self, rankings1: np.ndarray, 
-                                     rankings2: np.ndarray) -> float:
-        n = len(rankings1)
+        # Squared ranking differences of every pair of methods from one Gram matrix:
+        # sum((r_i - r_j)^2) = |r_i|^2 + |r_j|^2 - 2 r_i.r_j
+        squared_norms = np.einsum('ij,ij->i', rankings, rankings)
+        d_squared = squared_norms[:, np.newaxis] + squared_norms[np.newaxis, :] - 2.0 * (rankings @ rankings.T)
         
-        # Calculate the squared difference between rankings
-        d_squared = np.sum((rankings1 - rankings2) ** 2)
+        # Spearman correlation formula; a single alternative leaves it undefined (NaN)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spearman = 1 - (6 * d_squared) / (n * (n * n - 1))
         
-        # Apply Spearman correlation formula
-        spearman = 1 - (6 * d_squared) / (n * (n * n - 1))
+        # Correlation of a method with itself is 1.0
+        np.fill_diagonal(spearman, 1.0)
         
-        return spearman
+        return {
+            method1: dict(zip(methods, row))
+            for method1, row in zip(methods, spearman.tolist())
+        }
     
     def _calculate_consensus(self, project: Project, methods: List[str]) -> Dict[str, Any]:
         alternatives = project.alternatives
@@ -229,32 +300,29 @@ class DecisionService:
         # Initialize count of times each alternative appears in the top-k
         top_counts = {alt.id: 0 for alt in alternatives}
         
-        # Initialize concordance matrix (frequency with which one alternative is ranked better than another)
-        concordance_matrix = np.zeros((n_alternatives, n_alternatives))
-        
-        for method in methods:
-            result = project.results[method]
-            
-            # Increment count for alternatives in top-3
-            sorted_alts = result.get_sorted_alternatives()
-            for i in range(min(3, n_alternatives)):
-                alt_id = sorted_alts[i]['id']
-                top_counts[alt_id] += 1
-            
-            # Update concordance matrix
-            for i in range(n_alternatives):
-                for j in range(n_alternatives):
-                    if i != j:
-                        # Alternatives by ID
-                        alt_i_id = alternatives[i].id
-                        alt_j_id = alternatives[j].id
-                        
-                        rank_i = result.get_ranking_by_id(alt_i_id)
-                        rank_j = result.get_ranking_by_id(alt_j_id)
-                        
-                        # If i is ranked better than j, increment concordance
-                        if rank_i < rank_j:
-                            concordance_matrix[i, j] += 1
+        # Rankings of every method aligned to the project's alternative order, shape (methods, alternatives)
+        results = project.results
+        aligned_rankings = np.empty((len(methods), n_alternatives), dtype=int)
+        
+        for m, method in enumerate(methods):
+            result = results[method]
+            alt_ids = result.alternative_ids
+            
+            # Increment count for alternatives in top-3 (same order as get_sorted_alternatives)
+            for idx in np.argsort(result.scores)[::-1][:min(3, n_alternatives)]:
+                top_counts[alt_ids[idx]] += 1
+            
+            position = {alt_id: idx for idx, alt_id in enumerate(alt_ids)}
+            try:
+                order = [position[alt.id] for alt in alternatives]
+            except KeyError as e:
+                raise ValueError(f"No alternative was found with ID: {e.args[0]}") from e
+            aligned_rankings[m] = result.rankings[order]
+        
+        # Concordance matrix: how many methods rank alternative i better than j (diagonal stays 0)
+        concordance_matrix = np.sum(
+            aligned_rankings[:, :, np.newaxis] < aligned_rankings[:, np.newaxis, :], axis=0
+        ).astype(float)
         
         # Normalize concordance matrix
         concordance_matrix = concordance_matrix / len(methods)
@@ -315,21 +383,46 @@ class DecisionService:
                 'scores': []
             }
             
-            for weight in weights_to_test:
-                # Modify criterion weight
-                criteria.weight = weight
+            if isinstance(method, TOPSISMethod):
+                # Normalization does not depend on the weights, so every step is
+                # scored in one batched pass instead of one execution per weight
+                matrix = project.decision_matrix
+                crit_idx, _ = matrix.get_criteria_by_id(criteria_id)
+                weight_sets = np.tile([crit.weight for crit in matrix.criteria], (steps, 1))
+                weight_sets[:, crit_idx] = weights_to_test
                 
-                # Update decision matrix (necessary if weights are integrated)
-                project.create_decision_matrix()
+                scores = method.execute_weight_sweep(matrix, weight_sets)
                 
-                result = method.execute(project.decision_matrix)
-            
-                sensitivity_results['rankings'].append(result.rankings.tolist())
-                sensitivity_results['scores'].append(result.scores.tolist())
-            
-            # Restore original weight
-            criteria.weight = original_weight
-            project.create_decision_matrix()
+                sensitivity_results['rankings'] = self._rank_scores(scores).tolist()
+                sensitivity_results['scores'] = scores.tolist()
+            else:
+                # Each step gets its own criteria list with the tested weight and
+                # shares the values buffer. The weight is never set on the project's
+                # Criteria, since a loaded project's matrix holds its own copies
+                matrix = project.decision_matrix
+                crit_idx, _ = matrix.get_criteria_by_id(criteria_id)
+                step_matrices = []
+                for weight in weights_to_test:
+                    step_criteria = matrix.criteria
+                    step_criteria[crit_idx] = copy.copy(step_criteria[crit_idx])
+                    step_criteria[crit_idx].weight = float(weight)
+                    step_matrices.append(matrix.copy_on_write(criteria=step_criteria))
+                
+                if self._use_workers(matrix, steps):
+                    outcomes = list(self._get_executor().map(
+                        _run_method, [method_name] * steps, step_matrices, [None] * steps))
+                    
+                    for result, error in outcomes:
+                        if error is not None:
+                            raise ServiceError(message=error, service_name="DecisionService")
+                        sensitivity_results['rankings'].append(result.rankings.tolist())
+                        sensitivity_results['scores'].append(result.scores.tolist())
+                else:
+                    for step_matrix in step_matrices:
+                        result = method.execute(step_matrix)
+                        
+                        sensitivity_results['rankings'].append(result.rankings.tolist())
+                        sensitivity_results['scores'].append(result.scores.tolist())
             
             # Analyze stability of results
             sensitivity_results['stability'] = self._analyze_ranking_stability(
@@ -343,6 +436,14 @@ class DecisionService:
                 service_name="DecisionService"
             ) from e
     
+    @staticmethod
+    def _rank_scores(scores: np.ndarray) -> np.ndarray:
+        # Same ranking as Result: 1 + number of strictly higher scores, so ties share a rank.
+        # rankdata(method='min') on the negated scores gives exactly that for every row at once
+        from scipy.stats import rankdata
+        
+        return rankdata(-scores, method='min', axis=1).astype(int)
+    
     def _analyze_ranking_stability(self, rankings: np.ndarray) -> Dict[str, Any]:
         n_alternatives = rankings.shape[1]
         
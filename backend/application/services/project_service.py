@@ -6,6 +6,7 @@ This service is responsible for the persistence, retrieval, and general manageme
 from typing import Dict, List, Any, Optional, Tuple, Set
 import os
 import json
+import numpy as np
 import pandas as pd
 import csv
 
@@ -15,6 +16,8 @@ from domain.entities.criteria import Criteria, OptimizationType, ScaleType
 from openpyxl import Workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
 from domain.entities.project import Project
+from domain.entities.decision_matrix import DecisionMatrix
+from domain.entities.result import Result
 from domain.repositories.project_repository import ProjectRepository
 from application.validators.project_validator import ProjectValidator
 from utils.exceptions import ServiceError, ValidationError, RepositoryError
@@ -23,6 +26,11 @@ from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 
 class ProjectService:
     
@@ -97,6 +105,21 @@ class ProjectService:
                 service_name="ProjectService"
             ) from e
     
+    def get_all_project_summaries(self) -> List[Tuple[str, str, str, str, str, str, int, int, int]]:
+        try:
+            return self._repository.list_summaries()
+            
+        except RepositoryError as e:
+            raise ServiceError(
+                message=f"Error retrieving project summaries from repository: {e.message}",
+                service_name="ProjectService"
+            ) from e
+        except Exception as e:
+            raise ServiceError(
+                message=f"Unexpected error when retrieving project summaries: {str(e)}",
+                service_name="ProjectService"
+            ) from e
+    
     def delete_project(self, project_id: str) -> bool:
         try:
             deleted = self._repository.delete(project_id)
@@ -135,20 +158,29 @@ class ProjectService:
         try:
             original = self.get_project(project_id)
             
-            project_dict = original.to_dict()
-        
-            if 'id' in project_dict:
-                project_dict.pop('id')
+            new_project = Project(
+                name=new_name or f"Copy of {original.name}",
+                description=original.description,
+                decision_maker=original.decision_maker,
+                metadata=original.metadata
+            )
             
-            if new_name:
-                project_dict['name'] = new_name
-            else:
-                project_dict['name'] = f"Copy of {project_dict['name']}"
+            for alt in original.alternatives:
+                new_project.add_alternative(Alternative.from_dict(alt.to_dict()))
+            for crit in original.criteria:
+                new_project.add_criteria(Criteria.from_dict(crit.to_dict()))
             
-            new_project = Project.from_dict(project_dict)
+            # The copy shares the matrix values instead of round-tripping them
+            # through lists; the first set_values on either side copies them
+            matrix = original.decision_matrix
+            if matrix is not None:
+                new_project.set_decision_matrix(matrix.copy_on_write(
+                    alternatives=[new_project.get_alternative_by_id(alt.id) for alt in matrix.alternative],
+                    criteria=[new_project.get_criteria_by_id(crit.id) for crit in matrix.criteria]
+                ))
             
-            # Asegurarse de que el nombre se establece correctamente
-            new_project.name = project_dict['name']
+            for method_name, result in original.results.items():
+                new_project.add_result(method_name, Result.from_dict(result.to_dict()))
             
             saved_project = self.save_project(new_project)
             
@@ -167,10 +199,11 @@ class ProjectService:
     
     def export_to_excel(self, project: Project, file_path: str) -> None:
         try:
-            wb = Workbook()
+            # Write-only mode streams rows to the file instead of keeping a
+            # cell object per value in memory
+            wb = Workbook(write_only=True)
 
-            ws_info = wb.active
-            ws_info.title = "Project Information"
+            ws_info = wb.create_sheet("Project Information")
 
             ws_info.append(["ID", project.id])
             ws_info.append(["Name", project.name])
@@ -210,11 +243,10 @@ class ProjectService:
                 headers = ["Alternative"] + [crit.name for crit in matrix.criteria]
                 ws_matrix.append(headers)
 
-                for i, alt in enumerate(matrix.alternative):
-                    row = [alt.name]
-                    for j in range(len(matrix.criteria)):
-                        row.append(float(matrix.values[i, j]))
-                    ws_matrix.append(row)
+                # One tolist() for the whole block; matrix.values returns a copy
+                # of the array on every access
+                for alt, row in zip(matrix.alternative, matrix.values.tolist()):
+                    ws_matrix.append([alt.name] + row)
                 
             for method_name, result in project.results.items():
                 ws_result = wb.create_sheet(f"Result {method_name}")
@@ -266,8 +298,7 @@ class ProjectService:
                 with open(alt_path, 'w', newline='', encoding='utf-8') as f:
                     writer = csv.writer(f)
                     writer.writerow(["ID", "Name", "Description"])
-                    for alt in project.alternatives:
-                        writer.writerow([alt.id, alt.name, alt.description])
+                    writer.writerows([alt.id, alt.name, alt.description] for alt in project.alternatives)
             
             if project.criteria:
                 crit_path = os.path.join(dir_path, f"{base_name}_criteria.csv")
@@ -275,8 +306,8 @@ class ProjectService:
                     writer = csv.writer(f)
                     writer.writerow(["ID", "Name", "Description", "Optimization Type", 
                                     "Scale Type", "Weight", "Unit"])
-                    for crit in project.criteria:
-                        writer.writerow([
+                    writer.writerows(
+                        [
                             crit.id, 
                             crit.name, 
                             crit.description, 
@@ -284,7 +315,9 @@ class ProjectService:
                             crit.scale_type.value,
                             crit.weight,
                             crit.unit
-                        ])
+                        ]
+                        for crit in project.criteria
+                    )
             
             if project.decision_matrix is not None:
                 matrix = project.decision_matrix
@@ -296,12 +329,12 @@ class ProjectService:
                     headers = ["Alternative"] + [crit.name for crit in matrix.criteria]
                     writer.writerow(headers)
                     
-                    # Data
-                    for i, alt in enumerate(matrix.alternative):
-                        row = [alt.name]
-                        for j in range(len(matrix.criteria)):
-                            row.append(float(matrix.values[i, j]))
-                        writer.writerow(row)
+                    # Data: one bulk tolist() instead of a float() per cell.
+                    # csv is kept over np.savetxt so names with commas stay quoted
+                    writer.writerows(
+                        [alt.name] + row
+                        for alt, row in zip(matrix.alternative, matrix.values.tolist())
+                    )
             
             for method_name, result in project.results.items():
                 result_path = os.path.join(dir_path, f"{base_name}_result_{method_name}.csv")
@@ -320,13 +353,15 @@ class ProjectService:
                     # Sort by score (highest to lowest)
                     sorted_results = result.get_sorted_alternatives()
                     
-                    for alt_result in sorted_results:
-                        writer.writerow([
+                    writer.writerows(
+                        [
                             alt_result['id'],
                             alt_result['name'],
                             alt_result['score'],
                             alt_result['ranking']
-                        ])
+                        ]
+                        for alt_result in sorted_results
+                    )
                     
         except Exception as e:
             # Convert exceptions to ServiceError
@@ -495,12 +530,12 @@ class ProjectService:
 
     def export_to_json(self, project: Project, file_path: str) -> None:
         try:
-            project_dict = project.to_dict()
-            
             os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(project_dict, f, indent=2, ensure_ascii=False)
+            # Sections are serialized and written one at a time so only one of
+            # them is held in memory, instead of the whole project dict
+            with open(file_path, 'wb') as f:
+                self._write_project_json(project, f)
                 
         except Exception as e:
             raise ServiceError(
@@ -508,10 +543,65 @@ class ProjectService:
                 service_name="ProjectService"
             ) from e
     
+    # Rows of the decision matrix serialized per write when exporting to JSON
+    _JSON_MATRIX_CHUNK_ROWS = 1000
+    
+    @staticmethod
+    def _dump_json(value: Any) -> bytes:
+        if orjson is not None:
+            # orjson writes UTF-8 bytes directly and serializes numpy values natively
+            return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(value, ensure_ascii=False).encode('utf-8')
+    
+    def _write_project_json(self, project: Project, f) -> None:
+        """Write the same document as Project.to_dict, one top-level key per line"""
+        dump = self._dump_json
+        
+        f.write(b'{\n')
+        for key, value in (('id', project.id),
+                           ('name', project.name),
+                           ('description', project.description),
+                           ('decision_maker', project.decision_maker),
+                           ('created_at', project.iso_created_at),
+                           ('updated_at', project.iso_updated_at)):
+            f.write(dump(key) + b': ' + dump(value) + b',\n')
+        
+        f.write(b'"alternatives": ' + dump([alt.to_dict() for alt in project.alternatives]) + b',\n')
+        f.write(b'"criteria": ' + dump([crit.to_dict() for crit in project.criteria]) + b',\n')
+        f.write(b'"metadata": ' + dump(project.metadata) + b',\n')
+        
+        f.write(b'"results": {')
+        for i, (method_name, result) in enumerate(project.results.items()):
+            if i:
+                f.write(b',')
+            f.write(b'\n' + dump(method_name) + b': ' + dump(result.to_dict(numpy_arrays=orjson is not None)))
+        f.write(b'}')
+        
+        matrix = project.decision_matrix
+        if matrix is not None:
+            f.write(b',\n"decision_matrix": {')
+            f.write(b'"name": ' + dump(matrix.name) + b', ')
+            f.write(b'"alternatives": ' + dump([alt.to_dict() for alt in matrix.alternative]) + b', ')
+            f.write(b'"criteria": ' + dump([crit.to_dict() for crit in matrix.criteria]) + b', ')
+            f.write(b'"values": [')
+            for i, chunk in enumerate(matrix.iter_value_chunks(self._JSON_MATRIX_CHUNK_ROWS)):
+                if i:
+                    f.write(b',')
+                # Drop the outer brackets so consecutive chunks form one array
+                f.write(b'\n' + dump(chunk if orjson is not None else chunk.tolist())[1:-1])
+            f.write(b']}')
+        
+        f.write(b'\n}\n')
+    
     def import_from_json(self, file_path: str) -> Project:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                project_dict = json.load(f)
+            if orjson is not None:
+                # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+                with open(file_path, 'rb') as f:
+                    project_dict = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    project_dict = json.load(f)
             
             if not isinstance(project_dict, dict):
                 raise ValidationError(
@@ -758,30 +848,32 @@ class ProjectService:
             # Read decision matrix
             matrix_path = os.path.join(dir_path, f"{base_name}_matrix.csv")
             if os.path.exists(matrix_path) and project.alternatives and project.criteria:
-                matrix = project.create_decision_matrix()
+                alternatives = project.alternatives
+                criteria = project.criteria
+                values = np.zeros((len(alternatives), len(criteria)))
                 
-                with open(matrix_path, 'r', newline='', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    headers = next(reader)  
-
-                    for i, row in enumerate(reader):
-                        if len(row) > 1:
-                            alt_name = row[0]
-                            
-                            alt_idx = None
-                            for j, alt in enumerate(project.alternatives):
-                                if alt.name == alt_name:
-                                    alt_idx = j
-                                    break
-                            
-                            if alt_idx is not None:
-                                for j in range(1, min(len(row), len(project.criteria) + 1)):
-                                    try:
-                                        value = float(row[j])
-                                        matrix.set_values(alt_idx, j - 1, value)
-                                    except (ValueError, IndexError):
-                                        
-                                        pass
+                # Every cell is read as text, so names like "001" or "NA" match
+                # exactly; only the numeric block is then parsed, in one vectorized
+                # pass, and cells that are not numbers keep the default value
+                df = pd.read_csv(matrix_path, encoding='utf-8', dtype=str, keep_default_na=False)
+                block = df.iloc[:, 1:len(criteria) + 1].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+                
+                alt_idx_by_name = {}
+                for idx, alt in enumerate(alternatives):
+                    alt_idx_by_name.setdefault(alt.name, idx)
+                
+                for alt_name, row in zip(df.iloc[:, 0].tolist(), block):
+                    alt_idx = alt_idx_by_name.get(alt_name)
+                    if alt_idx is not None:
+                        known = ~np.isnan(row)
+                        values[alt_idx, :len(row)][known] = row[known]
+                
+                project.set_decision_matrix(DecisionMatrix(
+                    name=f"{project.name} - Decision Matrix",
+                    alternatives=alternatives,
+                    criteria=criteria,
+                    values=values
+                ))
             
             return project
                 
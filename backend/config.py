@@ -22,10 +22,6 @@ class BaseConfig:
     UPLOAD_FOLDER = os.path.join(BASE_DIR, "uploads")
     LOG_DIR = os.path.join(BASE_DIR, "logs")
     
-    # Ensure necessary directories exist
-    for directory in [DATA_DIR, UPLOAD_FOLDER, LOG_DIR]:
-        os.makedirs(directory, exist_ok=True)
-    
     # Logging
     LOG_LEVEL = logging.INFO
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -48,6 +44,9 @@ class BaseConfig:
     # Persistence
     PROJECTS_DIR = os.path.join(DATA_DIR, "projects")
     
+    # Worker processes for MCDM methods on large matrices (1 = serial, None = one per CPU)
+    DECISION_WORKERS = 1
+    
     # User interface
     ITEMS_PER_PAGE = 20
     DEFAULT_LANGUAGE = "es"
@@ -107,6 +106,12 @@ class BaseConfig:
             "colors": ["#f7fbff", "#08306b"]
         }
     }
+    
+    @classmethod
+    def ensure_dirs(cls):
+        """Create the data, upload and log directories (called by main.py when the app is set up, not on import)."""
+        for directory in [cls.DATA_DIR, cls.UPLOAD_FOLDER, cls.LOG_DIR]:
+            os.makedirs(directory, exist_ok=True)
 
 
 class DevelopmentConfig(BaseConfig):
@@ -130,10 +135,6 @@ class TestingConfig(BaseConfig):
     UPLOAD_FOLDER = os.path.join(BaseConfig.BASE_DIR, "test_uploads")
     LOG_DIR = os.path.join(BaseConfig.BASE_DIR, "test_logs")
     
-    # Ensure necessary directories exist
-    for directory in [DATA_DIR, UPLOAD_FOLDER, LOG_DIR]:
-        os.makedirs(directory, exist_ok=True)
-    
     # Test database
     PROJECTS_DIR = os.path.join(DATA_DIR, "projects")
 
@@ -164,14 +165,38 @@ config_by_name = {
 active_config = config_by_name[os.environ.get('FLASK_ENV', 'development')]
 
 
+_MISSING = object()
+
+
 # Global access to configuration
 class Config(object):
+    # Values read from the active configuration, dropped when it changes
+    _cache = {}
+    _cache_config = None
+    
     def __getattr__(name):
         return getattr(active_config, name)
     
     @classmethod
     def get(cls, name, default=None):
-        return getattr(active_config, name, default)
+        if cls._cache_config is not active_config:
+            cls._cache.clear()
+            cls._cache_config = active_config
+        try:
+            return cls._cache[name]
+        except KeyError:
+            pass
+        
+        value = getattr(active_config, name, _MISSING)
+        if value is _MISSING:
+            # Defaults are per call, so only found values are cached
+            return default
+        cls._cache[name] = value
+        return value
+    
+    @classmethod
+    def ensure_dirs(cls):
+        active_config.ensure_dirs()
     
     @classmethod
     def set_env(cls, env_name):
@@ -180,4 +205,5 @@ class Config(object):
         if env_name not in config_by_name:
             raise ValueError(f"Invalid configuration environment: {env_name}")
             
-        active_config = config_by_name[env_name]
\ No newline at end of file
+        active_config = config_by_name[env_name]
+        cls._cache.clear()
\ No newline at end of file
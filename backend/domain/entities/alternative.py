@@ -5,11 +5,15 @@
 """
 
 class Alternative:
+    __slots__ = ('_id', '_name', '_description', '_metadata', '_dict_cache')
+
     def __init__(self, id, name, description="", metadata=None):
         self._id = id
         self._name = name
         self._description = description
         self._metadata = metadata or {}
+        # to_dict() output, dropped by every setter
+        self._dict_cache = None
 
     @property
     def id(self):
@@ -22,6 +26,7 @@ class Alternative:
     @name.setter
     def name(self, value):
         self._name = value
+        self._dict_cache = None
 
     @property
     def description(self):
@@ -30,6 +35,7 @@ class Alternative:
     @description.setter
     def description(self, value):
         self._description = value
+        self._dict_cache = None
     
     @property
     def metadata(self):
@@ -37,6 +43,7 @@ class Alternative:
     
     def set_metadata(self, key, value):
         self._metadata[key] = value
+        self._dict_cache = None
     
     def get_metadata(self, key, default=None):
         return self._metadata.get(key, default)
@@ -48,12 +55,15 @@ class Alternative:
         return f"Alternative(id='{self._id}', name='{self._name}', description='{self._description[:20]}{'...' if len(self._description) > 20 else ''}')"
     
     def to_dict(self):
-        return {
-            'id': self._id,
-            'name': self._name,
-            'description': self._description,
-            'metadata': self._metadata
-        }
+        # Built once until a field changes; callers get a copy so they cannot alter the cache
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'id': self._id,
+                'name': self._name,
+                'description': self._description,
+                'metadata': self._metadata
+            }
+        return dict(self._dict_cache)
     
     @classmethod
     def from_dict(cls, data):
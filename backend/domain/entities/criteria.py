@@ -5,6 +5,7 @@
 """
 
 from enum import Enum
+from itertools import count
 
 class OptimizationType(Enum):
     """ This define the type of optimization for a criteria """
@@ -17,13 +18,20 @@ class ScaleType(Enum):
     QUALITATIVE = 'qualitative'         # Categorical Data
     FUZZY = 'fuzzy'                     # Fuzzy Data
 
+# Source of Criteria versions; next() on a count is atomic, so concurrent edits
+# never hand out the same version twice
+_versions = count()
+
 class Criteria:
+    __slots__ = ('_id', '_name', '_description', '_optimization_type', '_scale_type',
+                 '_weight', '_unit', '_metadata', '_dict_cache', '_version')
 
     def __init__(self, id, name, description="",
                  optimization_type=OptimizationType.MAXIMIZE,
                  scale_type=ScaleType.QUANTITATIVE, weight=1.0,
                  unit="", metadata=None):
-        self._id = id
+        # IDs are always strings, so lookups and matrix keys never need str()
+        self._id = str(id)
         self._name = name
         self._description = description
         self._optimization_type = optimization_type
@@ -31,11 +39,20 @@ class Criteria:
         self._weight = weight
         self._unit = unit
         self._metadata = metadata or {}
+        # to_dict() output, dropped by every setter
+        self._dict_cache = None
+        # Unique across all criteria and replaced whenever the weight or optimization
+        # type changes, so arrays derived from them (see DecisionMatrix) can tell they are stale
+        self._version = next(_versions)
     
     @property
     def id(self):
         return self._id
     
+    @property
+    def version(self):
+        return self._version
+    
     @property
     def name(self):
         return self._name
@@ -43,6 +60,7 @@ class Criteria:
     @name.setter
     def name(self, value):
         self._name = value
+        self._dict_cache = None
     
     @property
     def description(self):
@@ -51,6 +69,7 @@ class Criteria:
     @description.setter
     def description(self, value):
         self._description = value or ""
+        self._dict_cache = None
     
     @property
     def optimization_type(self):
@@ -60,6 +79,8 @@ class Criteria:
     @optimization_type.setter
     def optimization_type(self, value):
         self._optimization_type = value
+        self._dict_cache = None
+        self._version = next(_versions)
 
     @property
     def scale_type(self):
@@ -68,6 +89,7 @@ class Criteria:
     @scale_type.setter
     def scale_type(self, value):
         self._scale_type = value
+        self._dict_cache = None
     
     @property
     def weight(self):
@@ -76,6 +98,8 @@ class Criteria:
     @weight.setter
     def weight(self, value):
         self._weight = value
+        self._dict_cache = None
+        self._version = next(_versions)
     
     @property
     def unit(self):
@@ -84,6 +108,7 @@ class Criteria:
     @unit.setter
     def unit(self, value):
         self._unit = value
+        self._dict_cache = None
 
     @property
     def metadata(self):
@@ -91,6 +116,7 @@ class Criteria:
     
     def set_metadata(self, key, value):
         self._metadata[key] = value
+        self._dict_cache = None
     
     def get_metadata(self, key, default=None):
         return self._metadata.get(key, default)
@@ -109,16 +135,19 @@ class Criteria:
                 f"opt_type={self._optimization_type.value}, weight={self._weight}")
     
     def to_dict(self):
-        return {
-            'id': self._id,
-            'name': self._name,
-            'description': self._description,
-            'optimization_type': self._optimization_type.value,
-            'scale_type': self._scale_type.value,
-            'weight': self._weight,
-            'unit': self._unit,
-            'metadata': self._metadata
-        }
+        # Built once until a field changes; callers get a copy so they cannot alter the cache
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'id': self._id,
+                'name': self._name,
+                'description': self._description,
+                'optimization_type': self._optimization_type.value,
+                'scale_type': self._scale_type.value,
+                'weight': self._weight,
+                'unit': self._unit,
+                'metadata': self._metadata
+            }
+        return dict(self._dict_cache)
     
     @classmethod
     def from_dict(cls, data):
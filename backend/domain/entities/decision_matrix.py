@@ -3,7 +3,8 @@
     The decision matrix contains the values of evaluation for each alternative respect to each criterian
 """
 
-from typing import Dict, List, Optional, Union, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Union, Tuple, Any
+import copy
 import numpy as np
 from domain.entities.alternative import Alternative
 from domain.entities.criteria import Criteria
@@ -17,6 +18,12 @@ class DecisionMatrix:
         self._name = name if name is not None else "Decision Matrix"
         self._alternatives = alternatives
         self._criteria = criteria
+        # ID -> position maps, built on first lookup and rebuilt when found stale
+        self._alt_index: Optional[Dict[str, int]] = None
+        self._crit_index: Optional[Dict[str, int]] = None
+        # (Criteria versions, weights, maximize mask), built on first use and
+        # rebuilt when one of this matrix's criteria is added, removed or edited
+        self._criteria_arrays: Optional[Tuple[Tuple[int, ...], np.ndarray, np.ndarray]] = None
 
         if values is None:
             self._values = np.zeros((len(alternatives), len(criteria)))
@@ -41,37 +48,147 @@ class DecisionMatrix:
     def criteria(self) -> List[Criteria]:
         return list(self._criteria)
     
+    def _get_criteria_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        versions = tuple([crit.version for crit in self._criteria])
+        cached = self._criteria_arrays
+        if cached is None or cached[0] != versions:
+            weights = np.array([crit.weight for crit in self._criteria], dtype=np.float64)
+            maximize = np.array([crit.is_benefit_criteria() for crit in self._criteria],
+                                dtype=np.bool_)
+            # Shared between calls, so callers get read-only arrays
+            weights.flags.writeable = False
+            maximize.flags.writeable = False
+            cached = (versions, weights, maximize)
+            self._criteria_arrays = cached
+        return cached[1], cached[2]
+    
+    @property
+    def weights_array(self) -> np.ndarray:
+        """Read-only float64 array with the weight of each criteria"""
+        return self._get_criteria_arrays()[0]
+    
+    @property
+    def maximize_mask(self) -> np.ndarray:
+        """Read-only boolean array, True for the criteria to maximize"""
+        return self._get_criteria_arrays()[1]
+    
     @property
     def values(self) -> np.ndarray:
         return self._values.copy()
     
+    def values_view(self) -> np.ndarray:
+        """Read-only view of the values, for callers that do not need their own copy"""
+        view = self._values.view()
+        view.flags.writeable = False
+        return view
+    
     @property
     def shape(self) -> Tuple[int,int]:
         return self._values.shape
     
+    @property
+    def size(self) -> int:
+        return self._values.size
+    
+    @property
+    def dtype(self) -> np.dtype:
+        return self._values.dtype
+    
+    def to_bytes(self) -> bytes:
+        """Raw C-ordered buffer of the values, without the copy made by the values property"""
+        return self._values.tobytes(order='C')
+    
+    def iter_value_chunks(self, chunk_size: int = 1000) -> Iterator[np.ndarray]:
+        """Yield copies of consecutive blocks of at most chunk_size rows"""
+        for start in range(0, self._values.shape[0], chunk_size):
+            yield self._values[start:start + chunk_size].copy()
+    
     def get_values(self, alternative_idx: int, criteria_idx: int) -> float:
         return self._values[alternative_idx, criteria_idx]
     
     def set_values(self, alternative_idx: int, criteria_idx: int, value: float) -> None:
+        if not self._values.flags.writeable:
+            # Values shared by copy_on_write; take a private copy on the first write
+            self._values = self._values.copy()
         self._values[alternative_idx, criteria_idx] = value
     
+    def set_values_bulk(self, alternative_indices: np.ndarray, criteria_indices: np.ndarray,
+                        values: np.ndarray) -> int:
+        """
+        Set many cells in one fancy-indexed assignment (later duplicates win)
+        
+        Returns:
+            Number of distinct cells whose value changed
+        """
+        previous = self._values[alternative_indices, criteria_indices]
+        if not self._values.flags.writeable:
+            self._values = self._values.copy()
+        self._values[alternative_indices, criteria_indices] = values
+        
+        current = self._values[alternative_indices, criteria_indices]
+        changed = ~((previous == current) | (np.isnan(previous) & np.isnan(current)))
+        if not changed.any():
+            return 0
+        cells = np.ravel_multi_index(
+            (alternative_indices[changed], criteria_indices[changed]), self._values.shape)
+        return int(np.unique(cells).size)
+    
+    def copy_on_write(self, alternatives: Optional[List[Alternative]] = None,
+                      criteria: Optional[List[Criteria]] = None) -> 'DecisionMatrix':
+        """Copy that shares the values buffer until either matrix writes to it"""
+        shared = self._values.view()
+        shared.flags.writeable = False
+        self._values = shared
+        
+        clone = copy.copy(self)
+        clone._alternatives = list(self._alternatives if alternatives is None else alternatives)
+        clone._criteria = list(self._criteria if criteria is None else criteria)
+        clone._alt_index = None
+        clone._crit_index = None
+        clone._criteria_arrays = None
+        return clone
+    
     def get_alternative_values(self, alternative_idx: int) -> np.ndarray:
         return self._values[alternative_idx, :].copy()
     
     def get_criteria_values(self, criteria_idx: int) -> np.ndarray:
         return self._values[:, criteria_idx].copy()
     
+    @staticmethod
+    def _build_index(items: List[Any]) -> Dict[str, int]:
+        # First occurrence wins, like the linear scans this replaces
+        index: Dict[str, int] = {}
+        for idx, item in enumerate(items):
+            index.setdefault(item.id, idx)
+        return index
+    
+    def index_of_alternative(self, alternative_id: str) -> int:
+        idx = self._alt_index.get(alternative_id) if self._alt_index is not None else None
+        # A hit is checked against the list, which callers may have changed in place
+        if idx is None or idx >= len(self._alternatives) or self._alternatives[idx].id != alternative_id:
+            self._alt_index = self._build_index(self._alternatives)
+            idx = self._alt_index.get(alternative_id)
+            if idx is None:
+                raise ValueError(f"Dont find any alternative with ID: {alternative_id}")
+        return idx
+    
+    def index_of_criteria(self, criteria_id: str) -> int:
+        criteria_id = str(criteria_id)  # Criteria IDs are stored as strings
+        idx = self._crit_index.get(criteria_id) if self._crit_index is not None else None
+        if idx is None or idx >= len(self._criteria) or self._criteria[idx].id != criteria_id:
+            self._crit_index = self._build_index(self._criteria)
+            idx = self._crit_index.get(criteria_id)
+            if idx is None:
+                raise ValueError(f"Don't find any criteria with ID: {criteria_id}")
+        return idx
+    
     def get_alternative_by_id(self, alternative_id: str) -> Tuple[int, Alternative]:
-        for idx, alt in enumerate(self._alternatives):
-            if alt.id == alternative_id:
-                return idx, alt
-        raise ValueError(f"Dont find any alternative with ID: {alternative_id}")
+        idx = self.index_of_alternative(alternative_id)
+        return idx, self._alternatives[idx]
     
-    def get_criteria_by_id(self, criteria_id: str) -> Tuple[int, Criteria]:  # Cambiar int a str
-        for idx, ct in enumerate(self._criteria):
-            if str(ct.id) == str(criteria_id):  # Convertir ambos a string para comparación
-                return idx, ct
-        raise ValueError(f"Don't find any criteria with ID: {criteria_id}")
+    def get_criteria_by_id(self, criteria_id: str) -> Tuple[int, Criteria]:
+        idx = self.index_of_criteria(criteria_id)
+        return idx, self._criteria[idx]
     
     def add_alternative(self, alternative: Alternative, values: Optional[List[float]] = None) -> None:
         if values is not None and len(values) != len(self._criteria):
@@ -92,6 +209,7 @@ class DecisionMatrix:
             raise ValueError(f"The lenght of the values ({len(values)}) doesn't match with the number of alternatives ({len(self._alternatives)})")
         
         self._criteria.append(criteria)
+        self._criteria_arrays = None
 
         #Prepare and add the new column to the matrix
         new_col = np.zeros(len(self._alternatives)) if values is None else np.array(values, dtype=float)
@@ -99,10 +217,13 @@ class DecisionMatrix:
     
     def remove_alternative(self, alternative_idx: int) -> None:
         self._alternatives.pop(alternative_idx)
+        self._alt_index = None
         self._values = np.delete(self._values, alternative_idx, axis=0)
     
     def remove_criteria(self, criteria_idx: int) -> None:
         self._criteria.pop(criteria_idx)
+        self._crit_index = None
+        self._criteria_arrays = None
         self._values = np.delete(self._values, criteria_idx, axis=1)
     
     def normalize(self, method: str = 'minimax') -> 'DecisionMatrix':
@@ -123,7 +244,7 @@ class DecisionMatrix:
         )
 
     def weighted_matrix(self) -> 'DecisionMatrix':
-        weights = np.array([criteria.weight  for criteria in self._criteria])
+        weights = self.weights_array
 
         # Normalize the weights so that they sum 1
         sum_weights = np.sum(weights)
@@ -22,8 +22,16 @@ class Project:
         self._decision_maker = decision_maker
         self._created_at = datetime.now()
         self._updated_at = self._created_at
+        # (timestamp, isoformat) pairs; recomputed only when the timestamp is replaced
+        self._created_at_iso: Optional[Tuple[datetime, str]] = None
+        self._updated_at_iso: Optional[Tuple[datetime, str]] = None
         self._alternatives: List[Alternative] = []
         self._criteria: List[Criteria] = []
+        # ID indexes kept in sync with the lists above for O(1) lookups
+        self._alt_by_id: Dict[str, Alternative] = {}
+        self._crit_by_id: Dict[str, Criteria] = {}
+        # Bumped whenever alternatives or criteria are added or removed
+        self._structure_version = 0
         self._decision_matrix: Optional[DecisionMatrix] = None
         self._results: Dict[str, Result] = {}
         self._metadata = metadata or {}
@@ -72,6 +80,18 @@ class Project:
     def updated_at(self) -> datetime:
         return self._updated_at
     
+    @property
+    def iso_created_at(self) -> str:
+        if self._created_at_iso is None or self._created_at_iso[0] is not self._created_at:
+            self._created_at_iso = (self._created_at, self._created_at.isoformat())
+        return self._created_at_iso[1]
+    
+    @property
+    def iso_updated_at(self) -> str:
+        if self._updated_at_iso is None or self._updated_at_iso[0] is not self._updated_at:
+            self._updated_at_iso = (self._updated_at, self._updated_at.isoformat())
+        return self._updated_at_iso[1]
+    
     @property
     def alternatives(self) -> List[Alternative]:
         return list(self._alternatives)
@@ -80,6 +100,10 @@ class Project:
     def criteria(self) -> List[Criteria]:
         return list(self._criteria)
     
+    @property
+    def structure_version(self) -> int:
+        return self._structure_version
+    
     @property
     def decision_matrix(self) -> Optional[DecisionMatrix]:
         return self._decision_matrix
@@ -101,10 +125,12 @@ class Project:
 
     def add_alternative(self, alternative: Alternative) -> None:
         # Verifica si ya existe una alternativa con el mismo ID
-        if any(alt.id == alternative.id for alt in self._alternatives):
+        if alternative.id in self._alt_by_id:
             raise ValueError(f"Already exists an alternative with ID: {alternative.id}")
         
         self._alternatives.append(alternative)
+        self._alt_by_id[alternative.id] = alternative
+        self._structure_version += 1
         self._updated_at = datetime.now()
 
         # Actualización segura de la matriz de decisión
@@ -114,60 +140,59 @@ class Project:
             except Exception as e:
                 # Si falla la actualización de la matriz, revertimos la operación
                 self._alternatives.pop()
+                del self._alt_by_id[alternative.id]
                 raise ValueError(f"Error updating decision matrix: {str(e)}")
         
     def add_criteria(self, criteria: Criteria) -> None:
         # Verify if already existe a criteria with the same ID
-        if any(crit.id == criteria.id for crit in self._criteria):
+        if criteria.id in self._crit_by_id:
             raise ValueError(f"Already exist a criteria with ID: {criteria.id}")
         
         self._criteria.append(criteria)
+        self._crit_by_id[criteria.id] = criteria
+        self._structure_version += 1
         self._updated_at = datetime.now()
 
         if self._decision_matrix is not None:
             self._decision_matrix.add_criteria(criteria)
     
     def remove_alternative(self, alternative_id: str) -> None:
-        for i, alt in enumerate(self._alternatives):
-            if alt.id == alternative_id:
-                self._alternatives.pop(i)
-                self._updated_at = datetime.now()
-
-                if self._decision_matrix is not None:
-                    alt_idx, _ = self._decision_matrix.get_alternative_by_id(alternative_id)
-                    self._decision_matrix.remove_alternative(alt_idx)
-                
-                return
+        alt = self._alt_by_id.pop(alternative_id, None)
+        if alt is None:
+            raise ValueError(f"No alternative were found with the ID: {alternative_id}")
         
-        raise ValueError(f"No alternative were found with the ID: {alternative_id}")
+        self._alternatives.remove(alt)
+        self._structure_version += 1
+        self._updated_at = datetime.now()
+
+        if self._decision_matrix is not None:
+            alt_idx, _ = self._decision_matrix.get_alternative_by_id(alternative_id)
+            self._decision_matrix.remove_alternative(alt_idx)
     
     def remove_criteria(self, criteria_id: str) -> None:
-        for i, crit in enumerate(self._criteria):
-            if crit.id == criteria_id:
-                self._criteria.pop(i)
-                self._updated_at = datetime.now()
-                
-                if self._decision_matrix is not None:
-                    crit_idx, _ = self._decision_matrix.get_criteria_by_id(criteria_id)
-                    self._decision_matrix.remove_criteria(crit_idx)
-                
-                return
+        crit = self._crit_by_id.pop(str(criteria_id), None)
+        if crit is None:
+            raise ValueError(f"No criteria were found with the ID: {criteria_id}")
         
-        raise ValueError(f"No criteria were found with the ID: {criteria_id}")
+        self._criteria.remove(crit)
+        self._structure_version += 1
+        self._updated_at = datetime.now()
+        
+        if self._decision_matrix is not None:
+            crit_idx, _ = self._decision_matrix.get_criteria_by_id(criteria_id)
+            self._decision_matrix.remove_criteria(crit_idx)
     
     def get_alternative_by_id(self, alternative_id: str) -> Alternative:
-        for alt in self._alternatives:
-            if alt.id == alternative_id:
-                return alt
-            
-        raise ValueError(f"No alternative were found with the ID: {alternative_id}")
+        try:
+            return self._alt_by_id[alternative_id]
+        except KeyError:
+            raise ValueError(f"No alternative were found with the ID: {alternative_id}")
 
     def get_criteria_by_id(self, criteria_id: str) -> Criteria:
-        for crit in self._criteria:
-            if crit.id == criteria_id:
-                return crit
-        
-        raise ValueError(f"No criteria were found with the ID: {criteria_id}")
+        try:
+            return self._crit_by_id[str(criteria_id)]
+        except KeyError:
+            raise ValueError(f"No criteria were found with the ID: {criteria_id}")
     
     def create_decision_matrix(self) -> None:
         """Crear matriz de decisión con alternativas y criterios actuales"""
@@ -247,21 +272,13 @@ class Project:
         
         # Calcular correlaciones
         if len(rankings) >= 2:
-            import numpy as np
-            from scipy.stats import spearmanr, kendalltau
-            
-            method_list = list(rankings.keys())
-            n_methods = len(method_list)
-            
-            # Matriz de correlación
-            corr_matrix = np.zeros((n_methods, n_methods))
+            from scipy.stats import rankdata
             
-            for i in range(n_methods):
-                for j in range(n_methods):
-                    rank1 = rankings[method_list[i]]
-                    rank2 = rankings[method_list[j]]
-                    corr, _ = spearmanr(rank1, rank2)
-                    corr_matrix[i, j] = corr
+            # Spearman para todos los pares a la vez: Pearson sobre los rangos
+            # promedio de cada método (lo mismo que spearmanr par a par)
+            ranked = rankdata(np.vstack(list(rankings.values())), axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr_matrix = np.corrcoef(ranked)
             
             comparison['correlation_matrix'] = corr_matrix.tolist()
             
@@ -274,8 +291,8 @@ class Project:
             'name': self._name,
             'description': self._description,
             'decision_maker': self._decision_maker,
-            'created_at': self._created_at.isoformat(),
-            'updated_at': self._updated_at.isoformat(),
+            'created_at': self.iso_created_at,
+            'updated_at': self.iso_updated_at,
             'alternatives': [alt.to_dict() for alt in self._alternatives],
             'criteria': [crit.to_dict() for crit in self._criteria],
             'metadata': self._metadata,
@@ -300,14 +317,22 @@ class Project:
         try:
             project._created_at = datetime.fromisoformat(data['created_at'])
             project._updated_at = datetime.fromisoformat(data['updated_at'])
+            # The stored strings were written by isoformat(), so listings reuse
+            # them instead of formatting the dates again
+            project._created_at_iso = (project._created_at, data['created_at'])
+            project._updated_at_iso = (project._updated_at, data['updated_at'])
         except (ValueError, TypeError, KeyError):
             pass
 
         for alt_data in data.get('alternatives', []):
-            project._alternatives.append(Alternative.from_dict(alt_data))
+            alternative = Alternative.from_dict(alt_data)
+            project._alternatives.append(alternative)
+            project._alt_by_id[alternative.id] = alternative
         
         for crit_data in data.get('criteria', []):
-            project._criteria.append(Criteria.from_dict(crit_data))
+            criteria = Criteria.from_dict(crit_data)
+            project._criteria.append(criteria)
+            project._crit_by_id[criteria.id] = criteria
         
         if 'decision_matrix' in data:
             project._decision_matrix = DecisionMatrix.from_dict(data['decision_matrix'])
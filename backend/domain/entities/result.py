@@ -7,6 +7,7 @@
 from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
 from datetime import datetime
+from utils.ranking import rank_desc
 
 class Result:  
     def __init__(self, method_name: str, alternative_ids: List[str],
@@ -26,29 +27,11 @@ class Result:
         # Calculate the rankings from the scores
         self._rankings = self._calculate_rankings()
 
-    def _calculate_rankings(self) -> np.ndarray:
-        # get the descending order (argsort returns the ascending order, that's why we invest with [::-1])
-        sorted_indices = np.argsort(self._scores)[::-1]
-
-        rankings = np.zeros_like(self._scores, dtype=int)
-
-        current_rank = 1
-        previous_score = None
+        # Presentation dict built by the controller, dropped whenever the result changes
+        self._formatted_cache: Optional[Dict[str, Any]] = None
 
-        for i, idx in enumerate(sorted_indices):
-            current_score = self._scores[idx]
-
-            # If it is the first element or if the score is different from the previous one
-            if previous_score is None or current_score != previous_score:
-                current_rank = i + 1    # Asign new ranking (actual position + 1)
-            
-            # Asign ranking to the alternative
-            rankings[idx] = current_rank
-
-            # Update previous score
-            previous_score = current_score
-        
-        return rankings
+    def _calculate_rankings(self) -> np.ndarray:
+        return rank_desc(self._scores)
     
     @property
     def method_name(self) -> str:
@@ -203,21 +186,36 @@ class Result:
     
     def set_metadata(self, key: str, value: Any) -> None:
         self._metadata[key] = value
+        self._formatted_cache = None
     
     def get_metadata(self, key: str, default: Any = None) -> Any:
         return self._metadata.get(key, default)
     
-    def to_dict(self) -> Dict[str, Any]:
+    def get_formatted_view(self) -> Optional[Dict[str, Any]]:
+        """Presentation dict stored with set_formatted_view, or None if the result changed since"""
+        return self._formatted_cache
+    
+    def set_formatted_view(self, formatted: Dict[str, Any]) -> None:
+        self._formatted_cache = formatted
+    
+    def to_dict(self, numpy_arrays: bool = False) -> Dict[str, Any]:
+        # numpy_arrays keeps scores, rankings and array metadata as arrays for
+        # encoders that serialize them natively (orjson), skipping the
+        # tolist() round-trip
+        metadata = self._metadata
+        if not numpy_arrays:
+            metadata = {key: value.tolist() if isinstance(value, np.ndarray) else value
+                        for key, value in metadata.items()}
         return {
             'method_name': self._method_name,
             'alternative_ids': self._alternative_ids,
             'alternative_names': self._alternative_names,
-            'scores': self._scores.tolist(),
-            'rankings': self._rankings.tolist(),
+            'scores': self._scores if numpy_arrays else self._scores.tolist(),
+            'rankings': self._rankings if numpy_arrays else self._rankings.tolist(),
             'execution_time': self._execution_time,
             'parameters': self._parameters,
             'created_at': self._created_at.isoformat(),
-            'metadata': self._metadata
+            'metadata': metadata
         }
     
     @classmethod
@@ -235,6 +233,7 @@ class Result:
         if 'created_at' in data:
             try:
                 result._created_at = datetime.fromisoformat(data['created_at'])
+                result._formatted_cache = None
             except (ValueError, TypeError):
                 # If there is an error parsing the date, leave the current date
                 pass
@@ -1,5 +1,5 @@
 from abc import ABC,abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from domain.entities.project import Project
 
@@ -27,4 +27,25 @@ class ProjectRepository(ABC):
     
     @abstractmethod
     def search(self, query: str) -> List[Project]:
-        pass
\ No newline at end of file
+        pass
+    
+    def list_summaries(self) -> List[Tuple[str, str, str, str, str, str, int, int, int]]:
+        """
+        Returns one (id, name, description, decision_maker, created_at, updated_at,
+        n_alternatives, n_criteria, n_results) tuple per project, with dates as ISO
+        strings. Repositories that can count without building projects should override it.
+        """
+        return [
+            (
+                project.id,
+                project.name,
+                project.description,
+                project.decision_maker,
+                project.iso_created_at,
+                project.iso_updated_at,
+                len(project.alternatives),
+                len(project.criteria),
+                len(project.results)
+            )
+            for project in self.get_all()
+        ]
\ No newline at end of file
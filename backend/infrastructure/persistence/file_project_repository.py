@@ -7,7 +7,7 @@ the persistence mechanism.
 import os
 import json
 import glob
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import re
 import logging
 
@@ -15,8 +15,33 @@ from domain.repositories.project_repository import ProjectRepository
 from domain.entities.project import Project
 from utils.exceptions import RepositoryError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _read_json(file_path: str) -> Any:
+    if orjson is not None:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(file_path: str, data: Any) -> None:
+    if orjson is not None:
+        # Same 2-space layout as json.dump(indent=2); orjson always writes UTF-8
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                                 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 class FileProjectRepository(ProjectRepository):
     
     def __init__(self, base_dir: str = "data/projects"):
@@ -43,8 +68,7 @@ class FileProjectRepository(ProjectRepository):
             
             # Guardar con escritura atómica
             temp_path = file_path + '.tmp'
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(project_dict, f, indent=2, ensure_ascii=False)
+            _write_json(temp_path, project_dict)
             
             # Reemplazar archivo existente
             os.replace(temp_path, file_path)
@@ -68,8 +92,7 @@ class FileProjectRepository(ProjectRepository):
             if not os.path.exists(file_path):
                 return None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                project_dict = json.load(f)
+            project_dict = _read_json(file_path)
             
             # CORRECCIÓN: from_dict ya maneja la deserialización de DecisionMatrix
             return Project.from_dict(project_dict)
@@ -87,8 +110,7 @@ class FileProjectRepository(ProjectRepository):
             pattern = os.path.join(self._base_dir, "project_*.json")
             for file_path in glob.glob(pattern):
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        project_dict = json.load(f)
+                    project_dict = _read_json(file_path)
                     
                     project = Project.from_dict(project_dict)
                     projects.append(project)
@@ -104,6 +126,39 @@ class FileProjectRepository(ProjectRepository):
                 cause=e
             )
     
+    def list_summaries(self) -> List[Tuple[str, str, str, str, str, str, int, int, int]]:
+        """Read project summaries straight from the JSON files without building Project objects"""
+        try:
+            summaries = []
+            
+            pattern = os.path.join(self._base_dir, "project_*.json")
+            for file_path in glob.glob(pattern):
+                try:
+                    data = _read_json(file_path)
+                    
+                    summaries.append((
+                        data['id'],
+                        data['name'],
+                        data.get('description', ''),
+                        data.get('decision_maker', ''),
+                        data.get('created_at', ''),
+                        data.get('updated_at', ''),
+                        len(data.get('alternatives', [])),
+                        len(data.get('criteria', [])),
+                        len(data.get('results', {}))
+                    ))
+                    
+                except Exception as e:
+                    print(f"Error loading project summary from {file_path}: {str(e)}")
+            
+            return summaries
+            
+        except Exception as e:
+            raise RepositoryError(
+                message=f"Error retrieving project summaries: {str(e)}",
+                cause=e
+            )
+    
     def delete(self, project_id: str) -> bool:
         try:
             file_path = os.path.join(self._base_dir, f"project_{project_id}.json")
@@ -5,15 +5,16 @@ This module initializes all system components and provides
 a REST API for the frontend to interact with the backend
 """
 
+import atexit
 import os
-import json
-from flask import Flask, request, jsonify, send_from_directory
+from collections.abc import Sequence
+from flask import Flask, Response, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 from datetime import datetime
-import numpy as np
-from infrastructure.persistence.file_project_repository import FileProjectRepository
-from presentation.controllers.main_controller import MainController
-from utils.exceptions import ServiceError
+
+from config import Config
+from utils.exceptions import ControllerError
 
 app = Flask(__name__, static_folder='frontend/build')
 
@@ -23,9 +24,90 @@ ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls', 'json'}
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+Config.ensure_dirs()
+
+# Compress large JSON payloads (decision matrices, results); only applied
+# when the client sends a matching Accept-Encoding header
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_BR_LEVEL'] = 4
+
+try:
+    from flask_compress import Compress
+    Compress(app)
+except ImportError:
+    # Listed in requirements.txt; the API still works without it, uncompressed
+    app.logger.warning("flask-compress is not installed, responses will not be compressed")
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
-repository = FileProjectRepository()
-controller = MainController(repository)
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and parses with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        # Datetimes go through the default hook so they keep Flask's HTTP date format
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
+# Lazy sequences built by the controller (e.g. the sorted alternatives of a
+# result) are materialized only here, when a response is serialized. Arrays
+# kept in result metadata only reach this hook without orjson
+_flask_json_default = app.json.default
+
+def _json_default(o):
+    if isinstance(o, Sequence):
+        return list(o)
+    # NumPy arrays and scalars, checked by duck typing so numpy stays unimported here
+    if hasattr(o, 'tolist'):
+        return o.tolist()
+    return _flask_json_default(o)
+
+app.json.default = _json_default
+
+# Heavy modules (numpy, services, methods) are imported on first use so that
+# workers serving only static files don't pay for them at fork time
+repository = None
+controller = None
+
+def _get_repository():
+    global repository
+    if repository is None:
+        from infrastructure.persistence.file_project_repository import FileProjectRepository
+        repository = FileProjectRepository()
+    return repository
+
+def _get_controller():
+    global controller
+    if controller is None:
+        from presentation.controllers.main_controller import MainController
+        controller = MainController(_get_repository(),
+                                    decision_workers=Config.get('DECISION_WORKERS', 1))
+        # Worker processes, if configured, are stopped when the server exits
+        atexit.register(controller.shutdown)
+    return controller
+
+# HTTP status for ControllerError codes; other codes keep the route's default status
+_ERROR_STATUS = {
+    'alternative_not_found': 404,
+    'criteria_not_found': 404,
+    'method_failed': 400,
+    'method_execution_failed': 500
+}
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.',1)[1].lower() in ALLOWED_EXTENSIONS
@@ -34,7 +116,7 @@ def allowed_file(filename):
 @app.route('/api/projects', methods=['GET'])
 def get_projects():
     try:
-        projects = controller.get_all_projects()
+        projects = _get_controller().get_all_projects()
         return jsonify(projects)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -45,21 +127,17 @@ def create_project():
         data = request.json
         print(f"Creating project with data: {data}")
         
-        project = controller.new_project(
+        project = _get_controller().new_project(
             name=data.get('name', 'New Project'),
             description=data.get('description', ''),
             decision_maker=data.get('decision_maker', '')
         )
         print(f"Project created with ID: {project.id}")
         
-        # Save directly to ensure it exists
-        file_path = os.path.join(repository._base_dir, f"project_{project.id}.json")
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # Save directly (without validation) to ensure it exists
+        _get_repository().save(project)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(project.to_dict(), f, indent=2, ensure_ascii=False)
-        
-        print(f"Project saved to: {file_path}")
+        print(f"Project saved: {project.id}")
         
         return jsonify({
             'id': project.id, 
@@ -78,14 +156,14 @@ def create_project():
 def get_project(project_id):
     """Gets the information of a specific project."""
     try:
-        project = controller.load_project(project_id)
+        project = _get_controller().load_project(project_id)
         return jsonify({
             'id': project.id,
             'name': project.name,
             'description': project.description,
             'decision_maker': project.decision_maker,
-            'created_at': project.created_at.isoformat(),
-            'updated_at': project.updated_at.isoformat(),
+            'created_at': project.iso_created_at,
+            'updated_at': project.iso_updated_at,
             'n_alternatives': len(project.alternatives),
             'n_criteria': len(project.criteria),
             'n_results': len(project.results)
@@ -98,7 +176,7 @@ def save_project_complete(project_id):
     """Save a complete project with alternatives and criteria from frontend"""
     try:
         # Load the project
-        project = controller.load_project(project_id)
+        project = _get_controller().load_project(project_id)
         if project is None:
             return jsonify({'error': f"Project {project_id} not found"}), 404
         
@@ -114,11 +192,11 @@ def save_project_complete(project_id):
         if 'alternatives' in data:
             # Remove existing alternatives first
             for alt in list(project.alternatives):
-                controller.remove_alternative(alt.id)
+                _get_controller().remove_alternative(alt.id)
             
             # Add new alternatives
             for alt_data in data['alternatives']:
-                controller.add_alternative(
+                _get_controller().add_alternative(
                     id=alt_data['id'],
                     name=alt_data['name'],
                     description=alt_data.get('description', ''),
@@ -128,11 +206,11 @@ def save_project_complete(project_id):
         if 'criteria' in data:
             # Remove existing criteria first
             for crit in list(project.criteria):
-                controller.remove_criteria(crit.id)
+                _get_controller().remove_criteria(crit.id)
             
             # Add new criteria
             for crit_data in data['criteria']:
-                controller.add_criteria(
+                _get_controller().add_criteria(
                     id=crit_data['id'],
                     name=crit_data['name'],
                     description=crit_data.get('description', ''),
@@ -145,18 +223,14 @@ def save_project_complete(project_id):
         
         # Try to save the project
         try:
-            controller.save_project()
+            _get_controller().save_project()
             return jsonify({'success': True, 'message': 'Project saved successfully'}), 200
         except Exception as save_error:
             # If validation fails, try direct save
             print(f"Validation failed, trying direct save: {save_error}")
             
             # Direct save to disk bypassing validation
-            file_path = os.path.join(repository._base_dir, f"project_{project_id}.json")
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(project.to_dict(), f, indent=2, ensure_ascii=False)
+            _get_repository().save(project)
             
             return jsonify({'success': True, 'message': 'Project saved (direct mode)'}), 200
             
@@ -169,7 +243,7 @@ def save_project_complete(project_id):
 @app.route('/api/projects/<project_id>', methods=['PUT'])
 def update_project(project_id):
     try:
-        project = controller.load_project(project_id)
+        project = _get_controller().load_project(project_id)
         
         if project is None:
             return jsonify({'error': f"Project {project_id} not found"}), 404
@@ -186,10 +260,10 @@ def update_project(project_id):
         if 'alternatives' in data:
 
             for alt in list(project.alternatives):
-                controller.remove_alternative(alt.id)
+                _get_controller().remove_alternative(alt.id)
 
             for alt_data in data['alternatives']:
-                controller.add_alternative(
+                _get_controller().add_alternative(
                     id=alt_data['id'],
                     name=alt_data['name'],
                     description=alt_data.get('description', ''),
@@ -199,10 +273,10 @@ def update_project(project_id):
         if 'criteria' in data:
 
             for crit in list(project.criteria):
-                controller.remove_criteria(crit.id)
+                _get_controller().remove_criteria(crit.id)
 
             for crit_data in data['criteria']:
-                controller.add_criteria(
+                _get_controller().add_criteria(
                     id=crit_data['id'],
                     name=crit_data['name'],
                     description=crit_data.get('description', ''),
@@ -227,17 +301,19 @@ def update_project(project_id):
 @app.route('/api/projects/<project_id>/alternatives/<alternative_id>', methods=['GET'])
 def get_alternative(project_id, alternative_id):
     try:
-        controller.load_project(project_id)
-        alternative = controller.get_alternative(alternative_id)
+        _get_controller().load_project(project_id)
+        alternative = _get_controller().get_alternative(alternative_id)
         return jsonify(alternative)
+    except ControllerError as e:
+        return jsonify({'error': e.message, 'code': e.code}), _ERROR_STATUS.get(e.code, 400)
     except Exception as e:
         return jsonify({'error': str(e)}), 404
 
 @app.route('/api/projects/<project_id>/alternatives', methods=['GET'])
 def get_alternatives(project_id):
     try:
-        controller.load_project(project_id)
-        alternatives = controller.get_all_alternatives()
+        _get_controller().load_project(project_id)
+        alternatives = _get_controller().get_all_alternatives()
         return jsonify(alternatives)
     except Exception as e:
         return jsonify({'error': str(e)}), 404
@@ -246,8 +322,8 @@ def get_alternatives(project_id):
 @app.route('/api/projects/<project_id>/criteria', methods=['GET'])
 def get_criteria(project_id):
     try:
-        controller.load_project(project_id)
-        criteria = controller.get_all_criteria()
+        _get_controller().load_project(project_id)
+        criteria = _get_controller().get_all_criteria()
         return jsonify(criteria)
     except Exception as e:
         return jsonify({'error': str(e)}), 404
@@ -255,9 +331,11 @@ def get_criteria(project_id):
 @app.route('/api/projects/<project_id>/criteria/<criteria_id>', methods=['GET'])
 def get_criteria_by_id(project_id, criteria_id):
     try:
-        controller.load_project(project_id)
-        criteria = controller.get_criteria(criteria_id)
+        _get_controller().load_project(project_id)
+        criteria = _get_controller().get_criteria(criteria_id)
         return jsonify(criteria)
+    except ControllerError as e:
+        return jsonify({'error': e.message, 'code': e.code}), _ERROR_STATUS.get(e.code, 400)
     except Exception as e:
         return jsonify({'error': str(e)}), 404
 
@@ -266,54 +344,66 @@ def get_criteria_by_id(project_id, criteria_id):
 def get_decision_matrix(project_id):
     """Get the decision matrix for a project"""
     try:
-        controller.load_project(project_id)
+        _get_controller().load_project(project_id)
         
-        project = controller.current_project
+        project = _get_controller().current_project
         if not project:
             return jsonify({'error': 'Project not found'}), 404
         
         # Preparar respuesta
         response_data = {
-            'alternatives': controller.get_all_alternatives(),
-            'criteria': controller.get_all_criteria(),
-            'matrix_data': {},
-            'criteria_config': controller.get_matrix_input_config()
+            'alternatives': _get_controller().get_all_alternatives(),
+            'criteria': _get_controller().get_all_criteria(),
+            'alt_ids': [],
+            'crit_ids': [],
+            'matrix_values': [],
+            'criteria_config': _get_controller().get_matrix_input_config()
         }
         
-        # Si existe matriz, obtener valores
+        # Si existe matriz, enviar sus valores como filas alineadas con alt_ids/crit_ids
         if project.decision_matrix:
             matrix = project.decision_matrix
-            matrix_data = {}
-            
-            for i, alt in enumerate(project.alternatives):
-                for j, crit in enumerate(project.criteria):
-                    # IMPORTANTE: Usar formato simple "id_id"
-                    key = f"{alt.id}_{crit.id}"
-                    try:
-                        value = matrix.values[i, j]
-                        matrix_data[key] = float(value)
-                    except:
-                        matrix_data[key] = 0.0
-            
-            # NO envolver en 'values', enviar directamente
-            response_data['matrix_data'] = matrix_data
+            response_data['alt_ids'] = [alt.id for alt in matrix.alternative]
+            response_data['crit_ids'] = [crit.id for crit in matrix.criteria]
+            response_data['matrix_values'] = matrix.values_view().tolist()
         
         return jsonify(response_data), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/projects/<project_id>/matrix/raw', methods=['GET'])
+def get_decision_matrix_raw(project_id):
+    """Get the decision matrix values as a binary buffer (shape and dtype in headers)"""
+    try:
+        _get_controller().load_project(project_id)
+        raw = _get_controller().get_decision_matrix_raw()
+        
+        return Response(
+            raw['buffer'],
+            mimetype='application/octet-stream',
+            headers={
+                'X-Matrix-Shape': ','.join(str(dim) for dim in raw['shape']),
+                'X-Matrix-Dtype': raw['dtype']
+            }
+        )
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 404
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/projects/<project_id>/matrix/create', methods=['POST'])
 def create_decision_matrix(project_id):
     """Create a new decision matrix for a project"""
     try:
-        controller.load_project(project_id)
+        _get_controller().load_project(project_id)
         
         # Usar el método sin parámetros
-        controller.create_decision_matrix()
+        _get_controller().create_decision_matrix()
         
         # Guardar inmediatamente
-        controller.save_project()
+        _get_controller().save_project()
         
         return jsonify({
             'success': True,
@@ -330,7 +420,7 @@ def create_decision_matrix(project_id):
 def save_decision_matrix(project_id):
     """Save the decision matrix for a project"""
     try:
-        controller.load_project(project_id)
+        _get_controller().load_project(project_id)
         
         data = request.json if request.json else {}
         
@@ -339,22 +429,16 @@ def save_decision_matrix(project_id):
         print(f"Matrix data entries: {len(data.get('matrix_data', {}))}")
         print(f"Criteria config entries: {len(data.get('criteria_config', {}))}")
         
-        # CORRECCIÓN: Crear matriz si no existe
-        project = controller.current_project
-        if project and project.decision_matrix is None:
-            controller.create_decision_matrix()
-        
-        # Save matrix data
-        success = controller.save_decision_matrix(
+        # Save matrix data; the controller creates the matrix if needed and
+        # only writes the project when something changed
+        success = _get_controller().save_decision_matrix(
             data.get('matrix_data', {}),
             data.get('criteria_config', {})
         )
         
         if success:
-            controller.save_project()
-            
             # Verificar que se guardó correctamente
-            saved_project = controller.current_project
+            saved_project = _get_controller().current_project
             if saved_project and saved_project.decision_matrix:
                 print(f"Matrix saved successfully with {saved_project.decision_matrix.shape[0]}x{saved_project.decision_matrix.shape[1]} dimensions")
             
@@ -372,26 +456,21 @@ def save_decision_matrix(project_id):
 def update_matrix_values(project_id):
     """Update specific values in the decision matrix"""
     try:
-        controller.load_project(project_id)
+        _get_controller().load_project(project_id)
         
         data = request.json if request.json else {}
         
         # Create matrix if it doesn't exist
-        try:
-            controller.get_decision_matrix()
-        except ValueError:
-            # Matrix doesn't exist, create it
-            controller.create_decision_matrix()
-        
-        # Update individual matrix values
-        for update in data.get('updates', []):
-            controller.set_matrix_value(
-                alternative_id=update.get('alternative_id'),
-                criteria_id=update.get('criteria_id'),
-                value=float(update.get('value', 0.0))
-            )
+        if _get_controller().current_project.decision_matrix is None:
+            _get_controller().create_decision_matrix()
+        
+        # Update the matrix values in one batch and write the project once
+        _get_controller().set_matrix_values([
+            (update.get('alternative_id'), update.get('criteria_id'), float(update.get('value', 0.0)))
+            for update in data.get('updates', [])
+        ])
         
-        controller.save_project()
+        _get_controller().save_project()
         
         return jsonify({'success': True, 'message': 'Matrix values updated'}), 200
         
@@ -405,7 +484,7 @@ def update_matrix_values(project_id):
 @app.route('/api/methods', methods=['GET'])
 def get_methods():
     try:
-        methods = controller.get_available_methods()
+        methods = _get_controller().get_available_methods()
         return jsonify(methods)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -415,10 +494,10 @@ def execute_method(project_id, method_name):
     """Execute a specific MCDM method on a project"""
     try:
         # Cargar el proyecto
-        controller.load_project(project_id)
+        _get_controller().load_project(project_id)
         
         # Validar que el proyecto existe
-        project = controller.current_project
+        project = _get_controller().current_project
         if not project:
             return jsonify({
                 'error': 'Project not found',
@@ -443,14 +522,14 @@ def execute_method(project_id, method_name):
             }), 400
         
         # Verificar que hay al menos un valor diferente de cero
-        if np.all(matrix_values == 0):
+        if not matrix_values.any():
             return jsonify({
                 'error': 'All matrix values are zero',
                 'details': 'Please enter non-zero values in the decision matrix'
             }), 400
         
         # Contar valores no cero para información
-        non_zero_count = np.count_nonzero(matrix_values)
+        non_zero_count = int((matrix_values != 0).sum())
         total_values = matrix_values.size
         
         # Warning si menos del 50% de los valores están llenos
@@ -469,10 +548,19 @@ def execute_method(project_id, method_name):
         
         # Ejecutar el método
         try:
-            result = controller.execute_method(
+            result = _get_controller().execute_method(
                 method_name=method_name,
                 parameters=parameters
             )
+        except ControllerError as ce:
+            # El código del error indica si falló la validación o la ejecución
+            status = _ERROR_STATUS.get(ce.code, 400)
+            return jsonify({
+                'error': ce.message,
+                'method': method_name,
+                'code': ce.code,
+                'type': 'validation_error' if status < 500 else 'execution_error'
+            }), status
         except ValueError as ve:
             # Error específico del método o validación
             return jsonify({
@@ -497,7 +585,7 @@ def execute_method(project_id, method_name):
         
         # Guardar el proyecto con los resultados
         try:
-            controller.save_project()
+            _get_controller().save_project()
         except Exception as se:
             print(f"Warning: Failed to save project after method execution: {se}")
         
@@ -534,14 +622,15 @@ def execute_method(project_id, method_name):
 @app.route('/api/projects/<project_id>/methods/execute-all', methods=['POST'])
 def execute_all_methods(project_id):
     try:
-        controller.load_project(project_id)
+        _get_controller().load_project(project_id)
         
         data = request.json
-        results = controller.execute_all_methods(
-            parameters=data.get('parameters')
+        results = _get_controller().execute_all_methods(
+            parameters=data.get('parameters'),
+            detail=data.get('detail', 'full')
         )
         
-        controller.save_project()
+        _get_controller().save_project()
         
         return jsonify(results)
     except Exception as e:
@@ -550,13 +639,13 @@ def execute_all_methods(project_id):
 @app.route('/api/projects/<project_id>/methods/compare', methods=['GET'])
 def compare_methods(project_id):
     try:
-        controller.load_project(project_id)
+        _get_controller().load_project(project_id)
         
         method_names = request.args.get('methods', '').split(',')
         if method_names == ['']:
             method_names = None
             
-        comparison = controller.compare_methods(method_names)
+        comparison = _get_controller().compare_methods(method_names)
         
         return jsonify(comparison)
     except Exception as e:
@@ -565,10 +654,10 @@ def compare_methods(project_id):
 @app.route('/api/projects/<project_id>/sensitivity', methods=['POST'])
 def sensitivity_analysis(project_id):
     try:
-        controller.load_project(project_id)
+        _get_controller().load_project(project_id)
         
         data = request.json
-        result = controller.perform_sensitivity_analysis(
+        result = _get_controller().perform_sensitivity_analysis(
             method_name=data.get('method_name'),
             criteria_id=data.get('criteria_id'),
             weight_range=(
@@ -585,8 +674,10 @@ def sensitivity_analysis(project_id):
 @app.route('/api/projects/<project_id>/results', methods=['GET'])
 def get_all_results(project_id):
     try:
-        controller.load_project(project_id)
-        results = controller.get_all_results()
+        _get_controller().load_project(project_id)
+        results = _get_controller().get_all_results(
+            detail=request.args.get('detail', 'full')
+        )
         return jsonify(results)
     except Exception as e:
         return jsonify({'error': str(e)}), 404
@@ -594,8 +685,8 @@ def get_all_results(project_id):
 @app.route('/api/projects/<project_id>/results/<method_name>', methods=['GET'])
 def get_method_result(project_id, method_name):
     try:
-        controller.load_project(project_id)
-        result = controller.get_result(method_name)
+        _get_controller().load_project(project_id)
+        result = _get_controller().get_result(method_name)
         
         if result is None:
             return jsonify({'error': 'Result not found'}), 404
@@ -4,9 +4,14 @@ Module that defines the main controller of the MCDM system.
 This controller integrates the different services and provides a unified interface
 for project management and execution of MCDM methods.
 """
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
+from collections.abc import Sequence
+from functools import cached_property, wraps
+import logging
 import os
+import re
 from datetime import datetime
+import numpy as np
 
 from domain.entities.project import Project
 from domain.entities.alternative import Alternative
@@ -15,18 +20,159 @@ from domain.entities.result import Result
 from domain.repositories.project_repository import ProjectRepository
 from application.services.project_service import ProjectService
 from application.services.decision_service import DecisionService
-from utils.exceptions import ServiceError
+from utils.exceptions import ControllerError, ServiceError
+
+logger = logging.getLogger(__name__)
+
+# Matrix cell keys sent by the frontend: "alt_X_crit_Y" or "X_Y"
+_MATRIX_KEY_PATTERN = re.compile(r'^alt_(?P<alt>.+?)_crit_(?P<crit>.+)$')
+
+def _split_matrix_key(key: str, alternative_ids: set, criteria_ids: set) -> Optional[Tuple[str, str]]:
+    """Split a matrix cell key into known (alternative_id, criteria_id), or None"""
+    match = _MATRIX_KEY_PATTERN.match(key)
+    if match is not None and match['alt'] in alternative_ids and match['crit'] in criteria_ids:
+        return match['alt'], match['crit']
+    
+    # "X_Y": IDs may contain underscores themselves, so try each separator
+    sep = key.find('_')
+    while sep != -1:
+        alt_id, crit_id = key[:sep], key[sep + 1:]
+        if alt_id in alternative_ids and crit_id in criteria_ids:
+            return alt_id, crit_id
+        sep = key.find('_', sep + 1)
+    return None
+
+def requires_project(fn):
+    """Check there is a current project and pass it to fn after self"""
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        project = self._current_project
+        if project is None:
+            raise ValueError("There is no current project")
+        return fn(self, project, *args, **kwargs)
+    return wrapper
+
+
+class _LazyAlternativesView(Sequence):
+    """Sorted alternatives of a formatted result, built on first full access.
+    
+    Slices taken before that (e.g. a top-k) only build the requested items.
+    The JSON provider in main.py turns it into a list when serialized.
+    """
+    __slots__ = ('_ids', '_names', '_scores', '_rankings', '_order', '_items')
+    
+    def __init__(self, ids: List[str], names: List[str], scores: List[float],
+                 rankings: List[int], order: np.ndarray):
+        self._ids = ids
+        self._names = names
+        self._scores = scores
+        self._rankings = rankings
+        self._order = order
+        self._items: Optional[List[Dict[str, Any]]] = None
+    
+    def _item(self, idx: int) -> Dict[str, Any]:
+        return {
+            'id': self._ids[idx],
+            'name': self._names[idx],
+            'score': self._scores[idx],
+            'ranking': self._rankings[idx]
+        }
+    
+    def _materialize(self) -> List[Dict[str, Any]]:
+        if self._items is None:
+            self._items = [self._item(idx) for idx in self._order.tolist()]
+        return self._items
+    
+    def __len__(self) -> int:
+        return len(self._order)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice) and self._items is None:
+            return [self._item(idx) for idx in self._order[index].tolist()]
+        return self._materialize()[index]
+    
+    def __iter__(self):
+        return iter(self._materialize())
+    
+    def copy(self) -> '_LazyAlternativesView':
+        """Unbuilt view over the same data; its items are not shared with this one"""
+        return _LazyAlternativesView(self._ids, self._names, self._scores, self._rankings, self._order)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _LazyAlternativesView):
+            other = other._materialize()
+        return self._materialize() == other
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+
+def _copy_formatted_result(formatted: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a cached formatted result that shares no mutable part with it"""
+    copied = dict(formatted)
+    copied['parameters'] = dict(formatted['parameters'])
+    copied['best_alternative'] = dict(formatted['best_alternative'])
+    copied['alternatives'] = formatted['alternatives'].copy()
+    copied['rankings'] = list(formatted['rankings'])
+    copied['scores'] = list(formatted['scores'])
+    copied['metadata'] = dict(formatted['metadata'])
+    return copied
+
 
 class MainController:
-    def __init__(self, project_repository: ProjectRepository):
+    # Field order of the tuples returned by ProjectService.get_all_project_summaries
+    _SUMMARY_FIELDS = ('id', 'name', 'description', 'decision_maker', 'created_at',
+                       'updated_at', 'n_alternatives', 'n_criteria', 'n_results')
+    # Keys of the dicts built by get_all_alternatives / get_all_criteria
+    _ALT_FIELDS = ('id', 'name', 'description', 'metadata')
+    _CRIT_FIELDS = ('id', 'name', 'description', 'optimization_type', 'scale_type',
+                    'weight', 'unit', 'metadata')
+    # Accepted values for the detail argument of execute_all_methods / get_all_results
+    _RESULT_DETAILS = ('full', 'summary')
+    # ProjectService method names by export/import format; looked up on the
+    # instance so a replaced or extended service is honoured
+    _EXPORTERS = {
+        'json': 'export_to_json',
+        'excel': 'export_to_excel',
+        'csv': 'export_to_csv',
+        'pdf': 'export_to_pdf',
+    }
+    _IMPORTERS = {
+        'json': 'import_from_json',
+        'excel': 'import_from_excel',
+        'csv': 'import_from_csv',
+    }
+    _EXT_TO_FORMAT = {'.json': 'json', '.csv': 'csv', '.xlsx': 'excel', '.xls': 'excel'}
+    
+    def __init__(self, project_repository: ProjectRepository, decision_workers: Optional[int] = 1):
         self._project_service = ProjectService(project_repository)
-        self._decision_service = DecisionService()
+        # Serial by default; with more workers (None = one per CPU) only matrices
+        # large enough to pay for the processes are fanned out
+        self._decision_service = DecisionService(max_workers=decision_workers)
         self._current_project = None
+        # Alternative/criteria listings by (kind, project ID), reused while the
+        # project's updated_at and structure_version are unchanged
+        self._listing_cache: Dict[Tuple[str, str], Tuple[Tuple[datetime, int], List[Dict[str, Any]]]] = {}
+        # updated_at of each project as last loaded from or written to the repository
+        self._persisted_at: Dict[str, datetime] = {}
     
     @property
     def current_project(self) -> Optional[Project]:
         return self._current_project
     
+    def reset(self) -> None:
+        """Forget the current project and per-project caches, keeping the services"""
+        self._decision_service.shutdown()
+        self._current_project = None
+        self._listing_cache.clear()
+        self._persisted_at.clear()
+    
+    def shutdown(self) -> None:
+        """Stop the decision service's worker processes, if any were started"""
+        self._decision_service.shutdown()
+    
     def new_project(self, name: str, description: str = "",
                     decision_maker: str = "") -> Project:
         project = self._decision_service.create_project(
@@ -44,97 +190,75 @@ class MainController:
         try:
             saved_project = self._project_service.save_project(self._current_project)
             self._current_project = saved_project
+            self._persisted_at[saved_project.id] = saved_project.updated_at
             return saved_project
         except Exception as e:
             # Registrar el error para depuración
-            import traceback
-            traceback.print_exc()
-            raise ValueError(f"Error saving project: {str(e)}")
+            logger.exception("Error saving project %s", self._current_project.id)
+            raise ControllerError(f"Error saving project: {e}", code="project_save_failed") from e
     
     def load_project(self, project_id: str) -> Project:
         project = self._project_service.get_project(project_id)
         self._current_project = project
+        self._persisted_at[project.id] = project.updated_at
         return project
     
     def get_all_projects(self) -> List[Dict[str, Any]]:
-        projects = self._project_service.get_all_projects()
-        return [
-            {
-                'id': project.id,
-                'name': project.name,
-                'description': project.description,
-                'decision_maker': project.decision_maker,
-                'created_at': project.created_at.isoformat(),
-                'updated_at': project.updated_at.isoformat(),
-                'n_alternatives': len(project.alternatives),
-                'n_criteria': len(project.criteria),
-                'n_results': len(project.results)
-            }
-            for project in projects
-        ]
+        summaries = self._project_service.get_all_project_summaries()
+        fields = self._SUMMARY_FIELDS
+        return [dict(zip(fields, summary)) for summary in summaries]
+    
+    def _project_summary(self, project: Project) -> Dict[str, Any]:
+        return {
+            'id': project.id,
+            'name': project.name,
+            'description': project.description,
+            'decision_maker': project.decision_maker,
+            'created_at': project.iso_created_at,
+            'updated_at': project.iso_updated_at,
+            'n_alternatives': len(project.alternatives),
+            'n_criteria': len(project.criteria),
+            'n_results': len(project.results)
+        }
     
     def delete_project(self, project_id: str) -> bool:
         if self._current_project and self._current_project.id == project_id:
             self._current_project = None
         
+        self._listing_cache.pop(('alternatives', project_id), None)
+        self._listing_cache.pop(('criteria', project_id), None)
         return self._project_service.delete_project(project_id)
     
     def search_projects(self, query: str) -> List[Dict[str, Any]]:
         projects = self._project_service.search_projects(query)
-        return [
-            {
-                'id': project.id,
-                'name': project.name,
-                'description': project.description,
-                'decision_maker': project.decision_maker,
-                'created_at': project.created_at.isoformat(),
-                'updated_at': project.updated_at.isoformat(),
-                'n_alternatives': len(project.alternatives),
-                'n_criteria': len(project.criteria),
-                'n_results': len(project.results)
-            }
-            for project in projects
-        ]
+        return [self._project_summary(project) for project in projects]
     
     def export_project(self, file_path: str, format_type: str = 'json') -> None:
         if self._current_project is None:
             raise ValueError("There is no current project to export")
         
         format_type = format_type.lower()
-        if format_type == 'json':
-            self._project_service.export_to_json(self._current_project, file_path)
-        elif format_type == 'excel':
-            self._project_service.export_to_excel(self._current_project, file_path)
-        elif format_type == 'csv':
-            self._project_service.export_to_csv(self._current_project, file_path)
-        elif format_type == 'pdf':
-            self._project_service.export_to_pdf(self._current_project, file_path)
-        else:
-            raise ValueError(f"Export format not supported: {format_type}")       
+        exporter = self._EXPORTERS.get(format_type)
+        if exporter is None:
+            raise ValueError(f"Export format not supported: {format_type}")
+        
+        getattr(self._project_service, exporter)(self._current_project, file_path)
 
     def import_project(self, file_path: str, format_type: Optional[str] = None) -> Project:
         if format_type is None:
             ext = os.path.splitext(file_path)[1].lower()
-            if ext == '.json':
-                format_type = 'json'
-            elif ext == '.csv':
-                format_type = 'csv'
-            elif ext in ['.xlsx', '.xls']:
-                format_type = 'excel'
-            else:
+            format_type = self._EXT_TO_FORMAT.get(ext)
+            if format_type is None:
                 raise ValueError(f"Cannot infer the format from the extension: {ext}")
         else:
             format_type = format_type.lower()
         
-        if format_type == 'json':
-            project = self._project_service.import_from_json(file_path)
-        elif format_type == 'excel':
-            project = self._project_service.import_from_excel(file_path)
-        elif format_type == 'csv':
-            project = self._project_service.import_from_csv(file_path)
-        else:
+        importer = self._IMPORTERS.get(format_type)
+        if importer is None:
             raise ValueError(f"Importation format not supported: {format_type}")
         
+        project = getattr(self._project_service, importer)(file_path)
+        
         self._current_project = project
         return project
     
@@ -143,25 +267,21 @@ class MainController:
         self._current_project = project
         return project
     
-    def add_alternative(self, id: str, name: str, description: str= "",
+    @requires_project
+    def add_alternative(self, project: Project, id: str, name: str, description: str= "",
                         metadata: Optional[Dict] = None) -> Alternative:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
         return self._decision_service.add_alternative(
-            project=self._current_project,
+            project=project,
             id=id,
             name=name,
             description=description,
             metadata=metadata
         )
     
-    def get_alternative(self, alternative_id: str) -> Dict[str, Any]:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
+    @requires_project
+    def get_alternative(self, project: Project, alternative_id: str) -> Dict[str, Any]:
         try:
-            alternative = self._current_project.get_alternative_by_id(alternative_id)
+            alternative = project.get_alternative_by_id(alternative_id)
 
             return {
                 'id': alternative.id,
@@ -171,44 +291,42 @@ class MainController:
             }
         
         except ValueError as e:
-            raise ValueError(f"Alternative not found: {str(e)}")
+            raise ControllerError(f"Alternative not found: {e}", code="alternative_not_found") from e
     
-    def get_all_alternatives(self) -> List[Dict[str, Any]]:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
-        alternatives = self._current_project.alternatives
-        
-        return [
-            {
-                'id': alt.id,
-                'name': alt.name,
-                'description': alt.description,
-                'metadata': alt.metadata
-            }
-            for alt in alternatives
-        ]
+    @requires_project
+    def get_all_alternatives(self, project: Project) -> List[Dict[str, Any]]:
+        fields = self._ALT_FIELDS
+        return self._cached_listing('alternatives', project, lambda: [
+            dict(zip(fields, (alt.id, alt.name, alt.description, alt.metadata)))
+            for alt in project.alternatives
+        ])
     
-    def remove_alternative(self, alternative_id: str) -> None:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
+    def _cached_listing(self, kind: str, project: Project,
+                        build: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        key = (kind, project.id)
+        stamp = (project.updated_at, project.structure_version)
+        cached = self._listing_cache.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, build())
+            self._listing_cache[key] = cached
+        return list(cached[1])
+    
+    @requires_project
+    def remove_alternative(self, project: Project, alternative_id: str) -> None:
         try:
-            self._current_project.remove_alternative(alternative_id)
+            project.remove_alternative(alternative_id)
         except ValueError as e:
-            raise ValueError(f"Error removing alternative: {str(e)}")
+            raise ControllerError(f"Error removing alternative: {e}", code="alternative_remove_failed") from e
         
-    def add_criteria(self, id: str, name: str, description: str = "",
+    @requires_project
+    def add_criteria(self, project: Project, id: str, name: str, description: str = "",
                    optimization_type: str = "maximize",
                    scale_type: str = "quantitative",
                    weight: float = 1.0, unit: str = "",
                    metadata: Optional[Dict] = None) -> Criteria:
         
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
         return self._decision_service.add_criteria(
-            project=self._current_project,
+            project=project,
             id=id,
             name=name,
             description=description,
@@ -219,12 +337,10 @@ class MainController:
             metadata=metadata
         )
     
-    def get_criteria(self, criteria_id: str) -> Dict[str, Any]:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
+    @requires_project
+    def get_criteria(self, project: Project, criteria_id: str) -> Dict[str, Any]:
         try:
-            criteria = self._current_project.get_criteria_by_id(criteria_id)
+            criteria = project.get_criteria_by_id(criteria_id)
             
             return {
                 'id': criteria.id,
@@ -238,36 +354,23 @@ class MainController:
             }
             
         except ValueError as e:
-            raise ValueError(f"Criterion not found: {str(e)}")
+            raise ControllerError(f"Criterion not found: {e}", code="criteria_not_found") from e
     
-    def get_all_criteria(self) -> List[Dict[str, Any]]:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
-        criteria_list = self._current_project.criteria
-        
-        return [
-            {
-                'id': crit.id,
-                'name': crit.name,
-                'description': crit.description,
-                'optimization_type': crit.optimization_type.value,
-                'scale_type': crit.scale_type.value,
-                'weight': crit.weight,
-                'unit': crit.unit,
-                'metadata': crit.metadata
-            }
-            for crit in criteria_list
-        ]
+    @requires_project
+    def get_all_criteria(self, project: Project) -> List[Dict[str, Any]]:
+        fields = self._CRIT_FIELDS
+        return self._cached_listing('criteria', project, lambda: [
+            dict(zip(fields, (crit.id, crit.name, crit.description, crit.optimization_type.value,
+                              crit.scale_type.value, crit.weight, crit.unit, crit.metadata)))
+            for crit in project.criteria
+        ])
     
-    def remove_criteria(self, criteria_id: str) -> None:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
+    @requires_project
+    def remove_criteria(self, project: Project, criteria_id: str) -> None:
         try:
-            self._current_project.remove_criteria(criteria_id)
+            project.remove_criteria(criteria_id)
         except ValueError as e:
-            raise ValueError(f"Error removing criterion: {str(e)}")
+            raise ControllerError(f"Error removing criterion: {e}", code="criteria_remove_failed") from e
     
     def get_decision_matrix(self) -> Dict[str, Any]:
         """Get decision matrix with all related data"""
@@ -277,7 +380,9 @@ class MainController:
         result = {
             'alternatives': [alt.to_dict() for alt in self._current_project.alternatives],
             'criteria': [crit.to_dict() for crit in self._current_project.criteria],
-            'matrix_data': {},
+            'alt_ids': [],
+            'crit_ids': [],
+            'matrix_values': [],
             'criteria_config': self._current_project.get_metadata('criteria_config', {})
         }
         
@@ -287,56 +392,103 @@ class MainController:
         
         matrix = self._current_project.decision_matrix
         
-        # Obtener valores de la matriz
-        matrix_data = {}
-        for i, alt in enumerate(matrix.alternative):
-            for j, crit in enumerate(matrix.criteria):
-                key = f"{alt.id}_{crit.id}"
-                value = matrix.get_values(i, j)
-                # CORRECCIÓN: Convertir valor a string para el frontend
-                matrix_data[key] = str(value) if value != 0 else ""
-        
-        result['matrix_data'] = matrix_data
+        # Valores como filas alineadas con alt_ids/crit_ids, igual que la ruta de la API
+        result['alt_ids'] = [alt.id for alt in matrix.alternative]
+        result['crit_ids'] = [crit.id for crit in matrix.criteria]
+        result['matrix_values'] = matrix.values_view().tolist()
         
         return result
 
-    def create_decision_matrix(self) -> None:
-        """Crear matriz de decisión vacía para el proyecto actual"""
-        if self._current_project is None:
-            raise ValueError("There is no current project")
+    @requires_project
+    def get_decision_matrix_raw(self, project: Project) -> Dict[str, Any]:
+        """
+        Get decision matrix values as a raw binary buffer
         
+        Returns:
+            Dictionary with the alternative and criteria IDs (row and column order),
+            the matrix shape and dtype, and the C-ordered values buffer
+        """
+        matrix = project.decision_matrix
+        if matrix is None:
+            raise ValueError("The project has no decision matrix configured")
+        
+        return {
+            'alternative_ids': [alt.id for alt in matrix.alternative],
+            'criteria_ids': [crit.id for crit in matrix.criteria],
+            'shape': matrix.shape,
+            'dtype': str(matrix.dtype),
+            'buffer': matrix.to_bytes()
+        }
+
+    @requires_project
+    def create_decision_matrix(self, project: Project) -> None:
+        """Crear matriz de decisión vacía para el proyecto actual"""
         # Crear matriz con las alternativas y criterios actuales
-        self._current_project.create_decision_matrix()
+        project.create_decision_matrix()
     
-    def set_matrix_value(self, alternative_id: str, criteria_id: str, value: float) -> None:
+    @requires_project
+    def set_matrix_value(self, project: Project, alternative_id: str, criteria_id: str, value: float) -> None:
         """Establecer un valor específico en la matriz"""
-        if self._current_project is None:
-            raise ValueError("There is no current project")
+        if project.decision_matrix is None:
+            project.create_decision_matrix()
         
-        if self._current_project.decision_matrix is None:
-            self._current_project.create_decision_matrix()
-        
-        matrix = self._current_project.decision_matrix
+        matrix = project.decision_matrix
+        alt_idx, crit_idx = self._matrix_cell_index(matrix, alternative_id, criteria_id)
+        matrix.set_values(alt_idx, crit_idx, value)
+
+    
+    @staticmethod
+    def _matrix_cell_index(matrix, alternative_id: str, criteria_id: str) -> Tuple[int, int]:
+        """Resolve a cell's (row, column), raising ControllerError for an unknown ID"""
+        message = f"Alternative {alternative_id} or criteria {criteria_id} not found"
+        try:
+            alt_idx = matrix.index_of_alternative(alternative_id)
+        except ValueError as e:
+            raise ControllerError(message, code="alternative_not_found") from e
+        try:
+            crit_idx = matrix.index_of_criteria(criteria_id)
+        except ValueError as e:
+            raise ControllerError(message, code="criteria_not_found") from e
+        return alt_idx, crit_idx
+    
+    @requires_project
+    def set_matrix_values(self, project: Project, updates: List[Tuple[str, str, float]],
+                          ignore_missing: bool = False) -> int:
+        """
+        Set many matrix cells at once
         
-        # Encontrar índices
-        alt_idx = None
-        crit_idx = None
+        Args:
+            updates: (alternative_id, criteria_id, value) tuples
+            ignore_missing: Skip updates with unknown IDs instead of raising
         
-        for i, alt in enumerate(matrix.alternative):
-            if alt.id == alternative_id:
-                alt_idx = i
-                break
+        Returns:
+            Number of cells whose value changed
+        """
+        if project.decision_matrix is None:
+            project.create_decision_matrix()
         
-        for j, crit in enumerate(matrix.criteria):
-            if crit.id == criteria_id:
-                crit_idx = j
-                break
+        matrix = project.decision_matrix
         
-        if alt_idx is not None and crit_idx is not None:
-            matrix.set_values(alt_idx, crit_idx, value)
-        else:
-            raise ValueError(f"Alternative {alternative_id} or criteria {criteria_id} not found")
-
+        # IDs are resolved through the matrix's cached indexes instead of a scan per cell
+        rows, cols, values = [], [], []
+        for alt_id, crit_id, value in updates:
+            try:
+                alt_idx, crit_idx = self._matrix_cell_index(matrix, alt_id, crit_id)
+            except ControllerError:
+                if not ignore_missing:
+                    raise
+                logger.warning("Skipping matrix value for unknown alternative %s or criteria %s",
+                               alt_id, crit_id)
+                continue
+            rows.append(alt_idx)
+            cols.append(crit_idx)
+            values.append(value)
+        
+        if not rows:
+            return 0
+        
+        return matrix.set_values_bulk(np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp),
+                                      np.array(values, dtype=matrix.dtype))
     
     def save_decision_matrix(self, matrix_data: Dict[str, Any], criteria_config: Dict[str, Any] = None) -> bool:
         """
@@ -361,6 +513,10 @@ class MainController:
             
             matrix = self._current_project.decision_matrix
             
+            # Nothing changed since the project was loaded or saved (the values are
+            # compared below), so an unchanged autosave can skip the write
+            pristine = self._persisted_at.get(self._current_project.id) == self._current_project.updated_at
+            
             # CORRECCIÓN: Manejar ambos formatos de datos
             matrix_values = {}
             
@@ -371,38 +527,45 @@ class MainController:
             elif isinstance(matrix_data, dict):
                 matrix_values = matrix_data
             
-            # Procesar valores de la matriz
+            # Procesar valores de la matriz; se escriben juntos al final
+            alternative_ids = {alt.id for alt in matrix.alternative}
+            criteria_ids = {crit.id for crit in matrix.criteria}
+            updates = []
             for key, value in matrix_values.items():
                 try:
-                    # CORRECCIÓN: Manejar ambos formatos de clave
-                    if '_' in key and key.count('_') >= 1:
-                        parts = key.split('_')
-                        
-                        # Formato "alt_X_crit_Y"
-                        if len(parts) == 4 and parts[0] == 'alt' and parts[2] == 'crit':
-                            alt_id = parts[1]
-                            crit_id = parts[3]
-                        # Formato "X_Y"
-                        elif len(parts) == 2:
-                            alt_id = parts[0]
-                            crit_id = parts[1]
-                        else:
-                            print(f"Invalid key format: {key}")
-                            continue
-                        
-                        # Convertir valor a float
+                    # CORRECCIÓN: Manejar ambos formatos de clave ("alt_X_crit_Y" o "X_Y")
+                    ids = _split_matrix_key(key, alternative_ids, criteria_ids)
+                    if ids is None:
+                        if '_' in key:
+                            logger.warning("Skipping matrix value with unknown key: %s", key)
+                        continue
+                    
+                    alt_id, crit_id = ids
+                    
+                    # Convertir valor a float (los números llegan ya convertidos)
+                    if value is None or value == '':
+                        float_value = 0.0
+                    elif isinstance(value, (int, float)):
+                        float_value = float(value)
+                    else:
                         try:
-                            float_value = float(value) if value != '' else 0.0
+                            float_value = float(value)
                         except (ValueError, TypeError):
                             float_value = 0.0
-                        
-                        # Establecer valor en la matriz
-                        self.set_matrix_value(alt_id, crit_id, float_value)
-                        
+                    
+                    updates.append((alt_id, crit_id, float_value))
+                    
                 except Exception as e:
                     print(f"Error processing matrix value for key {key}: {str(e)}")
                     continue
             
+            changed = self.set_matrix_values(updates)
+            
+            if (pristine and not changed
+                    and (not criteria_config
+                         or criteria_config == self._current_project.get_metadata('matrix_input_config'))):
+                return True
+            
             # Guardar configuración de entrada si se proporciona
             if criteria_config:
                 # Guardar la configuración de entrada en metadata del proyecto
@@ -422,9 +585,7 @@ class MainController:
             return True
             
         except Exception as e:
-            print(f"Error saving decision matrix: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error saving decision matrix")
             return False
     
     def get_matrix_input_config(self) -> Dict[str, Any]:
@@ -440,7 +601,11 @@ class MainController:
         # Recuperar configuración desde metadata del proyecto
         return self._current_project.metadata.get('matrix_input_config', {})
 
-    def get_available_methods(self) -> List[Dict[str, Any]]:
+    @cached_property
+    def available_methods_info(self) -> List[Dict[str, Any]]:
+        # Method metadata only changes when a method is registered, so it is built
+        # once per registry version
+        self._methods_version = self._decision_service.methods_version
         method_names = self._decision_service.get_available_methods()
         
         methods_info = []
@@ -453,30 +618,42 @@ class MainController:
         
         return methods_info
     
-    def execute_method(self, method_name: str, 
+    def refresh_methods(self) -> None:
+        # Drop the cached metadata, e.g. after registering a new method
+        self.__dict__.pop('available_methods_info', None)
+    
+    def get_available_methods(self) -> List[Dict[str, Any]]:
+        if ('available_methods_info' in self.__dict__
+                and self._methods_version != self._decision_service.methods_version):
+            self.refresh_methods()
+        return list(self.available_methods_info)
+    
+    @requires_project
+    def execute_method(self, project: Project, method_name: str, 
                  parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
-        matrix = self._current_project.decision_matrix
+        matrix = project.decision_matrix
         # Validar que exista una matriz de decisión
         if matrix is None:
             raise ValueError("The project has no decision matrix configured")
         
+        n_alternatives = len(matrix.alternative)
+        n_criteria = len(matrix.criteria)
+        has_values = matrix.size > 0
+        
         # Validar que la matriz tenga datos
-        if matrix.values.size == 0:
+        if not has_values:
             raise ValueError("The decision matrix is empty")
         
         # Validar que haya alternativas y criterios
-        if len(matrix.alternative) == 0:
+        if n_alternatives == 0:
             raise ValueError("No alternatives defined in the decision matrix")
         
-        if len(matrix.criteria) == 0:
+        if n_criteria == 0:
             raise ValueError("No criteria defined in the decision matrix")
         
         try:
             result = self._decision_service.execute_method(
-                project=self._current_project,
+                project=project,
                 method_name=method_name,
                 parameters=parameters
             )
@@ -489,9 +666,9 @@ class MainController:
             
             # Agregar información adicional para debugging
             formatted_result['matrix_info'] = {
-                'n_alternatives': len(matrix.alternative),
-                'n_criteria': len(matrix.criteria),
-                'has_values': matrix.values.size > 0
+                'n_alternatives': n_alternatives,
+                'n_criteria': n_criteria,
+                'has_values': has_values
             }
             
             return formatted_result
@@ -499,48 +676,39 @@ class MainController:
         except ServiceError as e:
             # Log detallado del error
             print(f"ServiceError executing {method_name}: {e.message}")
-            raise ValueError(f"Error executing {method_name}: {e.message}")
+            raise ControllerError(f"Error executing {method_name}: {e.message}", code="method_failed") from e
         except Exception as e:
             # Log completo del error
-            import traceback
-            traceback.print_exc()
-            raise ValueError(f"Unexpected error executing {method_name}: {str(e)}")
+            logger.exception("Unexpected error executing %s", method_name)
+            raise ControllerError(f"Unexpected error executing {method_name}: {e}",
+                                  code="method_execution_failed") from e
     
-    def execute_all_methods(self, 
-                         parameters: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
+    @requires_project
+    def execute_all_methods(self, project: Project, 
+                         parameters: Optional[Dict[str, Dict[str, Any]]] = None,
+                         detail: str = 'full') -> Dict[str, Dict[str, Any]]:
         results = self._decision_service.execute_all_methods(
-            project=self._current_project,
+            project=project,
             parameters=parameters
         )
         
-        formatted_results = {}
-        for method_name, result in results.items():
-            formatted_results[method_name] = self._format_result(result)
-        
-        return formatted_results
+        return self._format_results(results, detail)
     
-    def compare_methods(self, method_names: Optional[List[str]] = None) -> Dict[str, Any]:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
+    @requires_project
+    def compare_methods(self, project: Project, method_names: Optional[List[str]] = None) -> Dict[str, Any]:
         comparison = self._decision_service.compare_methods(
-            project=self._current_project,
+            project=project,
             method_names=method_names
         )
         
         return comparison
     
-    def perform_sensitivity_analysis(self, method_name: str, criteria_id: str,
+    @requires_project
+    def perform_sensitivity_analysis(self, project: Project, method_name: str, criteria_id: str,
                                   weight_range: Tuple[float, float] = (0.1, 1.0),
                                   steps: int = 10) -> Dict[str, Any]:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
         sensitivity_results = self._decision_service.perform_sensitivity_analysis(
-            project=self._current_project,
+            project=project,
             method_name=method_name,
             criteria_id=criteria_id,
             weight_range=weight_range,
@@ -549,48 +717,114 @@ class MainController:
         
         return sensitivity_results
     
-    def get_result(self, method_name: str) -> Optional[Dict[str, Any]]:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
-        
-        result = self._current_project.get_result(method_name)
+    @requires_project
+    def get_result(self, project: Project, method_name: str) -> Optional[Dict[str, Any]]:
+        result = project.get_result(method_name)
         
         if result is None:
             return None
         
         return self._format_result(result)
     
-    def get_all_results(self) -> Dict[str, Dict[str, Any]]:
-        if self._current_project is None:
-            raise ValueError("There is no current project")
+    @requires_project
+    def get_all_results(self, project: Project, detail: str = 'full') -> Dict[str, Dict[str, Any]]:
+        return self._format_results(project.results, detail)
+    
+    def _format_results(self, results: Dict[str, Result],
+                        detail: str = 'full') -> Dict[str, Dict[str, Any]]:
+        if detail not in self._RESULT_DETAILS:
+            raise ValueError(f"Invalid detail level: {detail}. Use one of: {', '.join(self._RESULT_DETAILS)}")
         
-        results = self._current_project.results
-       
-        formatted_results = {}
-        for method_name, result in results.items():
-            formatted_results[method_name] = self._format_result(result)
+        if not results:
+            return {}
+        
+        if detail == 'summary':
+            return {
+                method_name: self._format_result(result, detail=detail)
+                for method_name, result in results.items()
+            }
         
-        return formatted_results
+        formatted = {}
+        for method_name, result in results.items():
+            cached = result.get_formatted_view()
+            if cached is not None:
+                formatted[method_name] = _copy_formatted_result(cached)
+        pending = [(method_name, result) for method_name, result in results.items()
+                   if method_name not in formatted]
+        if not pending:
+            return formatted
+        
+        # Results of one project share the alternatives, so the descending
+        # order of every method comes out of a single argsort over the stacked scores
+        scores = [result.scores for _, result in pending]
+        orders = [None] * len(scores)
+        if len({len(method_scores) for method_scores in scores}) == 1:
+            orders = np.argsort(np.vstack(scores), axis=1)[:, ::-1]
+        
+        for (method_name, result), method_scores, order in zip(pending, scores, orders):
+            # Same view as the default one, so it is kept for later calls
+            view = self._format_result(result, method_scores, order)
+            result.set_formatted_view(view)
+            formatted[method_name] = _copy_formatted_result(view)
+        
+        # Keep the order of the results
+        return {method_name: formatted[method_name] for method_name in results}
     
-    def _format_result(self, result: Result) -> Dict[str, Any]:
-        best_id, best_name, best_score = result.get_best_alternative()
+    def _format_result(self, result: Result, scores: Optional[np.ndarray] = None,
+                       order: Optional[np.ndarray] = None, detail: str = 'full') -> Dict[str, Any]:
+        # The default full view only depends on the result, so it is built once
+        # per result; callers get a copy they can modify freely
+        cacheable = detail == 'full' and scores is None and order is None
+        cached = result.get_formatted_view() if cacheable else None
+        if cached is not None:
+            return _copy_formatted_result(cached)
+        
+        if detail == 'summary':
+            # Only what a summary table renders; no per-alternative data, so the
+            # score/ranking arrays are neither copied nor converted to lists
+            best_id, best_name, best_score = result.get_best_alternative()
+            return {
+                'method_name': result.method_name,
+                'execution_time': result.execution_time,
+                'best_alternative': {
+                    'id': best_id,
+                    'name': best_name,
+                    'score': best_score
+                }
+            }
+        
+        if scores is None:
+            scores = result.scores
+        
+        if order is None:
+            order = np.argsort(scores)[::-1]
+        
+        # Convert the arrays once and index the resulting lists
+        alternative_ids = result.alternative_ids
+        alternative_names = result.alternative_names
+        scores_list = scores.tolist()
+        rankings_list = result.rankings.tolist()
+        best_idx = int(np.argmax(scores))
         
         formatted = {
             'method_name': result.method_name,
             'execution_time': result.execution_time,
             'parameters': result.parameters,
             'best_alternative': {
-                'id': best_id,
-                'name': best_name,
-                'score': best_score
+                'id': alternative_ids[best_idx],
+                'name': alternative_names[best_idx],
+                'score': scores_list[best_idx]
             },
-            'alternatives': result.get_sorted_alternatives(),
-            'rankings': result.rankings.tolist(),
-            'scores': result.scores.tolist(),
+            # Built only if something reads or serializes the full listing
+            'alternatives': _LazyAlternativesView(
+                alternative_ids, alternative_names, scores_list, rankings_list, order),
+            'rankings': rankings_list,
+            'scores': scores_list,
             'created_at': result.created_at.isoformat(),
             'metadata': result.metadata
         }
         
-        return formatted
-        
-            
+        if cacheable:
+            result.set_formatted_view(formatted)
+            return _copy_formatted_result(formatted)
+        return formatted
\ No newline at end of file
@@ -0,0 +1,25 @@
+# backend/tests/conftest.py
+import os
+import sys
+
+# xdist runs one worker per core; multi-threaded BLAS in every worker would
+# oversubscribe the CPU, so each worker gets a single BLAS thread. These must
+# be set before numpy is first imported
+for _var in ("OPENBLAS_NUM_THREADS", "OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+# Load numpy/BLAS once per worker here rather than while collecting the
+# first test module that imports them
+import numpy  # noqa: E402,F401
+import scipy.linalg  # noqa: E402,F401
+
+_SHM_DIR = "/dev/shm"
+
+
+def pytest_configure(config):
+    """Keep tmp_path directories on tmpfs when it is available (Linux)."""
+    if (sys.platform.startswith("linux") and config.option.basetemp is None
+            and os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK)):
+        # Read lazily by tmp_path_factory; the usual pytest-of-<user>/pytest-N
+        # layout and retention are kept, only the root moves off the disk
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", _SHM_DIR)
@@ -1,6 +1,7 @@
 # backend/tests/unit/test_config.py
 import os
 import pytest
+import config
 from config import BaseConfig, DevelopmentConfig, TestingConfig, ProductionConfig, Config, config_by_name, active_config
 
 class TestConfig:
@@ -47,32 +48,36 @@ class TestConfig:
         # Test getting an attribute with default value
         assert Config.get('NON_EXISTENT', 'default_value') == 'default_value'
         
-    def test_config_env_switching(self):
-        """Test switching between environments."""
-        original_env = os.environ.get('FLASK_ENV', 'development')
+    @pytest.mark.parametrize("env,expect_debug,expect_testing", [
+        ("development", True, False),
+        ("testing", False, True),
+        ("production", False, False)
+    ])
+    def test_config_env(self, env, expect_debug, expect_testing, monkeypatch):
+        """Test switching to each environment."""
+        # set_env rebinds config.active_config; monkeypatch restores it afterwards
+        monkeypatch.setattr(config, 'active_config', config.active_config)
+        monkeypatch.setenv('FLASK_ENV', env)
         
-        # Set environment to testing
-        Config.set_env('testing')
-        assert Config.get('TESTING') is True
-        assert Config.get('DEBUG') is False
-        
-        # Set environment to production
-        Config.set_env('production')
-        assert Config.get('TESTING') is False
-        assert Config.get('DEBUG') is False
-        
-        # Set environment to development
-        Config.set_env('development')
-        assert Config.get('TESTING') is False
+        Config.set_env(env)
+        assert Config.get('DEBUG') is expect_debug
+        assert Config.get('TESTING') is expect_testing
+    
+    def test_config_get_follows_active_config(self, monkeypatch):
+        """Test that cached values are dropped when the active configuration changes."""
+        monkeypatch.setattr(config, 'active_config', DevelopmentConfig)
         assert Config.get('DEBUG') is True
         
-        # Test invalid environment
+        monkeypatch.setattr(config, 'active_config', ProductionConfig)
+        assert Config.get('DEBUG') is False
+        assert Config.get('NON_EXISTENT', 'first') == 'first'
+        assert Config.get('NON_EXISTENT', 'second') == 'second'
+    
+    def test_config_env_invalid(self):
+        """Test that an unknown environment is rejected."""
         with pytest.raises(ValueError):
             Config.set_env('invalid_env')
             
-        # Restore original environment
-        Config.set_env(original_env)
-            
     def test_mcdm_method_settings(self):
         """Test MCDM method specific settings."""
         # Test that all required methods are defined
@@ -90,6 +95,7 @@ class TestConfig:
         
     def test_directory_creation(self):
         """Test that necessary directories are created."""
+        BaseConfig.ensure_dirs()
         assert os.path.exists(BaseConfig.DATA_DIR)
         assert os.path.exists(BaseConfig.UPLOAD_FOLDER)
         assert os.path.exists(BaseConfig.LOG_DIR)
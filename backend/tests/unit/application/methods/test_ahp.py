@@ -7,14 +7,49 @@ from domain.entities.criteria import Criteria, OptimizationType
 from domain.entities.decision_matrix import DecisionMatrix
 from utils.exceptions import MethodError, ValidationError
 
+
+def _read_only(rows):
+    """Contiguous float64 array shared by the tests, guarded against writes."""
+    array = np.ascontiguousarray(rows, dtype=np.float64)
+    array.setflags(write=False)
+    return array
+
+
+_VALUES = _read_only([
+    [4.0, 5.0, 3.0],
+    [3.0, 4.0, 5.0],
+    [5.0, 3.0, 4.0]
+])
+
+# Consistent criteria comparison matrix (CR < 0.1)
+_CONSISTENT_COMPARISON = _read_only([
+    [1.0, 3.0, 5.0],
+    [1/3, 1.0, 3.0],
+    [1/5, 1/3, 1.0]
+])
+
+# Inconsistent criteria comparison matrix (CR > 0.1)
+_INCONSISTENT_COMPARISON = _read_only([
+    [1.0, 9.0, 1/9],  # Extremadamente inconsistente
+    [1/9, 1.0, 9.0],
+    [9.0, 1/9, 1.0]
+])
+
+# Pairwise comparison matrices between alternatives, one per criterion
+_ALT_COMP_MATRICES = (
+    _read_only([[1.0, 2.0, 3.0], [0.5, 1.0, 2.0], [1/3, 0.5, 1.0]]),  # Para criterio 1
+    _read_only([[1.0, 0.5, 2.0], [2.0, 1.0, 3.0], [0.5, 1/3, 1.0]]),  # Para criterio 2
+    _read_only([[1.0, 3.0, 0.5], [1/3, 1.0, 0.2], [2.0, 5.0, 1.0]])   # Para criterio 3
+)
+
 class TestAHPMethod:
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def ahp_method(self):
         """Fixture providing an AHP method instance."""
         return AHPMethod()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_decision_matrix(self):
         """Fixture providing a sample decision matrix for testing."""
         # Crear alternativas
@@ -31,37 +66,22 @@ class TestAHPMethod:
             Criteria(id="crit3", name="Criteria 3", optimization_type=OptimizationType.MAXIMIZE, weight=1.0)
         ]
         
-        # Crear valores de la matriz
-        values = np.array([
-            [4.0, 5.0, 3.0],
-            [3.0, 4.0, 5.0],
-            [5.0, 3.0, 4.0]
-        ])
-        
         return DecisionMatrix(
             name="Test Matrix",
             alternatives=alternatives,
             criteria=criteria,
-            values=values
+            values=_VALUES
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def consistent_criteria_comparison_matrix(self):
         """Matriz de comparación de criterios consistente (CR < 0.1)."""
-        return np.array([
-            [1.0, 3.0, 5.0],
-            [1/3, 1.0, 3.0],
-            [1/5, 1/3, 1.0]
-        ])
+        return _CONSISTENT_COMPARISON
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def inconsistent_criteria_comparison_matrix(self):
         """Matriz de comparación de criterios inconsistente (CR > 0.1)."""
-        return np.array([
-            [1.0, 9.0, 1/9],  # Extremadamente inconsistente
-            [1/9, 1.0, 9.0],
-            [9.0, 1/9, 1.0]
-        ])
+        return _INCONSISTENT_COMPARISON
     
     def test_ahp_properties(self, ahp_method):
         """Test that AHP method has correct properties."""
@@ -95,37 +115,14 @@ class TestAHPMethod:
         
         assert ahp_method.validate_parameters(valid_params) == True
     
-    def test_validate_parameters_invalid_threshold(self, ahp_method):
-        """Test parameter validation with invalid consistency threshold."""
-        invalid_params = {
-            'consistency_ratio_threshold': -0.1  # Negative threshold
-        }
-        
-        assert ahp_method.validate_parameters(invalid_params) == False
-    
-    def test_validate_parameters_invalid_method(self, ahp_method):
-        """Test parameter validation with invalid weight calculation method."""
-        invalid_params = {
-            'weight_calculation_method': 'invalid_method'
-        }
-        
-        assert ahp_method.validate_parameters(invalid_params) == False
-    
-    def test_validate_parameters_invalid_matrix_type(self, ahp_method):
-        """Test parameter validation with invalid matrix type."""
-        invalid_params = {
-            'criteria_comparison_matrix': "not a matrix"
-        }
-        
-        assert ahp_method.validate_parameters(invalid_params) == False
-    
-    def test_validate_parameters_non_square_matrix(self, ahp_method):
-        """Test parameter validation with non-square matrix."""
-        non_square_matrix = np.array([[1, 2, 3], [4, 5, 6]])  # 2x3 matrix
-        invalid_params = {
-            'criteria_comparison_matrix': non_square_matrix
-        }
-        
+    @pytest.mark.parametrize("invalid_params", [
+        {'consistency_ratio_threshold': -0.1},  # Negative threshold
+        {'weight_calculation_method': 'invalid_method'},
+        {'criteria_comparison_matrix': "not a matrix"},
+        {'criteria_comparison_matrix': np.array([[1, 2, 3], [4, 5, 6]])}  # 2x3 matrix
+    ], ids=["invalid_threshold", "invalid_method", "invalid_matrix_type", "non_square_matrix"])
+    def test_validate_parameters_invalid(self, ahp_method, invalid_params):
+        """Test parameter validation with invalid parameters."""
         assert ahp_method.validate_parameters(invalid_params) == False
     
     def test_execute_with_consistent_matrix(self, ahp_method, sample_decision_matrix, 
@@ -186,7 +183,8 @@ class TestAHPMethod:
         )
         
         # Verificar que los pesos suman 1
-        assert np.isclose(np.sum(weights), 1.0)
+        assert isinstance(weights, np.ndarray)
+        assert weights.sum() == pytest.approx(1.0, rel=1e-9)
         
         # Verificar que la información de consistencia es correcta
         assert 'consistency_index' in consistency_info
@@ -203,15 +201,9 @@ class TestAHPMethod:
     
     def test_execute_with_pairwise_alternatives(self, ahp_method, sample_decision_matrix):
         """Test AHP execution using pairwise comparison for alternatives."""
-        # Crear matrices de comparación por pares para cada criterio
-        alt_comp_matrices = [
-            np.array([[1.0, 2.0, 3.0], [0.5, 1.0, 2.0], [1/3, 0.5, 1.0]]),  # Para criterio 1
-            np.array([[1.0, 0.5, 2.0], [2.0, 1.0, 3.0], [0.5, 1/3, 1.0]]),  # Para criterio 2
-            np.array([[1.0, 3.0, 0.5], [1/3, 1.0, 0.2], [2.0, 5.0, 1.0]])   # Para criterio 3
-        ]
-        
         params = {
-            'alternatives_comparison_matrices': alt_comp_matrices,
+            # AHP expects a list of matrices, one per criterion
+            'alternatives_comparison_matrices': list(_ALT_COMP_MATRICES),
             'use_pairwise_comparison_for_alternatives': True
         }
         
@@ -221,7 +213,7 @@ class TestAHPMethod:
         metadata = result.metadata
         assert 'alternative_priorities' in metadata
         alt_priorities_array = np.array(metadata['alternative_priorities'])
-        alt_priorities_array.shape == (3, 3)
+        assert alt_priorities_array.shape == (3, 3)
     
     def test_execute_with_automatic_pairwise_generation(self, ahp_method, sample_decision_matrix):
         """Test AHP execution where it automatically generates pairwise matrices."""
@@ -264,14 +256,14 @@ class TestAHPMethod:
         with pytest.raises(MethodError) as exc_info:
             ahp_method.execute(None)
         
-        assert "'NoneType' object has no attribute 'alternative'" in str(exc_info.value)
+        assert exc_info.value.code == "no_decision_matrix"
     
     def test_error_handling_invalid_decision_matrix(self, ahp_method):
         """Test error handling with invalid decision matrix."""
         with pytest.raises(MethodError) as exc_info:
             ahp_method.execute("not a matrix")
         
-        assert "Error executing the AHP method" in str(exc_info.value)
+        assert exc_info.value.code == "invalid_decision_matrix"
     
     def test_error_handling_wrong_matrix_dimensions(self, ahp_method, sample_decision_matrix):
         """Test error handling when comparison matrix has wrong dimensions."""
@@ -299,7 +291,8 @@ class TestAHPMethod:
         weights = ahp_method._approximate_weights(comparison_matrix, 3)
         
         # Verificar que los pesos suman 1
-        assert np.isclose(np.sum(weights), 1.0)
+        assert isinstance(weights, np.ndarray)
+        assert weights.sum() == pytest.approx(1.0, rel=1e-9)
         
         # Verificar que los pesos tienen el orden esperado
         assert weights[0] > weights[1] > weights[2]
\ No newline at end of file
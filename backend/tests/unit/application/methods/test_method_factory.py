@@ -1,6 +1,5 @@
 
 import pytest
-from unittest.mock import Mock, patch
 
 from application.methods.method_factory import MCDMMethodFactory
 from application.methods.method_interface import MCDMMethodInterface
@@ -12,6 +11,21 @@ from utils.exceptions import ValidationError
 
 class TestMCDMMethodFactory:
     
+    @pytest.fixture(scope="module")
+    def factory_registry(self):
+        """Snapshot of the factory registry, taken once for the module."""
+        return MCDMMethodFactory._methods.copy(), MCDMMethodFactory._aliases.copy()
+    
+    @pytest.fixture(autouse=True)
+    def restore_factory_registry(self, factory_registry):
+        """Put the registry back after any test that changed it."""
+        yield
+        methods, aliases = factory_registry
+        if MCDMMethodFactory._methods != methods:
+            MCDMMethodFactory._methods = methods.copy()
+        if MCDMMethodFactory._aliases != aliases:
+            MCDMMethodFactory._aliases = aliases.copy()
+    
     def test_create_method_topsis(self):
         """Test creating TOPSIS method."""
         method = MCDMMethodFactory.create_method("TOPSIS")
@@ -75,6 +89,24 @@ class TestMCDMMethodFactory:
         assert "PROMETHEE" in methods
         assert len(methods) >= 4  # At least these four methods
     
+    def test_get_available_methods_cached(self):
+        """Test that the cached listing and lookup follow registry changes."""
+        methods = MCDMMethodFactory.get_available_methods()
+        methods.append("MUTATED")
+        assert "MUTATED" not in MCDMMethodFactory.get_available_methods()
+        
+        original_methods = MCDMMethodFactory._methods.copy()
+        try:
+            MCDMMethodFactory._methods = {"TOPSIS": TOPSISMethod}
+            assert MCDMMethodFactory.get_available_methods() == ["TOPSIS"]
+            assert isinstance(MCDMMethodFactory.create_method("topsis"), TOPSISMethod)
+            with pytest.raises(ValidationError):
+                MCDMMethodFactory.create_method("Analytic Hierarchy Process")
+        finally:
+            MCDMMethodFactory._methods = original_methods
+        
+        assert MCDMMethodFactory.get_available_methods() == list(original_methods)
+    
     def test_get_method_info(self):
         """Test getting method information."""
         info = MCDMMethodFactory.get_method_info("TOPSIS")
@@ -117,25 +149,20 @@ class TestMCDMMethodFactory:
             def execute(self, decision_matrix, parameters=None):
                 pass
         
-        # Save original methods to restore later
-        original_methods = MCDMMethodFactory._methods.copy()
+        # Register the new method (the registry is restored after the test)
+        version = MCDMMethodFactory.get_registry_version()
+        MCDMMethodFactory.register_method("MOCK", MockMethod)
+        assert MCDMMethodFactory.get_registry_version() == version + 1
         
-        try:
-            # Register the new method
-            MCDMMethodFactory.register_method("MOCK", MockMethod)
-            
-            # Verify it was registered
-            assert "MOCK" in MCDMMethodFactory._methods
-            assert MCDMMethodFactory._methods["MOCK"] == MockMethod
-            
-            # Test creating the method
-            method = MCDMMethodFactory.create_method("MOCK")
-            assert isinstance(method, MockMethod)
-            assert method.name == "MOCK"
-            
-        finally:
-            # Restore original methods
-            MCDMMethodFactory._methods = original_methods
+        # Verify it was registered
+        assert "MOCK" in MCDMMethodFactory._methods
+        assert MCDMMethodFactory._methods["MOCK"] == MockMethod
+        assert "MOCK" in MCDMMethodFactory.get_available_methods()
+        
+        # Test creating the method
+        method = MCDMMethodFactory.create_method("MOCK")
+        assert isinstance(method, MockMethod)
+        assert method.name == "MOCK"
     
     def test_register_method_invalid_class(self):
         """Test error when registering class that doesn't implement interface."""
@@ -177,27 +204,32 @@ class TestMCDMMethodFactory:
         
         assert "A method with the name 'TOPSIS' is already registered" in str(exc_info.value)
     
-    def test_create_method_with_params(self):
+    def test_create_method_with_params(self, monkeypatch):
         """Test creating method with parameters."""
-        # Mock the validate_parameters method
-        with patch.object(TOPSISMethod, 'validate_parameters', return_value=True):
-            params = {'normalization_method': 'vector'}
-            method = MCDMMethodFactory.create_method_with_params("TOPSIS", params)
-            
-            assert isinstance(method, TOPSISMethod)
-            # The validate_parameters method should have been called
-            method.validate_parameters.assert_called_once_with(params)
+        # Stub validate_parameters, recording what it was called with
+        calls = []
+        def validate_parameters(self, parameters):
+            calls.append(parameters)
+            return True
+        monkeypatch.setattr(TOPSISMethod, 'validate_parameters', validate_parameters)
+        
+        params = {'normalization_method': 'vector'}
+        method = MCDMMethodFactory.create_method_with_params("TOPSIS", params)
+        
+        assert isinstance(method, TOPSISMethod)
+        # The validate_parameters method should have been called
+        assert calls == [params]
     
-    def test_create_method_with_params_invalid(self):
+    def test_create_method_with_params_invalid(self, monkeypatch):
         """Test error when parameters are invalid."""
-        # Mock the validate_parameters method to return False
-        with patch.object(TOPSISMethod, 'validate_parameters', return_value=False):
-            params = {'invalid_param': 'value'}
-            
-            with pytest.raises(ValidationError) as exc_info:
-                MCDMMethodFactory.create_method_with_params("TOPSIS", params)
-            
-            assert "Invalid parameters for the TOPSIS method" in str(exc_info.value)
+        # Stub validate_parameters to reject everything
+        monkeypatch.setattr(TOPSISMethod, 'validate_parameters', lambda self, parameters: False)
+        params = {'invalid_param': 'value'}
+        
+        with pytest.raises(ValidationError) as exc_info:
+            MCDMMethodFactory.create_method_with_params("TOPSIS", params)
+        
+        assert "Invalid parameters for the TOPSIS method" in str(exc_info.value)
     
     def test_create_method_with_params_no_params(self):
         """Test creating method without parameters."""
@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
 
+from application.methods import promethee as promethee_module
 from application.methods.promethee import PROMETHEEMethod
 from domain.entities.alternative import Alternative
 from domain.entities.criteria import Criteria, OptimizationType
@@ -171,6 +172,53 @@ class TestPROMETHEEMethod:
             assert result is not None
             assert len(result.scores) == 4
     
+    @pytest.mark.parametrize("func_type", [
+        'usual', 'u-shape', 'v-shape', 'level', 'v-shape-indifference', 'gaussian'
+    ])
+    def test_flows_without_preference_matrix(self, promethee_method, sample_decision_matrix, func_type):
+        """Test that flows match the dense path when the preference matrix is skipped."""
+        params = {
+            'variant': 'II',
+            'default_preference_function': func_type,
+            'q_thresholds': {'crit1': 0.1, 'crit2': 0.25, 'crit3': 0.0},
+            'p_thresholds': {'crit1': 0.5, 'crit2': 0.25, 'crit3': 0.5},
+            's_thresholds': {'crit1': 0.3, 'crit2': 0.3, 'crit3': 0.3}
+        }
+        
+        dense = promethee_method.execute(sample_decision_matrix, params)
+        sorted_flows = promethee_method.execute(
+            sample_decision_matrix, {**params, 'include_preference_matrix': False})
+        
+        assert 'preference_matrix' not in sorted_flows.metadata
+        for flow in ('positive_flow', 'negative_flow', 'net_flow'):
+            np.testing.assert_allclose(sorted_flows.metadata[flow], dense.metadata[flow],
+                                       rtol=0, atol=1e-12)
+    
+    @pytest.mark.parametrize("include_matrix", [True, False])
+    def test_execute_float32(self, promethee_method, sample_decision_matrix, include_matrix):
+        """Test that float32 computation gives the float64 flows within its precision."""
+        params = {'include_preference_matrix': include_matrix}
+        reference = promethee_method.execute(sample_decision_matrix, params)
+        result = promethee_method.execute(sample_decision_matrix, {**params, 'dtype': 'float32'})
+        
+        np.testing.assert_allclose(result.metadata['net_flow'], reference.metadata['net_flow'],
+                                   atol=1e-6)
+        np.testing.assert_array_equal(result.rankings, reference.rankings)
+    
+    def test_blocked_preference_matrix(self, promethee_method, sample_decision_matrix, monkeypatch):
+        """Test that the row-blocked preference matrix matches the single-pass one."""
+        params = {'default_preference_function': 'gaussian'}
+        reference = promethee_method.execute(sample_decision_matrix, params)
+        
+        monkeypatch.setattr(promethee_module, '_BLOCKED_PREFERENCE_SIZE', 0)
+        monkeypatch.setattr(promethee_module, '_PREFERENCE_BLOCK_ROWS', 3)
+        result = promethee_method.execute(sample_decision_matrix, params)
+        
+        np.testing.assert_allclose(result.metadata['preference_matrix'],
+                                   reference.metadata['preference_matrix'], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(result.metadata['net_flow'], reference.metadata['net_flow'],
+                                   rtol=0, atol=1e-12)
+    
     def test_preference_function_calculation(self, promethee_method):
         """Test individual preference function calculations."""
         # Test usual function
@@ -190,6 +238,31 @@ class TestPROMETHEEMethod:
         assert promethee_method._apply_preference_function(0.3, 4, 0.5, 0.2, 0.0) == 0.5
         assert promethee_method._apply_preference_function(0.6, 4, 0.5, 0.2, 0.0) == 1.0
     
+    @pytest.mark.parametrize("func_type,expected", [
+        (1, [0.0, 0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]),
+        (2, [0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0]),
+        (3, [0.0, 0.0, 0.2, 0.4, 0.7, 1.0, 1.0, 1.0]),
+        (4, [0.0, 0.0, 0.0, 0.0, 0.5, 0.5, 1.0, 1.0]),
+        (5, [0.0, 0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 1.0]),
+    ])
+    def test_preference_values(self, promethee_method, func_type, expected):
+        """Test the preference functions applied to a whole difference matrix."""
+        diff = np.array([-0.4, 0.0, 0.1, 0.2, 0.35, 0.5, 0.7, 1.2]).reshape(2, 4)
+        
+        values = promethee_method._preference_values(diff, func_type, 0.5, 0.2, 0.3)
+        
+        assert values.shape == diff.shape
+        np.testing.assert_allclose(values.ravel(), expected)
+    
+    def test_preference_values_gaussian(self, promethee_method):
+        """Test the Gaussian preference function on a difference matrix."""
+        diff = np.array([[-0.4, 0.0], [0.3, 0.6]])
+        
+        values = promethee_method._preference_values(diff, 6, 0.5, 0.2, 0.3)
+        
+        np.testing.assert_allclose(values, [[0.0, 0.0],
+                                            [1 - np.exp(-0.5), 1 - np.exp(-2.0)]])
+    
     def test_flow_calculation(self, promethee_method, sample_decision_matrix):
         """Test preference flow calculations."""
         result = promethee_method.execute(sample_decision_matrix)
@@ -227,6 +300,26 @@ class TestPROMETHEEMethod:
                 assert isinstance(j, int)
                 assert i != j
     
+    def test_promethee_i_ranking(self, promethee_method):
+        """Test outranking, indifference and incomparability from the flows."""
+        positive_flow = np.array([0.5, 0.3, 0.3, 0.5])
+        negative_flow = np.array([0.4, 0.1, 0.1, 0.2])
+        
+        outranking_matrix, incomparabilities = promethee_method._promethee_i_ranking(
+            positive_flow, negative_flow, 4)
+        
+        # alt4 outranks alt1 (same positive flow, lower negative flow), alt2 and
+        # alt3 are indifferent, and alt1/alt4 conflict with alt2/alt3 (higher
+        # positive flow but also higher negative flow)
+        expected = np.array([
+            [0.0, -1.0, -1.0, 0.0],
+            [-1.0, 0.0, 0.5, -1.0],
+            [-1.0, 0.5, 0.0, -1.0],
+            [1.0, -1.0, -1.0, 0.0]
+        ])
+        np.testing.assert_array_equal(outranking_matrix, expected)
+        assert incomparabilities == [(0, 1), (0, 2), (1, 3), (2, 3)]
+    
     def test_error_handling_missing_parameters(self, promethee_method, sample_decision_matrix):
         """Test error handling when parameters are missing."""
         params = None  # No parameters provided
@@ -130,7 +130,7 @@ class TestTOPSISMethod:
         # Los valores normalizados deberían ser iguales a los originales
         assert np.array_equal(
             result.metadata['normalized_values'], 
-            sample_decision_matrix.values.tolist()
+            sample_decision_matrix.values
         )
     
     def test_execute_with_different_normalization(self, topsis_method, sample_decision_matrix):
@@ -145,8 +145,9 @@ class TestTOPSISMethod:
         
         # Verificar que diferentes métodos producen diferentes resultados
         # (pueden coincidir en algunos casos, pero no en general)
-        unique_scores = set(tuple(scores) for scores in results.values())
-        assert len(unique_scores) > 1
+        # Rounded so that rows differing only by floating-point noise count once
+        stacked_scores = np.round(np.stack(list(results.values())), 10)
+        assert len(np.unique(stacked_scores, axis=0)) > 1
     
     def test_execute_with_different_distance_metrics(self, topsis_method, sample_decision_matrix):
         """Test TOPSIS with different distance metrics."""
@@ -159,8 +160,9 @@ class TestTOPSISMethod:
             results[metric] = result.scores
         
         # Verificar que diferentes métricas producen diferentes resultados
-        unique_scores = set(tuple(scores) for scores in results.values())
-        assert len(unique_scores) > 1
+        # Rounded so that rows differing only by floating-point noise count once
+        stacked_scores = np.round(np.stack(list(results.values())), 10)
+        assert len(np.unique(stacked_scores, axis=0)) > 1
     
     def test_parameter_validation_strict(self, topsis_method):
         """Test strict parameter validation."""
@@ -208,6 +210,21 @@ class TestTOPSISMethod:
         # Todas las alternativas deberían tener el mismo score
         assert np.allclose(result.scores, 0.5)
     
+    def test_weight_sweep_equal_values_matches_execute(self, topsis_method):
+        """Test that the weight sweep scores a tied matrix like execute does."""
+        matrix = DecisionMatrix(
+            name="Equal Values",
+            alternatives=[Alternative(id=f"alt{i}", name=f"Alternative {i}") for i in range(3)],
+            criteria=[Criteria(id=f"crit{i}", name=f"Criteria {i}") for i in range(2)],
+            values=np.ones((3, 2))
+        )
+        weight_sets = np.array([[0.2, 0.8], [0.5, 0.5], [0.9, 0.1]])
+        
+        scores = topsis_method.execute_weight_sweep(matrix, weight_sets)
+        
+        np.testing.assert_allclose(scores, np.tile(topsis_method.execute(matrix).scores, (3, 1)))
+        np.testing.assert_allclose(scores, 0.5)
+    
     def test_prepare_execution_invalid_parameters(self, topsis_method):
         """Test that _prepare_execution raises error with invalid parameters."""
         invalid_params = {
@@ -276,6 +293,21 @@ class TestTOPSISMethod:
         expected_chebyshev = [3.0, 6.0]  # max(|1|,|2|,|3|) = 3, max(|4|,|5|,|6|) = 6
         assert np.allclose(chebyshev_distances, expected_chebyshev)
     
+    def test_scratch_buffer_reuse(self, topsis_method):
+        """Test that work buffers are reused per shape and dropped on a shape change."""
+        buffer = topsis_method._scratch_buffer((3, 2), np.float64)
+        
+        assert topsis_method._scratch_buffer((3, 2), np.float64) is buffer
+        assert topsis_method._scratch_buffer((3, 2), np.float32) is not buffer
+        assert len(topsis_method._scratch) == 1
+        
+        # Distances written through the buffer are not views of it
+        values = np.array([[0.0, 3.0], [4.0, 0.0], [1.0, 1.0]])
+        distances = topsis_method._calculate_distances(values, np.zeros(2), 2, 'euclidean',
+                                                       out=buffer)
+        buffer.fill(np.nan)
+        np.testing.assert_allclose(distances, [3.0, 4.0, np.sqrt(2.0)])
+    
     def test_error_handling_invalid_matrix(self, topsis_method):
         """Test error handling with invalid decision matrix."""
         with pytest.raises(MethodError) as exc_info:
@@ -323,6 +355,18 @@ class TestTOPSISMethod:
         result = topsis_method.execute(matrix)
         assert result.method_name == "TOPSIS"
     
+    def test_execute_float32(self, topsis_method, sample_decision_matrix):
+        """Test that float32 computation gives the float64 scores within its precision."""
+        reference = topsis_method.execute(sample_decision_matrix)
+        result = topsis_method.execute(sample_decision_matrix, {'dtype': 'float32'})
+        
+        assert result.metadata['weighted_matrix'].dtype == np.float32
+        np.testing.assert_allclose(result.scores, reference.scores, atol=1e-6)
+        np.testing.assert_array_equal(result.rankings, reference.rankings)
+        
+        assert not topsis_method.validate_parameters(
+            {'normalization_method': 'vector', 'dtype': 'float16'})
+    
     def test_weights_normalization(self, topsis_method, sample_decision_matrix):
         """Test that criteria weights are properly normalized."""
         # Modificar los pesos para que no sumen 1
@@ -0,0 +1,44 @@
+# backend/tests/unit/application/services/conftest.py
+import numpy as np
+import pytest
+
+from domain.entities.project import Project
+from domain.entities.alternative import Alternative
+from domain.entities.criteria import Criteria, OptimizationType
+from domain.entities.decision_matrix import DecisionMatrix
+
+
+@pytest.fixture(scope="session")
+def make_project():
+    """Fixture returning a builder for sample projects.
+
+    make_project(n_alternatives, n_criteria) gives alternatives alt1..altN and
+    criteria crit1..critM (odd ones maximized, even ones minimized) with a
+    decision matrix of the given values, 1..N*M row by row by default.
+    """
+    def build(n_alternatives, n_criteria, weights=None, values=None,
+              name="Test Project", description=""):
+        project = Project(name=name, description=description)
+
+        for i in range(1, n_alternatives + 1):
+            project.add_alternative(Alternative(id=f"alt{i}", name=f"Alternative {i}"))
+
+        if weights is None:
+            weights = [1.0 / n_criteria] * n_criteria
+        for j, weight in enumerate(weights, start=1):
+            optimization_type = OptimizationType.MAXIMIZE if j % 2 else OptimizationType.MINIMIZE
+            project.add_criteria(Criteria(id=f"crit{j}", name=f"Criteria {j}",
+                                          optimization_type=optimization_type, weight=weight))
+
+        if values is None:
+            values = np.arange(1.0, n_alternatives * n_criteria + 1).reshape(
+                n_alternatives, n_criteria)
+        project.set_decision_matrix(DecisionMatrix(
+            alternatives=project.alternatives,
+            criteria=project.criteria,
+            values=values
+        ))
+
+        return project
+
+    return build
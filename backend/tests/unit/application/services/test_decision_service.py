@@ -1,18 +1,33 @@
 
 import pytest
 import numpy as np
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 from datetime import datetime
 
+from application.services import decision_service as decision_module
 from application.services.decision_service import DecisionService
 from domain.entities.project import Project
 from domain.entities.alternative import Alternative
 from domain.entities.criteria import Criteria, OptimizationType, ScaleType
 from domain.entities.decision_matrix import DecisionMatrix
 from domain.entities.result import Result
+from application.methods.method_factory import MCDMMethodFactory
 from application.methods.method_interface import MCDMMethodInterface
+from application.methods.topsis import TOPSISMethod
 from utils.exceptions import ServiceError, ValidationError, MethodError
 
+
+def _read_only(array):
+    array.setflags(write=False)
+    return array
+
+
+# Shared test data, built once; DecisionMatrix and Result copy what they are given
+_MATRIX_VALUES = _read_only(np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]))
+_MOCK_SCORES = _read_only(np.array([0.5, 0.7, 0.3]))
+_SCORES_1 = _read_only(np.array([0.7, 0.5, 0.3]))
+_SCORES_2 = _read_only(np.array([0.6, 0.5, 0.4]))
+
 class TestDecisionService:
     
     @pytest.fixture
@@ -20,58 +35,56 @@ class TestDecisionService:
         """Fixture providing a DecisionService instance."""
         return DecisionService()
     
+    @pytest.fixture(scope="module")
+    def sample_project(self, make_project):
+        """Fixture providing a sample project shared by the module; tests that
+        add results or change values must use sample_project_fresh instead."""
+        return make_project(3, 2, weights=[0.6, 0.4], values=_MATRIX_VALUES)
+    
     @pytest.fixture
-    def sample_project(self):
-        """Fixture providing a sample project with alternatives and criteria."""
-        project = Project(name="Test Project")
-        
-        # Add alternatives
-        alternatives = [
-            Alternative(id="alt1", name="Alternative 1"),
-            Alternative(id="alt2", name="Alternative 2"),
-            Alternative(id="alt3", name="Alternative 3")
-        ]
-        for alt in alternatives:
-            project.add_alternative(alt)
-        
-        # Add criteria
-        criteria = [
-            Criteria(id="crit1", name="Criteria 1", optimization_type=OptimizationType.MAXIMIZE, weight=0.6),
-            Criteria(id="crit2", name="Criteria 2", optimization_type=OptimizationType.MINIMIZE, weight=0.4)
-        ]
-        for crit in criteria:
-            project.add_criteria(crit)
-        
-        # Create decision matrix
-        values = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
-        project.create_decision_matrix(values=values)
-        
-        return project
+    def sample_project_fresh(self, make_project):
+        """Fixture providing a sample project the test is free to modify."""
+        return make_project(3, 2, weights=[0.6, 0.4], values=_MATRIX_VALUES)
     
     @pytest.fixture
     def mock_method(self):
         """Fixture providing a mock MCDM method."""
         method = Mock(spec=MCDMMethodInterface)
         method.name = "MockMethod"
-        result = Result(
+        # A new result each time, since the service may annotate the one it gets
+        method.execute.return_value = Result(
             method_name="MockMethod",
             alternative_ids=["alt1", "alt2", "alt3"],
             alternative_names=["Alternative 1", "Alternative 2", "Alternative 3"],
-            scores=np.array([0.5, 0.7, 0.3])
+            scores=_MOCK_SCORES
         )
-        method.execute.return_value = result
         return method
     
-    def test_get_available_methods(self, decision_service):
+    @pytest.fixture
+    def stub_factory(self, monkeypatch):
+        """Fixture returning a helper that replaces MCDMMethodFactory class methods
+        for the current test, either with a fixed return value or a side effect
+        (an exception to raise or a function to call)."""
+        def stub(method_name, return_value=None, side_effect=None):
+            def replacement(*args, **kwargs):
+                if isinstance(side_effect, BaseException):
+                    raise side_effect
+                if side_effect is not None:
+                    return side_effect(*args, **kwargs)
+                return return_value
+            monkeypatch.setattr(MCDMMethodFactory, method_name, staticmethod(replacement))
+        return stub
+    
+    def test_get_available_methods(self, decision_service, stub_factory):
         """Test getting available MCDM methods."""
-        with patch('application.services.decision_service.MCDMMethodFactory.get_available_methods',
-                  return_value=['TOPSIS', 'AHP', 'ELECTRE', 'PROMETHEE']):
-            methods = decision_service.get_available_methods()
-            assert len(methods) == 4
-            assert 'TOPSIS' in methods
-            assert 'AHP' in methods
+        stub_factory('get_available_methods',
+                     return_value=['TOPSIS', 'AHP', 'ELECTRE', 'PROMETHEE'])
+        methods = decision_service.get_available_methods()
+        assert len(methods) == 4
+        assert 'TOPSIS' in methods
+        assert 'AHP' in methods
     
-    def test_get_method_info(self, decision_service):
+    def test_get_method_info(self, decision_service, stub_factory):
         """Test getting method information."""
         expected_info = {
             'name': 'TOPSIS',
@@ -80,30 +93,28 @@ class TestDecisionService:
             'default_parameters': {}
         }
         
-        with patch('application.services.decision_service.MCDMMethodFactory.get_method_info',
-                  return_value=expected_info):
-            info = decision_service.get_method_info('TOPSIS')
-            assert info['name'] == 'TOPSIS'
-            assert 'full_name' in info
+        stub_factory('get_method_info', return_value=expected_info)
+        info = decision_service.get_method_info('TOPSIS')
+        assert info['name'] == 'TOPSIS'
+        assert 'full_name' in info
     
-    def test_get_method_info_error(self, decision_service):
+    def test_get_method_info_error(self, decision_service, stub_factory):
         """Test error when getting method info."""
-        with patch('application.services.decision_service.MCDMMethodFactory.get_method_info',
-                  side_effect=ValidationError("Method not found")):
-            with pytest.raises(ServiceError) as exc_info:
-                decision_service.get_method_info('NonExistent')
-            assert "Error retrieving method information" in str(exc_info.value)
+        stub_factory('get_method_info', side_effect=ValidationError("Method not found"))
+        with pytest.raises(ServiceError) as exc_info:
+            decision_service.get_method_info('NonExistent')
+        assert "Error retrieving method information" in str(exc_info.value)
     
-    def test_execute_method_success(self, decision_service, sample_project, mock_method):
+    def test_execute_method_success(self, decision_service, sample_project_fresh, mock_method,
+                                    stub_factory):
         """Test successful method execution."""
-        with patch('application.services.decision_service.MCDMMethodFactory.create_method_with_params',
-                  return_value=mock_method):
-            result = decision_service.execute_method(
-                sample_project, "MockMethod", {"param": "value"})
-            
-            assert result.method_name == "MockMethod"
-            assert len(result.alternative_ids) == 3
-            mock_method.execute.assert_called_once()
+        stub_factory('create_method_with_params', return_value=mock_method)
+        result = decision_service.execute_method(
+            sample_project_fresh, "MockMethod", {"param": "value"})
+        
+        assert result.method_name == "MockMethod"
+        assert len(result.alternative_ids) == 3
+        mock_method.execute.assert_called_once()
     
     def test_execute_method_no_matrix(self, decision_service):
         """Test error when project has no decision matrix."""
@@ -113,27 +124,26 @@ class TestDecisionService:
             decision_service.execute_method(project, "TOPSIS")
         assert "The project has no decision matrix" in str(exc_info.value)
     
-    def test_execute_method_validation_error(self, decision_service, sample_project):
+    def test_execute_method_validation_error(self, decision_service, sample_project, stub_factory):
         """Test error when method validation fails."""
-        with patch('application.services.decision_service.MCDMMethodFactory.create_method_with_params',
-                  side_effect=ValidationError("Invalid parameters")):
-            with pytest.raises(ServiceError) as exc_info:
-                decision_service.execute_method(sample_project, "TOPSIS", {"invalid": "param"})
-            assert "Error executing method TOPSIS" in str(exc_info.value)
+        stub_factory('create_method_with_params', side_effect=ValidationError("Invalid parameters"))
+        with pytest.raises(ServiceError) as exc_info:
+            decision_service.execute_method(sample_project, "TOPSIS", {"invalid": "param"})
+        assert "Error executing method TOPSIS" in str(exc_info.value)
     
-    def test_execute_all_methods_success(self, decision_service, sample_project, mock_method):
+    def test_execute_all_methods_success(self, decision_service, sample_project_fresh, mock_method,
+                                         stub_factory):
         """Test successful execution of all methods."""
-        with patch('application.services.decision_service.MCDMMethodFactory.get_available_methods',
-                  return_value=['Method1', 'Method2']):
-            with patch('application.services.decision_service.MCDMMethodFactory.create_method_with_params',
-                      return_value=mock_method):
-                results = decision_service.execute_all_methods(sample_project)
-                
-                assert len(results) == 2
-                assert 'Method1' in results
-                assert 'Method2' in results
+        stub_factory('get_available_methods', return_value=['Method1', 'Method2'])
+        stub_factory('create_method_with_params', return_value=mock_method)
+        results = decision_service.execute_all_methods(sample_project_fresh)
+        
+        assert len(results) == 2
+        assert 'Method1' in results
+        assert 'Method2' in results
     
-    def test_execute_all_methods_partial_failure(self, decision_service, sample_project, mock_method):
+    def test_execute_all_methods_partial_failure(self, decision_service, sample_project_fresh, mock_method,
+                                                 stub_factory):
         """Test partial failure when executing multiple methods."""
         def create_method_side_effect(name, params):
             if name == 'TOPSIS':
@@ -141,36 +151,80 @@ class TestDecisionService:
             else:
                 raise ValidationError("Method not available")
         
-        with patch('application.services.decision_service.MCDMMethodFactory.get_available_methods',
-                  return_value=['TOPSIS', 'AHP']):
-            with patch('application.services.decision_service.MCDMMethodFactory.create_method_with_params',
-                      side_effect=create_method_side_effect):
-                results = decision_service.execute_all_methods(sample_project)
-                
-                assert len(results) == 1
-                assert 'TOPSIS' in results
-                assert 'AHP' not in results
-    
-    def test_compare_methods_success(self, decision_service, sample_project):
+        stub_factory('get_available_methods', return_value=['TOPSIS', 'AHP'])
+        stub_factory('create_method_with_params', side_effect=create_method_side_effect)
+        results = decision_service.execute_all_methods(sample_project_fresh)
+        
+        assert len(results) == 1
+        assert 'TOPSIS' in results
+        assert 'AHP' not in results
+
+    def test_execute_all_methods_parallel(self, monkeypatch):
+        """Test executing all methods in worker processes."""
+        monkeypatch.setattr(decision_module, '_PARALLEL_MIN_CELLS', 0)
+        project = Project(name="Parallel Project")
+        project.add_alternative(Alternative(id="alt1", name="Alternative 1"))
+        project.add_alternative(Alternative(id="alt2", name="Alternative 2"))
+        project.add_alternative(Alternative(id="alt3", name="Alternative 3"))
+        project.add_criteria(Criteria(id="crit1", name="Criteria 1", weight=0.6))
+        project.add_criteria(Criteria(id="crit2", name="Criteria 2",
+                                      optimization_type=OptimizationType.MINIMIZE, weight=0.4))
+        project.set_decision_matrix(DecisionMatrix(
+            alternatives=project.alternatives,
+            criteria=project.criteria,
+            values=[[1.0, 2.0], [3.0, 4.0], [5.0, 1.0]]
+        ))
+
+        parallel_service = DecisionService(max_workers=2)
+        try:
+            parallel_results = parallel_service.execute_all_methods(
+                project, {'ELECTRE': {'variant': 'unknown'}})
+            executor = parallel_service._executor
+            parallel_service.execute_all_methods(project)
+            assert executor is not None
+            assert parallel_service._executor is executor
+        finally:
+            parallel_service.shutdown()
+        serial_results = DecisionService(max_workers=1).execute_all_methods(project)
+
+        assert 'ELECTRE' not in parallel_results
+        assert set(project.results) >= set(parallel_results)
+        for method_name, result in parallel_results.items():
+            assert np.allclose(result.scores, serial_results[method_name].scores)
+            assert result.get_metadata('execution_errors')
+
+    def test_execute_all_methods_small_matrix_serial(self):
+        """Test that small matrices and the default service stay in process."""
+        matrix = DecisionMatrix(
+            alternatives=[Alternative(id="alt1", name="Alternative 1"),
+                          Alternative(id="alt2", name="Alternative 2")],
+            criteria=[Criteria(id="crit1", name="Criteria 1")],
+            values=[[1.0], [2.0]]
+        )
+        
+        assert not DecisionService()._use_workers(matrix, 4)
+        assert not DecisionService(max_workers=4)._use_workers(matrix, 4)
+
+    def test_compare_methods_success(self, decision_service, sample_project_fresh):
         """Test successful method comparison."""
         # Add results to the project for comparison
         result1 = Result(
             method_name="TOPSIS",
             alternative_ids=["alt1", "alt2", "alt3"],
             alternative_names=["Alternative 1", "Alternative 2", "Alternative 3"],
-            scores=np.array([0.7, 0.5, 0.3])
+            scores=_SCORES_1
         )
         result2 = Result(
             method_name="AHP",
             alternative_ids=["alt1", "alt2", "alt3"],
             alternative_names=["Alternative 1", "Alternative 2", "Alternative 3"],
-            scores=np.array([0.6, 0.5, 0.4])
+            scores=_SCORES_2
         )
         
-        sample_project.add_result("TOPSIS", result1)
-        sample_project.add_result("AHP", result2)
+        sample_project_fresh.add_result("TOPSIS", result1)
+        sample_project_fresh.add_result("AHP", result2)
         
-        comparison = decision_service.compare_methods(sample_project, ["TOPSIS", "AHP"])
+        comparison = decision_service.compare_methods(sample_project_fresh, ["TOPSIS", "AHP"])
         
         assert 'rankings_correlation' in comparison
         assert 'consensus' in comparison
@@ -181,17 +235,114 @@ class TestDecisionService:
             decision_service.compare_methods(sample_project)
         assert "The project has no MCDM method results" in str(exc_info.value)
     
-    def test_perform_sensitivity_analysis_success(self, decision_service, sample_project, mock_method):
+    def test_perform_sensitivity_analysis_success(self, decision_service, sample_project_fresh,
+                                                  mock_method, stub_factory):
         """Test successful sensitivity analysis."""
-        with patch('application.services.decision_service.MCDMMethodFactory.create_method',
-                  return_value=mock_method):
-            sensitivity_results = decision_service.perform_sensitivity_analysis(
-                sample_project, "MockMethod", "crit1", (0.1, 1.0), 5)
-            
-            assert 'method' in sensitivity_results
-            assert 'criteria' in sensitivity_results
-            assert 'weights_tested' in sensitivity_results
-            assert len(sensitivity_results['weights_tested']) == 5
+        stub_factory('create_method', return_value=mock_method)
+        sensitivity_results = decision_service.perform_sensitivity_analysis(
+            sample_project_fresh, "MockMethod", "crit1", (0.1, 1.0), 5)
+        
+        assert 'method' in sensitivity_results
+        assert 'criteria' in sensitivity_results
+        assert 'weights_tested' in sensitivity_results
+        assert len(sensitivity_results['weights_tested']) == 5
+    
+    def test_perform_sensitivity_analysis_topsis_batched(self, decision_service):
+        """Test that the batched TOPSIS sweep matches one execution per weight."""
+        project = Project(name="Sensitivity Project")
+        for i in range(4):
+            project.add_alternative(Alternative(id=f"alt{i}", name=f"Alternative {i}"))
+        project.add_criteria(Criteria(id="crit1", name="Criteria 1", weight=0.5))
+        project.add_criteria(Criteria(id="crit2", name="Criteria 2",
+                                      optimization_type=OptimizationType.MINIMIZE, weight=0.3))
+        project.add_criteria(Criteria(id="crit3", name="Criteria 3", weight=0.2))
+        values = [[7.0, 3.0, 5.0], [4.0, 1.0, 9.0], [8.0, 6.0, 2.0], [5.0, 2.0, 6.0]]
+        project.set_decision_matrix(DecisionMatrix(
+            alternatives=project.alternatives,
+            criteria=project.criteria,
+            values=values
+        ))
+        
+        sensitivity_results = decision_service.perform_sensitivity_analysis(
+            project, "TOPSIS", "crit2", (0.1, 0.9), 5)
+        
+        criteria = project.get_criteria_by_id("crit2")
+        method = TOPSISMethod()
+        for weight, scores, rankings in zip(sensitivity_results['weights_tested'],
+                                            sensitivity_results['scores'],
+                                            sensitivity_results['rankings']):
+            criteria.weight = weight
+            expected = method.execute(project.decision_matrix)
+            assert np.allclose(scores, expected.scores)
+            assert rankings == expected.rankings.tolist()
+        criteria.weight = 0.3
+        
+        assert project.decision_matrix.values.tolist() == values
+        assert len(sensitivity_results['rankings']) == 5
+    
+    def test_perform_sensitivity_analysis_loaded_project(self, decision_service):
+        """Test that the sweep changes the weight seen by the method on a project loaded from a dict."""
+        project = Project(name="Loaded Project")
+        for i in range(3):
+            project.add_alternative(Alternative(id=f"alt{i}", name=f"Alternative {i}"))
+        project.add_criteria(Criteria(id="crit1", name="Criteria 1", weight=0.4))
+        project.add_criteria(Criteria(id="crit2", name="Criteria 2",
+                                      optimization_type=OptimizationType.MINIMIZE, weight=0.3))
+        project.add_criteria(Criteria(id="crit3", name="Criteria 3", weight=0.3))
+        project.set_decision_matrix(DecisionMatrix(
+            alternatives=project.alternatives,
+            criteria=project.criteria,
+            values=[[9.0, 5.0, 3.0], [4.0, 2.0, 8.0], [6.0, 1.0, 5.0]]
+        ))
+        loaded = Project.from_dict(project.to_dict())
+        
+        results = decision_service.perform_sensitivity_analysis(
+            loaded, "PROMETHEE", "crit1", (0.0, 1.0), 5)
+        
+        assert results['rankings'] == [[2, 1, 3], [1, 2, 3], [1, 2, 3], [1, 3, 2], [1, 3, 2]]
+        assert results['rankings'] == decision_service.perform_sensitivity_analysis(
+            project, "PROMETHEE", "crit1", (0.0, 1.0), 5)['rankings']
+        assert loaded.decision_matrix.get_criteria_by_id("crit1")[1].weight == 0.4
+    
+    def test_perform_sensitivity_analysis_parallel(self, monkeypatch):
+        """Test that the parallel sensitivity sweep matches the serial one."""
+        monkeypatch.setattr(decision_module, '_PARALLEL_MIN_CELLS', 0)
+        project = Project(name="Sensitivity Project")
+        for i in range(4):
+            project.add_alternative(Alternative(id=f"alt{i}", name=f"Alternative {i}"))
+        project.add_criteria(Criteria(id="crit1", name="Criteria 1", weight=0.5))
+        project.add_criteria(Criteria(id="crit2", name="Criteria 2",
+                                      optimization_type=OptimizationType.MINIMIZE, weight=0.3))
+        project.add_criteria(Criteria(id="crit3", name="Criteria 3", weight=0.2))
+        values = [[7.0, 3.0, 5.0], [4.0, 1.0, 9.0], [8.0, 6.0, 2.0], [5.0, 2.0, 6.0]]
+        project.set_decision_matrix(DecisionMatrix(
+            alternatives=project.alternatives,
+            criteria=project.criteria,
+            values=values
+        ))
+        
+        parallel_service = DecisionService(max_workers=2)
+        try:
+            parallel = parallel_service.perform_sensitivity_analysis(
+                project, "PROMETHEE", "crit1", (0.1, 0.9), 4)
+            assert parallel_service._executor is not None
+        finally:
+            parallel_service.shutdown()
+        serial = DecisionService(max_workers=1).perform_sensitivity_analysis(
+            project, "PROMETHEE", "crit1", (0.1, 0.9), 4)
+        
+        assert np.allclose(parallel['scores'], serial['scores'])
+        assert parallel['rankings'] == serial['rankings']
+        assert project.get_criteria_by_id("crit1").weight == 0.5
+        assert project.decision_matrix.values.tolist() == values
+    
+    def test_rank_scores_ties(self):
+        """Test that batched ranking gives tied scores the same rank."""
+        scores = np.array([[0.2, 0.8, 0.8, 0.5], [0.4, 0.4, 0.4, 0.9]])
+        
+        rankings = DecisionService._rank_scores(scores)
+        
+        assert rankings.tolist() == [[4, 1, 1, 3], [2, 2, 2, 1]]
     
     def test_perform_sensitivity_analysis_no_matrix(self, decision_service):
         """Test error in sensitivity analysis when no decision matrix."""
@@ -260,10 +411,10 @@ class TestDecisionService:
         assert matrix.name == "Test Matrix"
         assert matrix.shape == (1, 1)
     
-    def test_set_matrix_value(self, decision_service, sample_project):
+    def test_set_matrix_value(self, decision_service, sample_project_fresh):
         """Test setting value in decision matrix."""
-        decision_service.set_matrix_value(sample_project, "alt1", "crit1", 10.0)
-        matrix = sample_project.decision_matrix
+        decision_service.set_matrix_value(sample_project_fresh, "alt1", "crit1", 10.0)
+        matrix = sample_project_fresh.decision_matrix
         # Corregir el nombre del método aquí
         assert matrix.get_values(0, 0) == 10.0
     
@@ -275,29 +426,86 @@ class TestDecisionService:
             decision_service.set_matrix_value(project, "alt1", "crit1", 10.0)
         assert "The project has no decision matrix" in str(exc_info.value)
     
-    def test_calculate_ranking_correlation(self, decision_service, sample_project):
+    def test_calculate_ranking_correlation(self, decision_service, sample_project_fresh):
         """Test internal method for calculating ranking correlation."""
         # Create two results with different rankings
         result1 = Result(
             method_name="Method1",
             alternative_ids=["alt1", "alt2", "alt3"],
             alternative_names=["Alt 1", "Alt 2", "Alt 3"],
-            scores=np.array([0.7, 0.5, 0.3])
+            scores=_SCORES_1
         )
         result2 = Result(
             method_name="Method2",
             alternative_ids=["alt1", "alt2", "alt3"],
             alternative_names=["Alt 1", "Alt 2", "Alt 3"],
-            scores=np.array([0.6, 0.5, 0.4])
+            scores=_SCORES_2
         )
         
-        sample_project.add_result("Method1", result1)
-        sample_project.add_result("Method2", result2)
+        sample_project_fresh.add_result("Method1", result1)
+        sample_project_fresh.add_result("Method2", result2)
         
         correlation = decision_service._calculate_ranking_correlation(
-            sample_project, ["Method1", "Method2"])
+            sample_project_fresh, ["Method1", "Method2"])
         
         assert 'Method1' in correlation
         assert 'Method2' in correlation
         assert correlation['Method1']['Method1'] == 1.0
-        assert 'Method2' in correlation['Method1']
\ No newline at end of file
+        assert 'Method2' in correlation['Method1']
+    
+    def test_calculate_ranking_correlation_values(self, decision_service):
+        """Test the batched correlation against the Spearman formula worked out by hand."""
+        project = Project(name="Correlation Project")
+        ids = ["alt1", "alt2", "alt3", "alt4"]
+        scores = {
+            "Method1": [0.9, 0.1, 0.5, 0.3],
+            "Method2": [0.2, 0.8, 0.4, 0.6],
+            "Method3": [0.7, 0.3, 0.5, 0.6]
+        }
+        for method_name, method_scores in scores.items():
+            project.add_result(method_name, Result(
+                method_name=method_name,
+                alternative_ids=ids,
+                alternative_names=ids,
+                scores=np.array(method_scores)
+            ))
+        
+        correlation = decision_service._calculate_ranking_correlation(project, list(scores))
+        
+        # Rankings [1, 4, 2, 3], [4, 1, 3, 2] and [1, 4, 3, 2]: 1 - 6 * sum(d^2) / (n * (n^2 - 1))
+        expected = {
+            "Method1": {"Method1": 1.0, "Method2": -1.0, "Method3": 0.8},
+            "Method2": {"Method1": -1.0, "Method2": 1.0, "Method3": -0.8},
+            "Method3": {"Method1": 0.8, "Method2": -0.8, "Method3": 1.0}
+        }
+        for method1, row in expected.items():
+            for method2, value in row.items():
+                assert correlation[method1][method2] == pytest.approx(value)
+    
+    def test_calculate_consensus_aligns_result_order(self, decision_service):
+        """Test consensus when results list alternatives in a different order than the project."""
+        project = Project(name="Consensus Project")
+        for alt_id in ["alt1", "alt2", "alt3"]:
+            project.add_alternative(Alternative(id=alt_id, name=alt_id))
+        project.add_result("Method1", Result(
+            method_name="Method1",
+            alternative_ids=["alt1", "alt2", "alt3"],
+            alternative_names=["alt1", "alt2", "alt3"],
+            scores=np.array([0.9, 0.5, 0.1])
+        ))
+        project.add_result("Method2", Result(
+            method_name="Method2",
+            alternative_ids=["alt3", "alt1", "alt2"],
+            alternative_names=["alt3", "alt1", "alt2"],
+            scores=np.array([0.2, 0.4, 0.8])
+        ))
+        
+        consensus = decision_service._calculate_consensus(project, ["Method1", "Method2"])
+        
+        assert consensus['concordance_matrix'] == [
+            [0.0, 0.5, 1.0],
+            [0.5, 0.0, 1.0],
+            [0.0, 0.0, 0.0]
+        ]
+        assert consensus['top_3_counts'] == {"alt1": 2, "alt2": 2, "alt3": 2}
+        assert consensus['consensus_level'] == pytest.approx(3.0 / 9)
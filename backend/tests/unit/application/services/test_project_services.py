@@ -28,29 +28,12 @@ class TestProjectService:
         """Fixture providing a project service instance with mock repository."""
         return ProjectService(mock_repository)
     
-    @pytest.fixture
-    def sample_project(self):
-        """Fixture providing a sample project for testing."""
-        project = Project(name="Test Project", description="Test Description")
-        
-        # Add alternatives
-        alternatives = [
-            Alternative(id="alt1", name="Alternative 1"),
-            Alternative(id="alt2", name="Alternative 2")
-        ]
-        for alt in alternatives:
-            project.add_alternative(alt)
-        
-        # Add criteria
-        criteria = [
-            Criteria(id="crit1", name="Criteria 1", optimization_type=OptimizationType.MAXIMIZE, weight=0.6),
-            Criteria(id="crit2", name="Criteria 2", optimization_type=OptimizationType.MINIMIZE, weight=0.4)
-        ]
-        for crit in criteria:
-            project.add_criteria(crit)
-        
-        # Create decision matrix
-        project.create_decision_matrix(values=[[1.0, 2.0], [3.0, 4.0]])
+    @pytest.fixture(scope="module")
+    def sample_project(self, make_project):
+        """Fixture providing a sample project for testing, built once per module.
+        The service calls under test only read it."""
+        project = make_project(2, 2, weights=[0.6, 0.4], values=[[1.0, 2.0], [3.0, 4.0]],
+                               description="Test Description")
         
         # Add result
         result = Result(
@@ -159,6 +142,29 @@ class TestProjectService:
         mock_repository.get_by_id.assert_called_once_with(project_id)
         mock_repository.save.assert_called_once()
     
+    def test_duplicate_project_copies_entities(self, project_service, mock_repository):
+        """Test that a duplicate has its own entities and matrix values."""
+        original = Project(name="Original")
+        original.add_alternative(Alternative(id="alt1", name="Alternative 1"))
+        original.add_criteria(Criteria(id="crit1", name="Criteria 1", optimization_type=OptimizationType.MAXIMIZE))
+        original.set_decision_matrix(DecisionMatrix(
+            alternatives=original.alternatives,
+            criteria=original.criteria,
+            values=[[5.0]]
+        ))
+        mock_repository.get_by_id.return_value = original
+        mock_repository.save.side_effect = lambda project: project
+        
+        duplicated_project = project_service.duplicate_project(original.id)
+        duplicated_project.decision_matrix.set_values(0, 0, 7.0)
+        
+        assert duplicated_project.id != original.id
+        assert duplicated_project.name == "Copy of Original"
+        assert duplicated_project.get_criteria_by_id("crit1") is not original.get_criteria_by_id("crit1")
+        assert duplicated_project.decision_matrix.criteria[0] is duplicated_project.get_criteria_by_id("crit1")
+        assert original.decision_matrix.get_values(0, 0) == 5.0
+        assert duplicated_project.decision_matrix.get_values(0, 0) == 7.0
+    
     @patch('application.services.project_service.Workbook')
     def test_export_to_excel_success(self, mock_workbook, project_service, sample_project, tmp_path):
         """Test successful project export to Excel."""
@@ -179,6 +185,32 @@ class TestProjectService:
         mock_workbook.assert_called_once()
         mock_wb.save.assert_called_once_with(str(file_path))
     
+    def test_export_to_excel_matrix_sheet(self, project_service, tmp_path):
+        """Test that the Excel export writes the information and matrix sheets."""
+        from openpyxl import load_workbook
+        
+        project = Project(name="Excel Project")
+        project.add_alternative(Alternative(id="alt1", name="Alternative 1"))
+        project.add_alternative(Alternative(id="alt2", name="Alternative 2"))
+        project.add_criteria(Criteria(id="crit1", name="Criteria 1", optimization_type=OptimizationType.MAXIMIZE))
+        project.add_criteria(Criteria(id="crit2", name="Criteria 2", optimization_type=OptimizationType.MINIMIZE))
+        project.set_decision_matrix(DecisionMatrix(
+            alternatives=project.alternatives,
+            criteria=project.criteria,
+            values=[[1.5, 2.0], [3.0, 4.25]]
+        ))
+        file_path = tmp_path / "excel_project.xlsx"
+        
+        project_service.export_to_excel(project, str(file_path))
+        
+        wb = load_workbook(file_path)
+        assert wb.sheetnames[0] == "Project Information"
+        assert wb["Project Information"]["B2"].value == "Excel Project"
+        rows = list(wb["Decision Matrix"].iter_rows(values_only=True))
+        assert rows == [("Alternative", "Criteria 1", "Criteria 2"),
+                        ("Alternative 1", 1.5, 2.0),
+                        ("Alternative 2", 3.0, 4.25)]
+    
     def test_export_to_csv_success(self, project_service, sample_project, tmp_path):
         """Test successful project export to CSV."""
         file_path = tmp_path / "test_project.csv"
@@ -228,6 +260,32 @@ class TestProjectService:
             data = json.load(f)
         assert data['name'] == "Test Project"
     
+    def test_export_to_json_matches_to_dict(self, project_service, tmp_path, monkeypatch):
+        """Test that the streamed JSON export holds the same document as to_dict."""
+        monkeypatch.setattr(ProjectService, '_JSON_MATRIX_CHUNK_ROWS', 2)
+        project = Project(name="Stream Project", metadata={'key': 'value'})
+        for i in range(5):
+            project.add_alternative(Alternative(id=f"alt{i}", name=f"Alternative {i}"))
+        project.add_criteria(Criteria(id="crit1", name="Criteria 1", optimization_type=OptimizationType.MAXIMIZE))
+        project.set_decision_matrix(DecisionMatrix(
+            alternatives=project.alternatives,
+            criteria=project.criteria,
+            values=[[float(i)] for i in range(5)]
+        ))
+        project.add_result("TOPSIS", Result(
+            method_name="TOPSIS",
+            alternative_ids=[f"alt{i}" for i in range(5)],
+            alternative_names=[f"Alternative {i}" for i in range(5)],
+            scores=[0.1, 0.2, 0.3, 0.4, 0.5]
+        ))
+        file_path = tmp_path / "stream_project.json"
+        
+        project_service.export_to_json(project, str(file_path))
+        
+        with open(file_path, 'r') as f:
+            data = json.load(f)
+        assert data == json.loads(json.dumps(project.to_dict()))
+    
     def test_import_from_json_success(self, project_service, sample_project, tmp_path):
         """Test successful project import from JSON."""
         file_path = tmp_path / "test_project.json"
@@ -324,6 +382,44 @@ class TestProjectService:
         assert len(imported_project.alternatives) == 2
         assert len(imported_project.criteria) == 2
     
+    def test_csv_matrix_round_trip(self, project_service, tmp_path):
+        """Test that matrix values survive a CSV export and import."""
+        project = Project(name="CSV Project")
+        project.add_alternative(Alternative(id="alt1", name="Alternative, 1"))
+        project.add_alternative(Alternative(id="alt2", name="Alternative 2"))
+        project.add_criteria(Criteria(id="crit1", name="Criteria 1", optimization_type=OptimizationType.MAXIMIZE))
+        project.add_criteria(Criteria(id="crit2", name="Criteria 2", optimization_type=OptimizationType.MINIMIZE))
+        project.set_decision_matrix(DecisionMatrix(
+            alternatives=project.alternatives,
+            criteria=project.criteria,
+            values=[[1.5, 2.0], [3.0, 0.125]]
+        ))
+        file_path = tmp_path / "csv_project.csv"
+        
+        project_service.export_to_csv(project, str(file_path))
+        imported_project = project_service.import_from_csv(str(file_path))
+        
+        assert imported_project.decision_matrix is not None
+        assert imported_project.decision_matrix.values.tolist() == [[1.5, 2.0], [3.0, 0.125]]
+    
+    def test_csv_matrix_round_trip_text_names(self, project_service, tmp_path):
+        """Test that numeric-looking and NA alternative names keep their matrix rows."""
+        project = Project(name="CSV Names")
+        for alt_id, name in [("alt1", "001"), ("alt2", "002"), ("alt3", "010"), ("alt4", "NA")]:
+            project.add_alternative(Alternative(id=alt_id, name=name))
+        project.add_criteria(Criteria(id="crit1", name="Criteria 1", optimization_type=OptimizationType.MAXIMIZE))
+        project.set_decision_matrix(DecisionMatrix(
+            alternatives=project.alternatives,
+            criteria=project.criteria,
+            values=[[1.5], [2.0], [3.0], [4.0]]
+        ))
+        file_path = tmp_path / "csv_names.csv"
+        
+        project_service.export_to_csv(project, str(file_path))
+        imported_project = project_service.import_from_csv(str(file_path))
+        
+        assert imported_project.decision_matrix.values.tolist() == [[1.5], [2.0], [3.0], [4.0]]
+    
     def test_import_from_csv_missing_info_file(self, project_service, tmp_path):
         """Test import from CSV with missing info file."""
         base_path = tmp_path / "test_project.csv"
@@ -134,4 +134,26 @@ class TestAlternative:
         assert alternative.id == 'alt1'
         assert alternative.name == 'Alternativa 1'
         assert alternative.description == ''
-        assert alternative.metadata == {}
\ No newline at end of file
+        assert alternative.metadata == {}
+    
+    def test_slots(self):
+        """Prueba que la alternativa no admite atributos fuera de __slots__."""
+        alternative = Alternative(id='alt1', name='Alternativa 1')
+        
+        assert not hasattr(alternative, '__dict__')
+        with pytest.raises(AttributeError):
+            alternative.extra = 'value'
+    
+    def test_to_dict_follows_changes(self):
+        """Prueba que to_dict sigue los cambios y que modificar su resultado no lo altera."""
+        alternative = Alternative(id='alt1', name='Alternativa 1')
+        
+        first = alternative.to_dict()
+        first['name'] = 'Otro nombre'
+        assert alternative.to_dict()['name'] == 'Alternativa 1'
+        
+        alternative.name = 'Alternativa renombrada'
+        assert alternative.to_dict()['name'] == 'Alternativa renombrada'
+        
+        alternative.set_metadata('color', 'rojo')
+        assert alternative.to_dict()['metadata'] == {'color': 'rojo'}
@@ -214,4 +214,26 @@ class TestCriteria:
         assert criteria.scale_type == ScaleType.QUANTITATIVE
         assert criteria.weight == 1.0
         assert criteria.unit == ''
-        assert criteria.metadata == {}
\ No newline at end of file
+        assert criteria.metadata == {}
+    
+    def test_to_dict_follows_changes(self):
+        """Test that to_dict follows field changes and is safe to modify."""
+        criteria = Criteria(id='crit1', name='Criterio 1', weight=0.5)
+        
+        first = criteria.to_dict()
+        first['weight'] = 0.9
+        assert criteria.to_dict()['weight'] == 0.5
+        
+        criteria.weight = 0.8
+        criteria.optimization_type = OptimizationType.MINIMIZE
+        data = criteria.to_dict()
+        
+        assert data['weight'] == 0.8
+        assert data['optimization_type'] == 'minimize'
+    
+    def test_id_normalized_to_string(self):
+        """Test that numeric IDs are stored as strings."""
+        criteria = Criteria(id=7, name="Criteria 7")
+        
+        assert criteria.id == "7"
+        assert Criteria.from_dict(criteria.to_dict()).id == "7"
@@ -325,6 +325,128 @@ class TestDecisionMatrix:
         assert len(matrix_dict['criteria']) == 3
         assert matrix_dict['values'] == sample_values.tolist()
     
+    def test_to_bytes(self, sample_alternatives, sample_criteria, sample_values):
+        """Test raw buffer export of the matrix values."""
+        matrix = DecisionMatrix(
+            name="Test Matrix",
+            alternatives=sample_alternatives,
+            criteria=sample_criteria,
+            values=sample_values
+        )
+        
+        buffer = matrix.to_bytes()
+        restored = np.frombuffer(buffer, dtype=matrix.dtype).reshape(matrix.shape)
+        
+        assert np.array_equal(restored, sample_values)
+    
+    def test_values_view(self, sample_alternatives, sample_criteria, sample_values):
+        """Test that the values view shares memory and cannot be written."""
+        matrix = DecisionMatrix(
+            name="Test Matrix",
+            alternatives=sample_alternatives,
+            criteria=sample_criteria,
+            values=sample_values
+        )
+        
+        view = matrix.values_view()
+        
+        assert np.shares_memory(view, matrix._values)
+        assert not view.flags.writeable
+        assert matrix.size == sample_values.size
+        
+        matrix.set_values(0, 0, 42.0)
+        assert view[0, 0] == 42.0
+    
+    def test_copy_on_write(self, sample_alternatives, sample_criteria, sample_values):
+        """Test that a copy-on-write matrix shares values until the first write."""
+        matrix = DecisionMatrix(
+            name="Test Matrix",
+            alternatives=sample_alternatives,
+            criteria=sample_criteria,
+            values=sample_values
+        )
+        
+        clone = matrix.copy_on_write()
+        assert np.shares_memory(clone._values, matrix._values)
+        
+        clone.set_values(0, 0, 99.0)
+        matrix.set_values(1, 1, -1.0)
+        
+        assert clone.get_values(0, 0) == 99.0
+        assert clone.get_values(1, 1) == sample_values[1, 1]
+        assert matrix.get_values(0, 0) == sample_values[0, 0]
+        assert matrix.get_values(1, 1) == -1.0
+    
+    def test_set_values_bulk(self, sample_alternatives, sample_criteria, sample_values):
+        """Test writing several cells at once without touching a shared buffer."""
+        matrix = DecisionMatrix(
+            name="Test Matrix",
+            alternatives=sample_alternatives,
+            criteria=sample_criteria,
+            values=sample_values
+        )
+        clone = matrix.copy_on_write()
+        
+        changed = clone.set_values_bulk(np.array([0, 1, 0]), np.array([1, 0, 1]), np.array([5.0, 6.0, 7.0]))
+        
+        assert changed == 2
+        assert clone.get_values(0, 1) == 7.0
+        assert clone.get_values(1, 0) == 6.0
+        assert np.array_equal(matrix.values, sample_values)
+        assert clone.set_values_bulk(np.array([0]), np.array([1]), np.array([7.0])) == 0
+    
+    def test_index_lookups_after_structure_changes(self, sample_alternatives, sample_criteria, sample_values):
+        """Test that cached ID lookups follow added and removed rows and columns."""
+        matrix = DecisionMatrix(
+            name="Test Matrix",
+            alternatives=sample_alternatives,
+            criteria=sample_criteria,
+            values=sample_values
+        )
+        assert matrix.index_of_alternative("alt3") == 2
+        assert matrix.index_of_criteria("crit2") == 1
+        
+        matrix.remove_alternative(0)
+        matrix.remove_criteria(0)
+        matrix.add_alternative(Alternative(id="alt4", name="Alternative 4"))
+        
+        assert matrix.index_of_alternative("alt3") == 1
+        assert matrix.index_of_alternative("alt4") == 2
+        assert matrix.index_of_criteria("crit2") == 0
+        with pytest.raises(ValueError):
+            matrix.index_of_alternative("alt1")
+        with pytest.raises(ValueError):
+            matrix.index_of_criteria("crit1")
+    
+    def test_criteria_arrays_follow_changes(self, sample_alternatives, sample_criteria, sample_values):
+        """Test that the cached weights and maximize mask are rebuilt after edits."""
+        matrix = DecisionMatrix(
+            name="Test Matrix",
+            alternatives=sample_alternatives,
+            criteria=sample_criteria,
+            values=sample_values
+        )
+        np.testing.assert_array_equal(matrix.weights_array, [1.0, 1.0, 1.0])
+        np.testing.assert_array_equal(matrix.maximize_mask, [True, False, True])
+        assert matrix.weights_array is matrix.weights_array
+        assert not matrix.weights_array.flags.writeable
+        
+        # Edits to criteria of other matrices keep this one's arrays
+        weights = matrix.weights_array
+        Criteria(id="other", name="Other").weight = 2.0
+        assert matrix.weights_array is weights
+        
+        sample_criteria[0].weight = 3.0
+        sample_criteria[1].optimization_type = OptimizationType.MAXIMIZE
+        np.testing.assert_array_equal(matrix.weights_array, [3.0, 1.0, 1.0])
+        np.testing.assert_array_equal(matrix.maximize_mask, [True, True, True])
+        
+        matrix.remove_criteria(2)
+        matrix.add_criteria(Criteria(id="crit4", name="Criteria 4", weight=0.5,
+                                     optimization_type=OptimizationType.MINIMIZE))
+        np.testing.assert_array_equal(matrix.weights_array, [3.0, 1.0, 0.5])
+        np.testing.assert_array_equal(matrix.maximize_mask, [True, True, False])
+    
     def test_from_dict(self):
         """Test creation from dictionary."""
         data = {
@@ -92,6 +92,26 @@ class TestProject:
         project.decision_maker = "New User"
         assert project.decision_maker == "New User"
     
+    def test_iso_timestamps(self):
+        """Test that ISO timestamps are cached and follow updated_at."""
+        project = Project(name="Test Project")
+        
+        assert project.iso_created_at == project.created_at.isoformat()
+        assert project.iso_updated_at is project.iso_updated_at
+        
+        project._updated_at = datetime(2024, 1, 2, 3, 4, 5)
+        assert project.iso_updated_at == "2024-01-02T03:04:05"
+    
+    def test_iso_timestamps_from_dict(self):
+        """Test that loaded projects reuse the stored ISO strings."""
+        stored = Project(name="Test Project").to_dict()
+        
+        project = Project.from_dict(stored)
+        
+        assert project.iso_created_at is stored['created_at']
+        assert project.iso_updated_at is stored['updated_at']
+        assert project.iso_updated_at == project.updated_at.isoformat()
+    
     def test_add_alternative(self, sample_alternatives):
         """Test adding alternatives to the project."""
         project = Project(name="Test Project")
@@ -180,6 +200,23 @@ class TestProject:
         assert criteria.id == "crit1"
         assert criteria.name == "Criteria 1"
     
+    def test_lookup_index_follows_add_and_remove(self, sample_alternatives, sample_criteria):
+        """Test that ID lookups reflect removals and re-additions."""
+        project = Project(name="Test Project")
+        project.add_alternative(sample_alternatives[0])
+        project.add_criteria(sample_criteria[0])
+        
+        project.remove_alternative("alt1")
+        project.remove_criteria("crit1")
+        
+        with pytest.raises(ValueError, match="No alternative were found with the ID: alt1"):
+            project.get_alternative_by_id("alt1")
+        with pytest.raises(ValueError, match="No criteria were found with the ID: crit1"):
+            project.get_criteria_by_id("crit1")
+        
+        project.add_alternative(sample_alternatives[0])
+        assert project.get_alternative_by_id("alt1") is sample_alternatives[0]
+    
     def test_create_decision_matrix(self, sample_alternatives, sample_criteria):
         """Test creating decision matrix."""
         project = Project(name="Test Project")
@@ -312,6 +349,8 @@ class TestProject:
         assert project.description == 'Test Description'
         assert len(project.alternatives) == 1
         assert len(project.criteria) == 1
+        assert project.get_alternative_by_id('alt1').name == 'Alternative 1'
+        assert project.get_criteria_by_id('crit1').name == 'Criteria 1'
         assert project.metadata == {'key': 'value'}
     
     def test_str_representation(self, sample_alternatives, sample_criteria):
@@ -243,6 +243,24 @@ class TestResult:
         assert result_dict['rankings'] == [2, 3, 1, 4]
         assert 'created_at' in result_dict
     
+    def test_to_dict_array_metadata(self, sample_data):
+        """Test that array metadata is converted to lists unless numpy_arrays is set."""
+        matrix = np.eye(2)
+        result = Result(
+            method_name=sample_data['method_name'],
+            alternative_ids=sample_data['alternative_ids'],
+            alternative_names=sample_data['alternative_names'],
+            scores=sample_data['scores'],
+            metadata={'matrix': matrix, 'details': 'test metadata'}
+        )
+        
+        result_dict = result.to_dict()
+        assert result_dict['metadata'] == {'matrix': [[1.0, 0.0], [0.0, 1.0]],
+                                           'details': 'test metadata'}
+        
+        native_dict = result.to_dict(numpy_arrays=True)
+        assert native_dict['metadata']['matrix'] is matrix
+    
     def test_from_dict(self):
         """Test creation from dictionary."""
         data = {
@@ -13,7 +13,7 @@ from domain.entities.result import Result
 from domain.repositories.project_repository import ProjectRepository
 from application.services.project_service import ProjectService
 from application.services.decision_service import DecisionService
-from utils.exceptions import ServiceError
+from utils.exceptions import ControllerError, ServiceError
 
 class TestMainController:
     
@@ -92,6 +92,18 @@ class TestMainController:
             decision_maker="Test User"
         )
     
+    def test_reset(self, main_controller, mock_project_service, sample_project):
+        """Test that reset clears the current project but keeps the services."""
+        mock_project_service.get_project.return_value = sample_project
+        main_controller.load_project(sample_project.id)
+        
+        main_controller.reset()
+        
+        assert main_controller.current_project is None
+        assert main_controller._project_service is mock_project_service
+        with pytest.raises(ValueError, match="There is no current project to save"):
+            main_controller.save_project()
+    
     def test_save_project_no_current_project(self, main_controller):
         """Test saving project when no current project exists."""
         main_controller._current_project = None
@@ -122,7 +134,11 @@ class TestMainController:
     
     def test_get_all_projects(self, main_controller, mock_project_service, sample_project):
         """Test getting all projects."""
-        mock_project_service.get_all_projects.return_value = [sample_project]
+        mock_project_service.get_all_project_summaries.return_value = [(
+            sample_project.id, sample_project.name, sample_project.description,
+            sample_project.decision_maker, sample_project.created_at.isoformat(),
+            sample_project.updated_at.isoformat(), 2, 2, 0
+        )]
         
         projects = main_controller.get_all_projects()
         
@@ -130,7 +146,19 @@ class TestMainController:
         assert projects[0]['name'] == "Test Project"
         assert projects[0]['n_alternatives'] == 2
         assert projects[0]['n_criteria'] == 2
-    
+
+    def test_search_projects_reflects_changes(self, main_controller, mock_project_service, sample_project):
+        """Test that project summaries follow changes to the project."""
+        mock_project_service.search_projects.return_value = [sample_project]
+
+        first = main_controller.search_projects("Test")
+        sample_project.name = "Renamed Project"
+        second = main_controller.search_projects("Test")
+
+        assert first[0]['name'] == "Test Project"
+        assert second[0]['name'] == "Renamed Project"
+        assert second[0]['n_alternatives'] == len(sample_project.alternatives)
+
     def test_delete_project(self, main_controller, mock_project_service, sample_project):
         """Test deleting a project."""
         project_id = str(uuid4())
@@ -323,4 +351,285 @@ class TestMainController:
         assert formatted['best_alternative']['score'] == 0.7
         assert len(formatted['alternatives']) == 2
         assert formatted['rankings'] == sample_result.rankings.tolist()
-        assert formatted['scores'] == sample_result.scores.tolist()
\ No newline at end of file
+        assert formatted['scores'] == sample_result.scores.tolist()
+    
+    def test_format_results_shared_sort(self, main_controller, sample_result):
+        """Test that batch formatting keeps the per-result alternative order."""
+        other_result = Result(
+            method_name="AHP",
+            alternative_ids=["alt1", "alt2"],
+            alternative_names=["Alternative 1", "Alternative 2"],
+            scores=np.array([0.2, 0.8])
+        )
+        
+        formatted = main_controller._format_results({"TOPSIS": sample_result, "AHP": other_result})
+        
+        assert formatted["TOPSIS"]['alternatives'] == sample_result.get_sorted_alternatives()
+        assert formatted["AHP"]['alternatives'] == other_result.get_sorted_alternatives()
+        assert formatted["AHP"]['best_alternative']['id'] == "alt2"
+    
+    def test_format_results_reuses_cached_views(self, main_controller, sample_result):
+        """Test that batch formatting fills and reuses the per-result cache."""
+        other_result = Result(
+            method_name="AHP",
+            alternative_ids=["alt1", "alt2"],
+            alternative_names=["Alternative 1", "Alternative 2"],
+            scores=np.array([0.2, 0.8])
+        )
+        single = main_controller._format_result(sample_result)
+        
+        formatted = main_controller._format_results({"AHP": other_result, "TOPSIS": sample_result})
+        
+        assert list(formatted) == ["AHP", "TOPSIS"]
+        assert formatted["TOPSIS"] == single
+        cached = other_result.get_formatted_view()
+        assert cached is not None
+        assert main_controller._format_result(other_result) == formatted["AHP"]
+        assert other_result.get_formatted_view() is cached
+        assert main_controller._format_results({"AHP": other_result}, 'summary')["AHP"]['best_alternative'] == {
+            'id': "alt2", 'name': "Alternative 2", 'score': 0.8
+        }
+    
+    def test_get_available_methods_cached(self, main_controller, mock_decision_service):
+        """Test that method metadata is built once until refresh_methods is called."""
+        mock_decision_service.get_method_info.side_effect = lambda name: {'name': name}
+        
+        first = main_controller.get_available_methods()
+        second = main_controller.get_available_methods()
+        
+        assert first == second
+        assert [info['name'] for info in first] == ['TOPSIS', 'AHP', 'ELECTRE', 'PROMETHEE']
+        assert mock_decision_service.get_available_methods.call_count == 1
+        assert mock_decision_service.get_method_info.call_count == 4
+        
+        main_controller.refresh_methods()
+        main_controller.get_available_methods()
+        
+        assert mock_decision_service.get_available_methods.call_count == 2
+    
+    def test_get_available_methods_rebuilt_after_registration(self, main_controller, mock_decision_service):
+        """Test that method metadata is rebuilt when the method registry changes."""
+        mock_decision_service.get_method_info.side_effect = lambda name: {'name': name}
+        mock_decision_service.methods_version = 0
+        
+        main_controller.get_available_methods()
+        main_controller.get_available_methods()
+        assert mock_decision_service.get_available_methods.call_count == 1
+        
+        mock_decision_service.methods_version = 1
+        main_controller.get_available_methods()
+        main_controller.get_available_methods()
+        assert mock_decision_service.get_available_methods.call_count == 2
+    
+    def test_get_all_results_summary(self, main_controller, sample_project, sample_result):
+        """Test that summary detail only returns the best alternative per method."""
+        sample_project.add_result("TOPSIS", sample_result)
+        main_controller._current_project = sample_project
+        
+        summary = main_controller.get_all_results(detail='summary')
+        
+        assert set(summary["TOPSIS"]) == {'method_name', 'best_alternative', 'execution_time'}
+        assert summary["TOPSIS"]['best_alternative'] == {'id': "alt1", 'name': "Alternative 1", 'score': 0.7}
+        
+        with pytest.raises(ValueError, match="Invalid detail level"):
+            main_controller.get_all_results(detail='brief')
+    
+    def test_import_project_format_dispatch(self, main_controller, mock_project_service, sample_project):
+        """Test format inference from the extension and unsupported formats."""
+        mock_project_service.import_from_excel.return_value = sample_project
+        
+        assert main_controller.import_project('test.XLS') == sample_project
+        mock_project_service.import_from_excel.assert_called_once_with('test.XLS')
+        
+        with pytest.raises(ValueError, match="Cannot infer the format from the extension: .txt"):
+            main_controller.import_project('test.txt')
+        with pytest.raises(ValueError, match="Importation format not supported: pdf"):
+            main_controller.import_project('test.pdf', 'pdf')
+        
+        main_controller._current_project = sample_project
+        with pytest.raises(ValueError, match="Export format not supported: xml"):
+            main_controller.export_project('test.xml', 'XML')
+    
+    def test_format_result_lazy_alternatives(self, main_controller, sample_result):
+        """Test that the alternatives listing is only built when read in full."""
+        formatted = main_controller._format_result(sample_result)
+        alternatives = formatted['alternatives']
+        
+        assert alternatives._items is None
+        assert alternatives[:1] == [{'id': "alt1", 'name': "Alternative 1", 'score': 0.7, 'ranking': 1}]
+        assert alternatives._items is None
+        
+        assert list(alternatives) == sample_result.get_sorted_alternatives()
+        assert alternatives._items is not None
+    
+    def test_format_result_cached(self, main_controller, sample_result):
+        """Test that the full view of a result is reused until the result changes."""
+        first = main_controller._format_result(sample_result)
+        cached = sample_result.get_formatted_view()
+        first['matrix_info'] = {'alternatives': 2}
+        first['best_alternative']['score'] = 0.0
+        first['scores'].append(1.0)
+        first['alternatives'][0]['name'] = "Changed"
+        second = main_controller._format_result(sample_result)
+        
+        assert sample_result.get_formatted_view() is cached
+        assert 'matrix_info' not in second
+        assert second['best_alternative']['score'] == 0.7
+        assert second['scores'] == [0.7, 0.5]
+        assert second['alternatives'][0]['name'] == "Alternative 1"
+        
+        sample_result.set_metadata('execution_errors', ['AHP: failed'])
+        third = main_controller._format_result(sample_result)
+        
+        assert third['metadata'] == {'execution_errors': ['AHP: failed']}
+        assert main_controller._format_result(sample_result, detail='summary')['method_name'] == "TOPSIS"
+    
+    def test_requires_project(self, main_controller):
+        """Test that project-bound operations fail without a current project."""
+        main_controller._current_project = None
+        
+        with pytest.raises(ValueError, match="There is no current project"):
+            main_controller.set_matrix_value("alt1", "crit1", 1.0)
+        with pytest.raises(ValueError, match="There is no current project"):
+            main_controller.get_all_results(detail='summary')
+        assert main_controller.set_matrix_value.__name__ == 'set_matrix_value'
+    
+    def test_set_matrix_values(self, main_controller, sample_project):
+        """Test setting several matrix cells in one call."""
+        sample_project.create_decision_matrix()
+        main_controller._current_project = sample_project
+        
+        written = main_controller.set_matrix_values([
+            ("alt1", "crit1", 1.0),
+            ("alt2", "crit2", 4.0),
+            ("alt1", "crit2", 2.0)
+        ])
+        
+        assert written == 3
+        assert sample_project.decision_matrix.values.tolist() == [[1.0, 2.0], [0.0, 4.0]]
+        assert main_controller.set_matrix_values([("alt1", "crit1", 1.0), ("alt2", "crit2", 4.0)]) == 0
+        
+        with pytest.raises(ControllerError, match="Alternative alt9 or criteria crit1 not found") as exc_info:
+            main_controller.set_matrix_values([("alt1", "crit1", 5.0), ("alt9", "crit1", 5.0)])
+        assert exc_info.value.code == "alternative_not_found"
+        assert sample_project.decision_matrix.get_values(0, 0) == 1.0
+        
+        with pytest.raises(ControllerError) as exc_info:
+            main_controller.set_matrix_value("alt1", "crit9", 5.0)
+        assert exc_info.value.code == "criteria_not_found"
+        
+        assert main_controller.set_matrix_values([("alt9", "crit1", 5.0), ("alt2", "crit1", 3.0)],
+                                                 ignore_missing=True) == 1
+        assert sample_project.decision_matrix.get_values(1, 0) == 3.0
+    
+    def test_get_all_alternatives_cached_until_change(self, main_controller, sample_project):
+        """Test that entity listings are reused until alternatives change."""
+        main_controller._current_project = sample_project
+        
+        first = main_controller.get_all_alternatives()
+        second = main_controller.get_all_alternatives()
+        assert first == second
+        assert first[0] is second[0]
+        
+        sample_project.add_alternative(Alternative(id="alt3", name="Alternative 3"))
+        third = main_controller.get_all_alternatives()
+        
+        assert [alt['id'] for alt in third] == ["alt1", "alt2", "alt3"]
+        assert [crit['id'] for crit in main_controller.get_all_criteria()] == ["crit1", "crit2"]
+    
+    def test_get_decision_matrix_data(self, main_controller, sample_project):
+        """Test that matrix values are returned as rows aligned with the alternative and criteria IDs."""
+        sample_project.create_decision_matrix()
+        main_controller._current_project = sample_project
+        main_controller.set_matrix_values([("alt1", "crit1", 1.5), ("alt2", "crit2", 1e-05)])
+        
+        decision_matrix = main_controller.get_decision_matrix()
+        
+        assert 'matrix_data' not in decision_matrix
+        assert decision_matrix['alt_ids'] == ["alt1", "alt2"]
+        assert decision_matrix['crit_ids'] == ["crit1", "crit2"]
+        assert decision_matrix['matrix_values'] == [[1.5, 0.0], [0.0, 1e-05]]
+    
+    def test_save_decision_matrix_key_formats(self, main_controller, mock_project_service, sample_project):
+        """Test saving matrix values sent with both supported key formats."""
+        main_controller._current_project = sample_project
+        mock_project_service.save_project.return_value = sample_project
+        
+        assert main_controller.save_decision_matrix({'values': {
+            "alt1_crit1": "2.5",
+            "alt_alt2_crit_crit2": "4",
+            "alt2_crit1": "",
+            "alt1_crit2_extra": "9",
+            "nounderscore": "9"
+        }})
+        
+        assert sample_project.decision_matrix.values.tolist() == [[2.5, 0.0], [0.0, 4.0]]
+    
+    def test_save_decision_matrix_ids_with_underscores(self, main_controller, mock_project_service):
+        """Test that matrix keys are split on known IDs containing underscores."""
+        project = Project(name="Underscore Project")
+        project.add_alternative(Alternative(id="alt_a", name="Alternative A"))
+        project.add_alternative(Alternative(id="b", name="Alternative B"))
+        project.add_criteria(Criteria(id="cost_total", name="Cost"))
+        main_controller._current_project = project
+        mock_project_service.save_project.return_value = project
+        
+        assert main_controller.save_decision_matrix({
+            "alt_a_cost_total": "3",
+            "alt_b_crit_cost_total": "5",
+            "alt_c_cost_total": "9"
+        })
+        
+        assert project.decision_matrix.values.tolist() == [[3.0], [5.0]]
+    
+    def test_save_decision_matrix_logs_errors(self, main_controller, mock_project_service, sample_project, caplog):
+        """Test that a failed matrix save is logged with its traceback and returns False."""
+        main_controller._current_project = sample_project
+        mock_project_service.save_project.side_effect = ServiceError(message="disk full", service_name="ProjectService")
+        
+        with caplog.at_level("ERROR", logger="presentation.controllers.main_controller"):
+            assert main_controller.save_decision_matrix({"alt1_crit1": "1"}) is False
+        
+        assert "Error saving decision matrix" in caplog.text
+        assert caplog.records[-1].exc_info is not None
+    
+    def test_save_decision_matrix_value_types(self, main_controller, mock_project_service, sample_project):
+        """Test that numeric, textual and empty matrix values are converted to floats."""
+        main_controller._current_project = sample_project
+        mock_project_service.save_project.return_value = sample_project
+        
+        assert main_controller.save_decision_matrix({
+            "alt1_crit1": 3,
+            "alt1_crit2": " 2.5 ",
+            "alt2_crit1": None,
+            "alt2_crit2": "n/a"
+        })
+        
+        assert sample_project.decision_matrix.values.tolist() == [[3.0, 2.5], [0.0, 0.0]]
+    
+    def test_get_alternative_not_found_code(self, main_controller, sample_project):
+        """Test that a missing alternative raises a coded error chained to its cause."""
+        main_controller._current_project = sample_project
+        
+        with pytest.raises(ControllerError, match="Alternative not found") as exc_info:
+            main_controller.get_alternative("alt9")
+        
+        assert exc_info.value.code == "alternative_not_found"
+        assert isinstance(exc_info.value.__cause__, ValueError)
+    
+    def test_save_decision_matrix_skips_unchanged_write(self, main_controller, mock_project_service, sample_project):
+        """Test that saving unchanged matrix values does not write the project again."""
+        sample_project.create_decision_matrix()
+        mock_project_service.get_project.return_value = sample_project
+        mock_project_service.save_project.return_value = sample_project
+        main_controller.load_project(sample_project.id)
+        
+        assert main_controller.save_decision_matrix({"alt1_crit1": "", "alt2_crit2": 0})
+        assert mock_project_service.save_project.call_count == 0
+        
+        assert main_controller.save_decision_matrix({"alt1_crit1": "2"})
+        assert main_controller.save_decision_matrix({"alt1_crit1": "2"})
+        assert mock_project_service.save_project.call_count == 1
+        
+        assert main_controller.save_decision_matrix({"alt1_crit1": "2"}, {"crit1": {"type": "numeric"}})
+        assert mock_project_service.save_project.call_count == 2
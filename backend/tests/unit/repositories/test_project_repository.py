@@ -3,6 +3,7 @@ import os
 import json
 import tempfile
 import shutil
+import numpy as np
 from datetime import datetime
 from uuid import uuid4
 
@@ -10,6 +11,7 @@ from infrastructure.persistence.file_project_repository import FileProjectReposi
 from domain.entities.project import Project
 from domain.entities.alternative import Alternative
 from domain.entities.criteria import Criteria, OptimizationType
+from domain.entities.result import Result
 from utils.exceptions import RepositoryError
 
 class TestFileProjectRepository:
@@ -103,6 +105,27 @@ class TestFileProjectRepository:
         assert len(retrieved_project.alternatives) == 2
         assert len(retrieved_project.criteria) == 2
     
+    def test_save_and_load_matrix_and_results(self, repository, sample_project):
+        """Test that matrix values and result arrays survive a save/load round trip."""
+        sample_project.create_decision_matrix()
+        matrix = sample_project.decision_matrix
+        matrix.set_values(0, 0, 1.5)
+        matrix.set_values(1, 1, 2.25)
+        sample_project.add_result("TOPSIS", Result(
+            method_name="TOPSIS",
+            alternative_ids=["alt1", "alt2"],
+            alternative_names=["Alternative 1", "Alternative 2"],
+            scores=np.array([0.25, 0.75])
+        ))
+        repository.save(sample_project)
+        
+        retrieved_project = repository.get_by_id(sample_project.id)
+        
+        np.testing.assert_array_equal(retrieved_project.decision_matrix.values, matrix.values)
+        result = retrieved_project.get_result("TOPSIS")
+        np.testing.assert_array_equal(result.scores, [0.25, 0.75])
+        np.testing.assert_array_equal(result.rankings, [2, 1])
+    
     def test_get_by_id_not_found(self, repository):
         """Test retrieving a non-existent project."""
         non_existent_id = str(uuid4())
@@ -145,6 +168,20 @@ class TestFileProjectRepository:
         assert "Project 2" in project_names
         assert "Project 3" in project_names
     
+    def test_list_summaries(self, repository, sample_project):
+        """Test listing project summaries without loading full projects."""
+        repository.save(sample_project)
+        
+        summaries = repository.list_summaries()
+        
+        assert len(summaries) == 1
+        project_id, name, description, decision_maker, created_at, updated_at, n_alt, n_crit, n_res = summaries[0]
+        assert project_id == sample_project.id
+        assert name == "Test Project"
+        assert decision_maker == "Test User"
+        assert created_at == sample_project.created_at.isoformat()
+        assert (n_alt, n_crit, n_res) == (2, 2, 0)
+    
     def test_get_all_empty_directory(self, repository):
         """Test get_all when directory is empty."""
         projects = repository.get_all()
@@ -3,7 +3,8 @@
 import pytest
 from utils.exceptions import (
     MCDMBaseException, ValidationError, RepositoryError,
-    MethodError, NormalizationError, ImportExportError, ServiceError
+    MethodError, NormalizationError, ImportExportError, ServiceError,
+    ControllerError
 )
 
 class TestExceptions:
@@ -51,6 +52,11 @@ class TestExceptions:
         # Sin nombre de método
         exception = MethodError("Calculation error")
         assert str(exception) == "Calculation error"
+        assert exception.code == "method_error"
+        
+        # Con código
+        exception = MethodError("Empty decision matrix", "AHP", code="no_decision_matrix")
+        assert exception.code == "no_decision_matrix"
     
     def test_normalization_error(self):
         """Prueba NormalizationError."""
@@ -77,4 +83,15 @@ class TestExceptions:
         
         # Sin nombre de servicio
         exception = ServiceError("Operation failed")
-        assert str(exception) == "Operation failed"
\ No newline at end of file
+        assert str(exception) == "Operation failed"
+    
+    def test_controller_error(self):
+        """Prueba ControllerError."""
+        exception = ControllerError("Alternative not found", "alternative_not_found")
+        assert str(exception) == "Alternative not found"
+        assert exception.code == "alternative_not_found"
+        assert isinstance(exception, ValueError)
+        
+        # Sin código
+        exception = ControllerError("Operation failed")
+        assert exception.code == "controller_error"
@@ -53,7 +53,7 @@ class TestNormalization:
         
         # Verificar que la suma de cada columna es aproximadamente 1
         for j in range(normalized.shape[1]):
-            assert np.isclose(np.sum(normalized[:, j]), 1.0)
+            assert normalized[:, j].sum() == pytest.approx(1.0, rel=1e-9)
     
     def test_normalize_max(self, sample_values, mixed_criteria):
         """Prueba la normalización por máximo."""
@@ -0,0 +1,22 @@
+import numpy as np
+from utils.ranking import rank_desc
+
+class TestRanking:
+    
+    def test_rank_desc(self):
+        """Prueba el ranking descendente sin empates."""
+        rankings = rank_desc(np.array([0.2, 0.9, 0.5, 0.1]))
+        
+        np.testing.assert_array_equal(rankings, [3, 1, 2, 4])
+        assert np.issubdtype(rankings.dtype, np.integer)
+    
+    def test_rank_desc_ties(self):
+        """Los empates comparten el mejor ranking y saltan los siguientes."""
+        rankings = rank_desc(np.array([0.5, 0.9, 0.5, 0.1, 0.9]))
+        
+        np.testing.assert_array_equal(rankings, [3, 1, 3, 5, 1])
+    
+    def test_rank_desc_single_and_empty(self):
+        """Prueba los casos de una sola puntuación y sin puntuaciones."""
+        np.testing.assert_array_equal(rank_desc(np.array([0.3])), [1])
+        assert len(rank_desc(np.array([]))) == 0
@@ -27,8 +27,10 @@ class RepositoryError(MCDMBaseException):
 
 
 class MethodError(MCDMBaseException):
-    def __init__(self, message: str = "Error in MCDM method", method_name: str = None):
+    def __init__(self, message: str = "Error in MCDM method", method_name: str = None,
+                 code: str = "method_error"):
         self.method_name = method_name
+        self.code = code
         msg = f"{message} in method '{method_name}'" if method_name else message
         super().__init__(msg)
 
@@ -51,4 +53,10 @@ class ServiceError(MCDMBaseException):
     def __init__(self, message: str = "Error in service", service_name: str = None):
         self.service_name = service_name
         msg = f"{message} in service '{service_name}'" if service_name else message
-        super().__init__(msg)
\ No newline at end of file
+        super().__init__(msg)
+
+class ControllerError(MCDMBaseException, ValueError):
+    # Also a ValueError, which is what controller callers have always caught
+    def __init__(self, message: str = "Error in controller", code: str = "controller_error"):
+        self.code = code
+        super().__init__(message)
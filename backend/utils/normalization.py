@@ -25,43 +25,36 @@ def normalize_matrix(matrix: np.ndarray, method: str = 'vector',
     if np.any(np.isinf(matrix)):
         raise ValueError("Matrix contains infinite values")
     
-    normalized = matrix.copy().astype(float)
+    # float32 input stays float32; integers and float64 are computed in float64
+    normalized = matrix.astype(np.result_type(matrix.dtype, np.float32))
     
+    # Each method works on whole columns at once; columns it cannot scale
+    # (zero norm, constant, non-positive max) get the same fill values as before
     if method == 'vector':
         # Vector normalization
-        for j in range(matrix.shape[1]):
-            column_sum_sq = np.sum(matrix[:, j] ** 2)
-            if column_sum_sq > 0:
-                normalized[:, j] = matrix[:, j] / np.sqrt(column_sum_sq)
-            else:
-                # Si toda la columna es cero, mantenerla como cero
-                normalized[:, j] = 0.0
+        column_norms = np.sqrt(np.sum(normalized ** 2, axis=0))
+        normalized = np.divide(normalized, column_norms, out=np.zeros_like(normalized),
+                               where=column_norms > 0)
                 
     elif method == 'minmax':
         # Min-Max normalization
-        for j in range(matrix.shape[1]):
-            min_val = np.min(matrix[:, j])
-            max_val = np.max(matrix[:, j])
-            
-            if max_val > min_val:
-                if criteria_types and criteria_types[j] == 'minimize':
-                    # Para criterios de minimización
-                    normalized[:, j] = (max_val - matrix[:, j]) / (max_val - min_val)
-                else:
-                    # Para criterios de maximización
-                    normalized[:, j] = (matrix[:, j] - min_val) / (max_val - min_val)
-            else:
-                # Si todos los valores son iguales
-                normalized[:, j] = 1.0
+        min_vals = np.min(normalized, axis=0)
+        max_vals = np.max(normalized, axis=0)
+        spread = max_vals - min_vals
+        
+        minimize = np.array([bool(criteria_types) and criteria_types[j] == 'minimize'
+                             for j in range(matrix.shape[1])], dtype=bool)
+        # (max - x) for minimization criteria, (x - min) for maximization
+        distances = np.where(minimize, max_vals - normalized, normalized - min_vals)
+        # Si todos los valores son iguales, la columna queda en 1
+        normalized = np.divide(distances, spread, out=np.ones_like(normalized),
+                               where=max_vals > min_vals)
                 
     elif method == 'linear':
         # Linear normalization
-        for j in range(matrix.shape[1]):
-            max_val = np.max(matrix[:, j])
-            if max_val > 0:
-                normalized[:, j] = matrix[:, j] / max_val
-            else:
-                normalized[:, j] = 0.0
+        max_vals = np.max(normalized, axis=0)
+        normalized = np.divide(normalized, max_vals, out=np.zeros_like(normalized),
+                               where=max_vals > 0)
     
     else:
         raise ValueError(f"Unknown normalization method: {method}")
@@ -0,0 +1,21 @@
+"""
+    Module that gives functions for ranking alternatives from their scores
+
+    Rankings are 1-based and follow the MCDM convention that a higher score
+    is better
+"""
+
+import numpy as np
+
+
+def rank_desc(scores: np.ndarray) -> np.ndarray:
+    """
+    Rank scores in descending order, tied scores sharing the best rank (1, 2, 2, 4)
+    """
+    scores = np.asarray(scores, dtype=float)
+
+    # The rank of a score is 1 + the number of scores strictly greater than it
+    ascending = np.sort(scores)
+    greater = len(scores) - np.searchsorted(ascending, scores, side='right')
+
+    return (greater + 1).astype(int)
@@ -156,6 +156,14 @@ class ProjectController:
                     'criteria_config': {}
                 }
             
+            # La API envía los valores como filas; las pestañas usan claves "alt_crit"
+            if 'matrix_values' in matrix_data:
+                matrix_data['matrix_data'] = {
+                    f"{alt_id}_{crit_id}": value
+                    for alt_id, row in zip(matrix_data.get('alt_ids', []), matrix_data['matrix_values'])
+                    for crit_id, value in zip(matrix_data.get('crit_ids', []), row)
+                }
+            
             # Asegurar que todos los campos existen
             matrix_data.setdefault('alternatives', self.get_alternatives())
             matrix_data.setdefault('criteria', self.get_criteria())